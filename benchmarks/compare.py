@@ -0,0 +1,78 @@
+"""Compare two pytest-benchmark JSON results and report the benchmarks that regressed.
+
+Usage:
+    python -m benchmarks.compare BASELINE RESULT [--threshold PERCENT] [--stat STAT]
+
+Exits with status 1 if any benchmark got slower than the threshold, so it can gate changes.
+"""
+
+import argparse
+import json
+import sys
+
+
+def load_stats(path, stat):
+    """Return the given statistic (s) of each benchmark of a pytest-benchmark JSON file."""
+    with open(path) as json_file:
+        results = json.load(json_file)
+    return {
+        benchmark["fullname"]: benchmark["stats"][stat]
+        for benchmark in results["benchmarks"]
+    }
+
+
+def compare(baseline, result, threshold):
+    """Return the (name, baseline, result, change %, regressed) rows of two results."""
+    rows = []
+    for name in sorted(baseline.keys() & result.keys()):
+        change = (result[name] - baseline[name]) / baseline[name] * 100
+        rows.append((name, baseline[name], result[name], change, change > threshold))
+    return rows
+
+
+def main(argv=None):
+    """Print the comparison of two results and return the exit status."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline", help="JSON file saved with --benchmark-json")
+    parser.add_argument("result", help="JSON file saved with --benchmark-json")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10,
+        help="slowdown in percent above which a benchmark regressed (default: 10)",
+    )
+    parser.add_argument(
+        "--stat",
+        default="median",
+        choices=["min", "max", "mean", "median"],
+        help="statistic compared (default: median)",
+    )
+    args = parser.parse_args(argv)
+
+    baseline = load_stats(args.baseline, args.stat)
+    result = load_stats(args.result, args.stat)
+    rows = compare(baseline, result, args.threshold)
+
+    width = max((len(row[0]) for row in rows), default=0)
+    print(
+        f"{'benchmark':<{width}}  {'baseline ms':>12}  {'result ms':>12}  {'change':>8}"
+    )
+    for name, before, after, change, regressed in rows:
+        flag = "  REGRESSION" if regressed else ""
+        print(
+            f"{name:<{width}}  {before * 1e3:12.3f}  {after * 1e3:12.3f}  {change:+7.1f}%{flag}"
+        )
+    for name in sorted(baseline.keys() ^ result.keys()):
+        print(f"{name}: only in {'baseline' if name in baseline else 'result'}")
+
+    regressions = [row for row in rows if row[4]]
+    if regressions:
+        print(
+            f"{len(regressions)} benchmark(s) regressed by more than {args.threshold}%"
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
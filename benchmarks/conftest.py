@@ -0,0 +1,39 @@
+"""Module containing the fixtures of the benchmarks of the game hot paths."""
+
+import os
+
+import pytest
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+from main import Game  # noqa: E402
+from src.game_clock import game_clock  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def game():
+    """Fixture returning a headless game shared by all benchmarks."""
+    game = Game(headless=True, seed=0)
+    yield game
+    game.quit()
+    game_clock.stop_simulation()
+
+
+@pytest.fixture
+def cave_level(game):
+    """Fixture returning the level of the game with the entry cave loaded."""
+    level = game.level
+    level.cmd_line.previous_map_state = level.cmd_line.map_state = "entry_cave"
+    level.load_map(level.entry_cave_path, level.entry_cave_layouts)
+    return level
+
+
+@pytest.fixture
+def valley_level(game):
+    """Fixture returning the level of the game with the valley loaded."""
+    level = game.level
+    level.cmd_line.previous_map_state = "entry_cave"
+    level.cmd_line.map_state = "valley"
+    level.load_map(level.valley_path, level.valley_layouts, level.valley_graphics)
+    return level
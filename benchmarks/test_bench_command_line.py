@@ -0,0 +1,123 @@
+"""Module containing the benchmarks of the command line."""
+
+from itertools import cycle
+
+import pygame
+import pytest
+
+from src.cl_text_input import Input
+from src.command_line import CL
+from src.commands import cmd_dict
+
+
+@pytest.fixture
+def long_history(game):
+    """Fixture filling the command line history with a thousand lines."""
+    cmd_line = game.cmd_line
+    history = list(cmd_line.history)
+    cmd_line.history.extend(f"> look at wall {i}" for i in range(1000))
+    yield cmd_line
+    cmd_line.history.clear()
+    cmd_line.history.extend(history)
+
+
+def draw_history(cmd_line):
+    """Draw the whole command line history, as if it changed."""
+    cmd_line.redraw()
+    cmd_line.draw_history()
+
+
+def test_draw_history(benchmark, long_history):
+    """Benchmark drawing the command line history."""
+    benchmark(draw_history, long_history)
+
+
+def test_draw_history_full_screen(benchmark, long_history):
+    """Benchmark drawing the command line history in full screen mode."""
+    long_history.maximize()
+    benchmark(draw_history, long_history)
+    long_history.minimize()
+
+
+def test_scroll_history_full_screen(benchmark, long_history):
+    """Benchmark drawing the command line history while scrolling it in full screen mode."""
+    long_history.maximize()
+    scroll_ids = cycle(range(0, -100, -1))
+
+    def scroll():
+        long_history._scroll_id = next(scroll_ids)
+        long_history.draw_history()
+
+    benchmark(scroll)
+    long_history.minimize()
+
+
+def test_recover_old_command(benchmark, long_history):
+    """Benchmark recalling an old command with the up key."""
+    long_history.input.focus = True
+    up_key = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_UP, mod=0)
+
+    def recover():
+        long_history.old_command_counter = 0
+        long_history.recover_old_commands(up_key)
+
+    benchmark(recover)
+    assert long_history.input.value == "look at wall 999"
+    long_history.input.focus = False
+
+
+def test_dispatch_command(benchmark):
+    """Benchmark matching a command and parsing its arguments."""
+
+    def dispatch():
+        command, arguments, _ = CL.get_command_from_user_input(
+            "command line fc on clear"
+        )
+        return cmd_dict[command].parse_arguments(arguments)
+
+    assert benchmark(dispatch) == (["fc", "on", "clear"], "")
+
+
+def test_input_update(benchmark, game):
+    """Benchmark handling the keystrokes of a command."""
+    text_input = Input(focus=True)
+    events = [
+        pygame.event.Event(pygame.KEYDOWN, key=pygame.key.key_code(char), mod=0)
+        for char in "look at wall".replace(" ", "")
+    ]
+
+    def type_command():
+        text_input.value = ""
+        for event in events:
+            text_input.update(event, game.cmd_line.cursor)
+
+    benchmark(type_command)
+    assert text_input.value == "lookatwall"
+
+
+@pytest.fixture
+def focused_input(game):
+    """Fixture focusing the command line input with a typed command."""
+    cmd_line = game.cmd_line
+    cmd_line.input.focus = True
+    cmd_line.input.value = "look at wall"
+    yield cmd_line
+    cmd_line.input.value = ""
+    cmd_line.input.focus = False
+    cmd_line.draw_input_line()
+
+
+def test_draw_idle_input_line(benchmark, focused_input):
+    """Benchmark a frame of the focused input line while the user does not type."""
+    benchmark(focused_input.draw_input_line)
+
+
+def test_draw_typed_input_line(benchmark, focused_input):
+    """Benchmark a frame of the focused input line while the user types."""
+    letters = cycle("abc")
+
+    def type_letter():
+        focused_input.input.value = "look at wall " + next(letters)
+        focused_input.draw_input_line()
+
+    benchmark(type_letter)
@@ -0,0 +1,63 @@
+"""Module containing the benchmarks of the Fog object."""
+
+from itertools import cycle
+from statistics import median
+from time import perf_counter
+
+import pygame
+
+
+def test_fog_draw(benchmark, cave_level):
+    """Benchmark drawing the fog with the player looking in a fixed direction."""
+    camera = cave_level.visible_sprites
+    camera.custom_draw(cave_level.player)
+    benchmark(camera.fog.draw, camera.display_surface, camera.offset)
+
+
+def draw_polygon_fill(fog, surface, offset):
+    """Draw the fog filling the FOV gradient polygons every frame, without FOV masks."""
+    fog.fog.fill((0, 0, 0, fog.FOG_OPACITY))
+    vertices = fog.get_FOV_vertices(fog.player_pos, fog.player_angle)
+    fog.draw_polygons(fog.compute_polygons(vertices), fog.FOG_OPACITY, fog.fog)
+    fog.draw_FOW_surface(offset)
+    fog.blit_FOW_window(offset)
+    surface.blit(fog.fog, (0, 0))
+
+
+def test_fog_draw_rotating(benchmark, cave_level):
+    """Benchmark drawing the fog with the player turning a degree per frame.
+
+    No FOV mask can be reused while turning, so it must be no slower than filling the
+    polygons every frame. Both are timed in turns so they run in the same conditions.
+    """
+    camera = cave_level.visible_sprites
+    camera.custom_draw(cave_level.player)
+    fog = camera.fog
+    angles = cycle(range(360))
+
+    def draw():
+        fog.player_angle = next(angles)
+        fog.draw(camera.display_surface, camera.offset)
+
+    def draw_without_masks():
+        fog.player_angle = next(angles)
+        draw_polygon_fill(fog, camera.display_surface, camera.offset)
+
+    benchmark(draw)
+    if benchmark.disabled:
+        return
+
+    times = {draw: [], draw_without_masks: []}
+    for _ in range(100):
+        for draw_function, function_times in times.items():
+            start = perf_counter()
+            draw_function()
+            function_times.append(perf_counter() - start)
+    assert median(times[draw]) < 1.1 * median(times[draw_without_masks])
+
+
+def test_compute_polygons(benchmark, cave_level):
+    """Benchmark computing the scaled polygons of the field of view."""
+    fog = cave_level.visible_sprites.fog
+    ref_polygon = fog.get_FOV_vertices(pygame.math.Vector2(640, 280), 90)
+    benchmark(fog.compute_polygons, ref_polygon)
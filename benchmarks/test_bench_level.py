@@ -0,0 +1,85 @@
+"""Module containing the benchmarks of the Level object and its sprites."""
+
+from random import Random
+
+import pytest
+
+from src.enemy import Enemy
+from src.enemy_group import EnemyGroup
+from src.settings import TILESIZE
+
+
+def test_custom_draw_valley(benchmark, valley_level):
+    """Benchmark drawing the valley around the player."""
+    benchmark(valley_level.visible_sprites.custom_draw, valley_level.player)
+
+
+@pytest.mark.parametrize("map_name", ["entry_cave", "valley"])
+def test_create_map(benchmark, game, map_name):
+    """Benchmark creating the tiles, player and enemies of a map."""
+    level = game.level
+    level.cmd_line.previous_map_state = level.cmd_line.map_state = map_name
+    map_path = getattr(level, f"{map_name}_path")
+    layouts = getattr(level, f"{map_name}_layouts")
+    graphics = getattr(level, f"{map_name}_graphics", {})
+
+    benchmark.pedantic(
+        level.create_map,
+        args=(layouts, graphics),
+        setup=lambda: level.sprites_setup(map_path),
+        rounds=10,
+    )
+
+
+@pytest.mark.parametrize("num_enemies", [10, 100])
+def test_enemy_collision(benchmark, valley_level, num_enemies):
+    """Benchmark the collisions of enemies spread over the valley with its obstacles."""
+    random = Random(0)
+    enemies = []
+    for _ in range(num_enemies):
+        pos = (random.randrange(100) * TILESIZE, random.randrange(100) * TILESIZE)
+        enemy = Enemy(
+            "bamboo",
+            pos,
+            [],
+            valley_level.obstacle_sprites,
+            valley_level.damage_player,
+            valley_level.trigger_death_particles,
+            valley_level.add_exp,
+        )
+        enemy.move_direction.update(1, 1)
+        enemies.append(enemy)
+
+    def collide():
+        for enemy in enemies:
+            enemy.collision("horizontal")
+            enemy.collision("vertical")
+
+    benchmark(collide)
+
+
+@pytest.mark.parametrize("num_enemies", [10, 100, 500])
+def test_enemy_update(benchmark, valley_level, num_enemies):
+    """Benchmark the reaction to the player of enemies spread around the player."""
+    random = Random(0)
+    enemy_sprites = EnemyGroup()
+    x, y = valley_level.player.rect.center
+    for _ in range(num_enemies):
+        pos = (x + random.randint(-600, 600), y + random.randint(-600, 600))
+        Enemy(
+            "bamboo",
+            pos,
+            [enemy_sprites],
+            valley_level.obstacle_sprites,
+            valley_level.damage_player,
+            valley_level.trigger_death_particles,
+            valley_level.add_exp,
+        )
+
+    benchmark(enemy_sprites.enemy_update, valley_level.player)
+
+
+def test_get_closest_sprites(benchmark, valley_level):
+    """Benchmark finding the interactable sprites close to the player."""
+    player = valley_level.player
+    benchmark(player.get_closest_sprites, valley_level.interactable_sprites)
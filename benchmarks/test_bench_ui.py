@@ -0,0 +1,11 @@
+"""Module containing the benchmarks of the UI."""
+
+
+def test_show_exp(benchmark, game):
+    """Benchmark drawing the experience, as done every frame."""
+    benchmark(game.level.ui.show_exp, 1234)
+
+
+def test_display_ui(benchmark, game):
+    """Benchmark drawing the whole UI of the player."""
+    benchmark(game.level.ui.display, game.level.player)
@@ -0,0 +1,8 @@
+"""Module containing the benchmarks of the util functions."""
+
+from src.utils import import_csv_layout
+
+
+def test_import_csv_layout(benchmark):
+    """Benchmark importing the layout of a valley layer."""
+    benchmark(import_csv_layout, "src/images/map/map_Grass.csv")
@@ -1,22 +1,46 @@
 """Main file of the game."""
 
+import argparse
+import os
+import random
 import sys
+import time
 
 import pygame
 
 from src.canvas import build_canvas, get_canvas
 from src.command_line import CL
+from src.game_clock import game_clock
 from src.level import Level
+from src.profiler import profiler
+from src.recording import InputRecorder, InputReplay, get_random_seed
 from src.screen import Screen
 from src.settings import FPS, WATER_COLOR
+from src.simulation import InputScript
+from src.sound_bank import sound_bank
+from src.text_cache import text_cache
 
 
 class Game:
     """Game object."""
 
-    def __init__(self):
-        """Initialize pygame and set caption."""
+    def __init__(self, headless=False, seed=None):
+        """Initialize pygame and set caption.
+
+        In headless mode, SDL uses its dummy video and audio drivers and the game runs on
+        simulated time (see simulate).
+        """
+        self.headless = headless
+        if headless:
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
+            game_clock.start_simulation()
+        if seed is not None:
+            random.seed(seed)
+
         pygame.init()
+        sound_bank.reset()
+        text_cache.reset()
         pygame.display.set_caption("CLing")
         self.clock = pygame.time.Clock()
 
@@ -25,43 +49,146 @@ class Game:
         self.cmd_line = CL(canvas=self.canvas)
         self.screen = Screen(self.canvas, self.cmd_line)
 
+        # Rects of the canvas pushed to the display, and overlays drawn on top of it
+        self.dirty_rects = []
+        self.overlay_rects = []
+
         # Initialize Level object with all game interactions
         self.level = Level(self.screen, self.cmd_line)
 
         # Sound effect
-        main_sound = pygame.mixer.Sound("src/audio/main.ogg")
-        main_sound.set_volume(0.01)
+        main_sound = sound_bank.get("src/audio/main.ogg", "music", 0.01)
         main_sound.play(loops=-1)
 
-    def run(self):
-        """Run game."""
-        while True:
-            events = pygame.event.get()
-            for event in events:
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
+    def step(self, events):
+        """Run a frame of the game handling the given events."""
+        for event in events:
+            if event.type == pygame.QUIT:
+                self.quit()
+                sys.exit()
 
-                # Run CL methods interacting with events
-                self.cmd_line.run_event(event, self.level)
+            # Run CL methods interacting with events
+            self.cmd_line.run_event(event, self.level)
 
-                # # Pause game and toggle menu screen
-                # if event.type == pygame.KEYDOWN:
-                #     if event.key == pygame.K_m:
-                #         self.level.toggle_menu()
+            # The window lost its content, e.g. after being covered
+            if event.type == pygame.WINDOWEXPOSED:
+                self.cmd_line.redraw()
 
-            # Build layout screen + command line
-            build_canvas(self.canvas, self.screen, self.cmd_line)
+            # # Pause game and toggle menu screen
+            # if event.type == pygame.KEYDOWN:
+            #     if event.key == pygame.K_m:
+            #         self.level.toggle_menu()
 
-            # Draw and update on screen and command line
+        # Draw and update on screen and command line
+        if not self.cmd_line.full_screen:
             self.screen.surface.fill(WATER_COLOR)
-            self.level.run()
-
-            # Update
-            pygame.display.update()
-            self.clock.tick(FPS)
+        self.level.run()
+
+        # Build layout screen + command line, restoring the canvas below the last overlays
+        self.dirty_rects = build_canvas(
+            self.canvas, self.screen, self.cmd_line, self.overlay_rects
+        )
+        overlay_rect = profiler.draw(self.canvas)
+        self.overlay_rects = [overlay_rect] if overlay_rect else []
+        self.dirty_rects += self.overlay_rects
+
+    def quit(self):
+        """Wait for background work to finish, write pending logs and quit pygame."""
+        self.level.map_preloader.discard()
+        self.cmd_line.history.close()
+        profiler.dump()
+        pygame.quit()
+
+    def run(self, recorder=None):
+        """Run game, recording its input if a recorder is given."""
+        try:
+            while True:
+                if recorder is not None:
+                    recorder.start_frame()
+                events = pygame.event.get()
+                self.step(events)
+                if recorder is not None:
+                    recorder.end_frame(events)
+
+                # Update
+                with profiler.section("display.update"):
+                    pygame.display.update(self.dirty_rects)
+                with profiler.section("clock.tick", idle=True):
+                    self.clock.tick(FPS)
+                profiler.end_frame()
+        finally:
+            if recorder is not None:
+                recorder.close()
+
+    def simulate(self, frames, input_script=None):
+        """Run a number of frames at a fixed timestep as fast as possible.
+
+        The keyboard is replaced by the input script (no key is pressed without one). Return
+        the number of simulated frames per second.
+        """
+        assert self.headless, "Simulations require a headless game"
+        input_script = input_script or InputScript()
+        input_script.start()
+        start_time = time.perf_counter()
+        for frame in range(frames):
+            game_clock.advance()
+            self.step(input_script.get_events(frame) + pygame.event.get())
+            profiler.end_frame()
+        return frames / (time.perf_counter() - start_time)
+
+    def replay(self, input_replay):
+        """Replay an input log as fast as possible and return the frames per second.
+
+        The game must be created with the seed of the log.
+        """
+        assert self.headless, "Replays require a headless game"
+        input_replay.start()
+        start_time = time.perf_counter()
+        for frame in range(len(input_replay)):
+            events = input_replay.get_events(frame)
+            # Events posted by the game itself are part of the log
+            pygame.event.clear()
+            self.step(events)
+            profiler.end_frame()
+        return len(input_replay) / (time.perf_counter() - start_time)
 
 
 if __name__ == "__main__":
-    game = Game()
-    game.run()
+    parser = argparse.ArgumentParser(description="Run the game.")
+    parser.add_argument(
+        "--headless",
+        metavar="FRAMES",
+        type=int,
+        help="simulate FRAMES frames without display and print the simulation throughput",
+    )
+    parser.add_argument("--script", help="input script of the headless simulation")
+    parser.add_argument("--seed", type=int, help="seed of the random number generator")
+    parser.add_argument(
+        "--record", metavar="LOG", help="record the input of the session"
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="LOG",
+        help="replay a recorded session without display and print its throughput",
+    )
+    args = parser.parse_args()
+
+    if args.replay is not None:
+        input_replay = InputReplay.from_file(args.replay)
+        game = Game(headless=True, seed=input_replay.seed)
+        fps = game.replay(input_replay)
+        print(f"Replayed {len(input_replay)} frames at {fps:.1f} frames per second")
+    elif args.record is not None:
+        seed = get_random_seed() if args.seed is None else args.seed
+        recorder = InputRecorder(args.record, seed)
+        recorder.start()
+        game = Game(seed=seed)
+        game.run(recorder)
+    elif args.headless is None:
+        game = Game(seed=args.seed)
+        game.run()
+    else:
+        game = Game(headless=True, seed=0 if args.seed is None else args.seed)
+        input_script = InputScript.from_file(args.script) if args.script else None
+        fps = game.simulate(args.headless, input_script)
+        print(f"Simulated {args.headless} frames at {fps:.1f} frames per second")
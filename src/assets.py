@@ -0,0 +1,93 @@
+"""Module containing the asset manager shared by the whole game."""
+
+from os import walk
+
+import pygame
+
+from src.atlas import TextureAtlas
+
+
+class AssetManager:
+    """Asset manager decoding each image file at most once per session.
+
+    Assets are loaded within a scope (e.g. the map being played). Each scope holds one
+    reference to the assets it loads. Releasing a scope drops its references and the assets no
+    longer referenced are evicted with evict_unused. Assets loaded in the None scope (the
+    default one) are never evicted.
+
+    Folders packed in the texture atlas (if any) are handed out as subsurfaces of its sheets
+    instead of being decoded image by image.
+    """
+
+    def __init__(self, atlas=None):
+        """Initialize object with an optional texture atlas."""
+        self.atlas = atlas
+        self.assets = {}
+        self.ref_counts = {}
+        self.scopes = {None: set()}
+        self.scope = None
+
+    def set_scope(self, scope):
+        """Set the scope holding the assets loaded from now on."""
+        self.scopes.setdefault(scope, set())
+        self.scope = scope
+
+    def release_scope(self, scope):
+        """Release the references held by a scope. The default scope cannot be released."""
+        if scope is None:
+            return
+        for key in self.scopes.pop(scope, set()):
+            self.ref_counts[key] -= 1
+        if self.scope == scope:
+            self.scope = None
+
+    def evict_unused(self):
+        """Evict the assets that are not referenced by any scope."""
+        for key in [key for key, count in self.ref_counts.items() if count == 0]:
+            del self.assets[key]
+            del self.ref_counts[key]
+
+    def get(self, key, loader):
+        """Return the asset stored with a key, loading it with the loader if required."""
+        if key not in self.assets:
+            self.assets[key] = loader()
+            self.ref_counts[key] = 0
+        if key not in self.scopes[self.scope]:
+            self.scopes[self.scope].add(key)
+            self.ref_counts[key] += 1
+        return self.assets[key]
+
+    def load_image(self, path, alpha=True):
+        """Return the image in a path converted to the display format."""
+
+        def loader():
+            image = pygame.image.load(path)
+            return image.convert_alpha() if alpha else image.convert()
+
+        return self.get(("image", path, alpha), loader)
+
+    def has_image(self, path, alpha=True):
+        """Return whether the image in a path is loaded."""
+        return ("image", path, alpha) in self.assets
+
+    def add_image(self, path, image, alpha=True):
+        """Add an image decoded elsewhere (e.g. in a worker thread) as if loaded from path."""
+        return self.get(("image", path, alpha), lambda: image)
+
+    def load_folder(self, path):
+        """Return all images in a folder converted to the display format."""
+
+        def loader():
+            if self.atlas is not None and path in self.atlas:
+                return self.atlas.get_frames(path)
+            surface_list = []
+            for _, __, img_files in walk(path):
+                for image in img_files:
+                    full_path = path + "/" + image
+                    surface_list.append(pygame.image.load(full_path).convert_alpha())
+            return surface_list
+
+        return self.get(("folder", path), loader)
+
+
+assets = AssetManager(TextureAtlas())
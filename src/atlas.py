@@ -0,0 +1,155 @@
+"""Module containing the texture atlas packing animation frames into a few large sheets.
+
+The atlas is built on the first run (or whenever its source images change) and can also be
+built offline with:
+
+    python -m src.atlas
+"""
+
+import json
+from os import makedirs, path, walk
+
+import pygame
+
+from src.settings import ATLAS_FOLDERS, ATLAS_PATH, ATLAS_SIZE
+
+INDEX_FILE = "index.json"
+
+
+def get_atlas_sources(roots):
+    """Return the image files of every folder under the roots, in import_folder order."""
+    sources = {}
+    for root in roots:
+        for folder, _, img_files in walk(root):
+            if img_files:
+                sources[path.normpath(folder)] = list(img_files)
+    return sources
+
+
+def get_sources_mtime(sources):
+    """Return the last modification time of the source folders and images."""
+    mtimes = [path.getmtime(folder) for folder in sources]
+    for folder, img_files in sources.items():
+        mtimes += [path.getmtime(path.join(folder, image)) for image in img_files]
+    return max(mtimes, default=0)
+
+
+def pack_frames(sizes, sheet_size):
+    """Pack rectangles of the given sizes into sheets using shelves of decreasing height.
+
+    Return a list with the (sheet, x, y) location of each size.
+    """
+    locations = [None] * len(sizes)
+    sheet, x, y, shelf_height = 0, 0, 0, 0
+    for i in sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], -sizes[i][0])):
+        width, height = sizes[i]
+        assert width <= sheet_size and height <= sheet_size, "Frame larger than sheet"
+        if x + width > sheet_size:
+            # Start a new shelf
+            x, y, shelf_height = 0, y + shelf_height, 0
+        if y + height > sheet_size:
+            # Start a new sheet
+            sheet, x, y, shelf_height = sheet + 1, 0, 0, 0
+        locations[i] = (sheet, x, y)
+        x += width
+        shelf_height = max(shelf_height, height)
+    return locations
+
+
+def build_atlas(roots=ATLAS_FOLDERS, atlas_path=ATLAS_PATH, sheet_size=ATLAS_SIZE):
+    """Pack all images in the folders under the roots into sheets and write their index."""
+    sources = get_atlas_sources(roots)
+    frames = [
+        (folder, pygame.image.load(path.join(folder, image)))
+        for folder, img_files in sources.items()
+        for image in img_files
+    ]
+    locations = pack_frames([frame.get_size() for _, frame in frames], sheet_size)
+
+    # Blit frames on transparent sheets. The frames do not overlap, so keeping the maximum
+    # value of each channel copies them without blending.
+    num_sheets = max((sheet for sheet, _, __ in locations), default=-1) + 1
+    sheets = [
+        pygame.Surface((sheet_size, sheet_size), pygame.SRCALPHA, 32)
+        for _ in range(num_sheets)
+    ]
+    index = {folder: [] for folder in sources}
+    for (folder, frame), (sheet, x, y) in zip(frames, locations):
+        sheets[sheet].blit(frame, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+        index[folder].append([sheet, x, y, frame.get_width(), frame.get_height()])
+
+    makedirs(atlas_path, exist_ok=True)
+    sheet_files = []
+    for i, sheet in enumerate(sheets):
+        sheet_files.append(f"sheet_{i}.png")
+        pygame.image.save(sheet, path.join(atlas_path, sheet_files[-1]))
+    with open(path.join(atlas_path, INDEX_FILE), "w") as index_file:
+        json.dump(
+            {
+                "mtime": get_sources_mtime(sources),
+                "sources": sources,
+                "sheets": sheet_files,
+                "frames": index,
+            },
+            index_file,
+        )
+
+
+class TextureAtlas:
+    """Texture atlas handing out animation frames as subsurfaces of a few sheets."""
+
+    def __init__(
+        self, roots=ATLAS_FOLDERS, atlas_path=ATLAS_PATH, sheet_size=ATLAS_SIZE
+    ):
+        """Initialize object. The sheets are loaded the first time a folder is requested."""
+        self.roots = roots
+        self.atlas_path = atlas_path
+        self.sheet_size = sheet_size
+        self.index = None
+        self.sheets = None
+
+    def is_stale(self):
+        """Return whether the atlas on disk is missing or older than its source images."""
+        try:
+            with open(path.join(self.atlas_path, INDEX_FILE)) as index_file:
+                index = json.load(index_file)
+        except (OSError, ValueError):
+            return True
+        sources = get_atlas_sources(self.roots)
+        return index["sources"] != sources or index["mtime"] < get_sources_mtime(
+            sources
+        )
+
+    def load(self):
+        """Load the index and sheets of the atlas, building it first if it is stale."""
+        if self.is_stale():
+            build_atlas(self.roots, self.atlas_path, self.sheet_size)
+        with open(path.join(self.atlas_path, INDEX_FILE)) as index_file:
+            self.index = json.load(index_file)
+        self.sheets = [
+            pygame.image.load(path.join(self.atlas_path, sheet)).convert_alpha()
+            for sheet in self.index["sheets"]
+        ]
+
+    def __contains__(self, folder):
+        """Return whether the images of a folder are packed in the atlas."""
+        return any(
+            path.commonpath([path.normpath(folder), path.normpath(root)])
+            == path.normpath(root)
+            for root in self.roots
+        )
+
+    def get_frames(self, folder):
+        """Return the images of a folder as subsurfaces of the atlas sheets."""
+        if self.index is None:
+            self.load()
+        return [
+            self.sheets[sheet].subsurface((x, y, width, height))
+            for sheet, x, y, width, height in self.index["frames"].get(
+                path.normpath(folder), []
+            )
+        ]
+
+
+if __name__ == "__main__":
+    build_atlas()
@@ -9,7 +9,39 @@ def get_canvas():
     return pygame.display.set_mode((WIDTH, HEIGHT))
 
 
-def build_canvas(canvas, screen, cmd_line):
-    """Stick screen and cmd_line surfaces to canvas."""
-    canvas.blit(screen.surface, (0, 0))
-    canvas.blit(cmd_line.surface, (0, canvas.get_height() - cmd_line.height))
+def get_union(rects):
+    """Return the rects that are not contained in any other rect of the list."""
+    union = []
+    for rect in sorted(rects, key=lambda rect: rect.w * rect.h, reverse=True):
+        if not any(other.contains(rect) for other in union):
+            union.append(rect)
+    return union
+
+
+def build_canvas(canvas, screen, cmd_line, repaint_rects=()):
+    """Stick the dirty parts of the screen and cmd_line surfaces to canvas.
+
+    The screen is redrawn every frame unless the command line hides it in full screen mode,
+    while the command line reports the parts of its surface that changed. The repaint
+    rects are parts of the canvas to restore from both surfaces, e.g. below an overlay
+    drawn on the canvas in the previous frame. Return the dirty rects of the canvas.
+    """
+    cl_top = canvas.get_height() - cmd_line.height
+    cl_area = cmd_line.surface.get_rect(top=cl_top)
+    dirty_rects = list(repaint_rects)
+    dirty_rects += [rect.move(0, cl_top) for rect in cmd_line.pop_dirty_rects()]
+    if cmd_line.full_screen:
+        screen_area = pygame.Rect(0, 0, 0, 0)
+    else:
+        screen_area = screen.surface.get_rect()
+        dirty_rects.append(screen_area)
+    dirty_rects = get_union(dirty_rects)
+
+    for rect in dirty_rects:
+        screen_rect = rect.clip(screen_area)
+        if screen_rect:
+            canvas.blit(screen.surface, screen_rect, screen_rect)
+        cl_rect = rect.clip(cl_area)
+        if cl_rect:
+            canvas.blit(cmd_line.surface, cl_rect, cl_rect.move(0, -cl_top))
+    return dirty_rects
@@ -0,0 +1,95 @@
+"""Module containing the history of the command line."""
+
+from collections import deque
+
+from src.settings import CL_COMMAND_HISTORY_LENGTH, CL_HISTORY_LENGTH, CL_HISTORY_LOG
+
+
+class History:
+    """Lines shown in the command line, kept in a ring buffer of fixed capacity.
+
+    Once the buffer is full, each new line overwrites the oldest one, which is appended to the
+    log file if there is one. The commands typed by the user (lines starting with "> ") are
+    indexed apart as they are added, to recall them without scanning the lines.
+    """
+
+    def __init__(
+        self,
+        capacity=CL_HISTORY_LENGTH,
+        log_path=CL_HISTORY_LOG,
+        command_capacity=CL_COMMAND_HISTORY_LENGTH,
+    ):
+        """Initialize object."""
+        self.capacity = capacity
+        self.log_path = log_path
+        self.log = None
+        self.lines = [None] * capacity
+        self.start = 0
+        self.length = 0
+        self.commands = deque(maxlen=command_capacity)
+
+    def __len__(self):
+        """Return the number of lines kept."""
+        return self.length
+
+    def __iter__(self):
+        """Iterate over the lines kept, from the oldest one."""
+        for i in range(self.length):
+            yield self.lines[(self.start + i) % self.capacity]
+
+    def get_index(self, i):
+        """Return the position in the buffer of the i-th line (negative from the end)."""
+        if i < 0:
+            i += self.length
+        if not 0 <= i < self.length:
+            raise IndexError("history index out of range")
+        return (self.start + i) % self.capacity
+
+    def __getitem__(self, i):
+        """Return a line, or a list of lines if given a slice."""
+        if isinstance(i, slice):
+            return [
+                self.lines[self.get_index(j)] for j in range(*i.indices(self.length))
+            ]
+        return self.lines[self.get_index(i)]
+
+    def __setitem__(self, i, line):
+        """Replace a line. The command index is not updated."""
+        self.lines[self.get_index(i)] = line
+
+    def append(self, line):
+        """Add a line, dropping the oldest one if the buffer is full."""
+        if self.length < self.capacity:
+            self.lines[(self.start + self.length) % self.capacity] = line
+            self.length += 1
+        else:
+            self.write_log(self.lines[self.start])
+            self.lines[self.start] = line
+            self.start = (self.start + 1) % self.capacity
+        if line.startswith("> "):
+            self.commands.append(line[2:])
+
+    def extend(self, lines):
+        """Add several lines."""
+        for line in lines:
+            self.append(line)
+
+    def clear(self):
+        """Remove all lines and commands."""
+        self.lines = [None] * self.capacity
+        self.start = self.length = 0
+        self.commands.clear()
+
+    def write_log(self, line):
+        """Append a line dropped from the buffer to the log file, if there is one."""
+        if self.log_path is None:
+            return
+        if self.log is None:
+            self.log = open(self.log_path, "a")
+        self.log.write(f"{line}\n")
+
+    def close(self):
+        """Close the log file."""
+        if self.log is not None:
+            self.log.close()
+            self.log = None
@@ -1,12 +1,16 @@
 """Module containing the command line class."""
+import os
+
 import pygame
 import pygame.locals as locals
 
+from src.cl_history import History
 from src.cl_text_input import Input
 from src.colors import BLACK, WHITE
-from src.commands import cmd_dict
+from src.commands import cmd_dict, command_trie, get_completions
 from src.cursor import Cursor
 from src.events_definition import CMD_FULL_SCREEN, CMD_REGULAR_SIZE, ENTRY_CAVE, VALLEY
+from src.keyboard import keyboard
 
 
 class CL:
@@ -22,7 +26,8 @@ class CL:
         self._n_rows_shown = self._get_n_rows_shown(self._height, self._line_height)
         self._n_rows_shown_ref = self._n_rows_shown
         self._height_ref = self._height
-        self._history = []
+        self._history = History()
+        self._rendered_lines = {}
         self._surface = self._get_surface(self._width, self._height)
         self._input = self._get_input(self._height)
         self._input.focus = False
@@ -36,6 +41,7 @@ class CL:
         self.active_player = True
         self.old_command_counter = 0
         self.cursor = Cursor(self._input)
+        self.redraw()
 
     def _get_input(self, vertical_location):
         """Return text Input object."""
@@ -133,18 +139,106 @@ class CL:
 
         self.check_prompt()
 
+    def redraw(self):
+        """Draw the whole command line again in the next run."""
+        self._drawn_history = None
+        self._drawn_input_line = None
+        self._clear_input_line = True
+        self._dirty_rects = [self._surface.get_rect()]
+
+    def pop_dirty_rects(self):
+        """Return the rects of the surface that changed since the last call."""
+        dirty_rects = self._dirty_rects
+        self._dirty_rects = []
+        return dirty_rects
+
+    def get_visible_history(self):
+        """Return the history lines that fit the terminal, from the bottom one up."""
+        end = len(self._history) + self._scroll_id
+        return self._history[max(0, end - self._n_rows_shown) : end][::-1]
+
+    def render_line(self, line):
+        """Return the image of a history line, rendering it only the first time it is shown.
+
+        Lines are rendered on the black background of the command line, in the display
+        format, so that they are copied without blending.
+        """
+        image = self._rendered_lines.get(line)
+        if image is None:
+            image = self._input.font.render(line, True, WHITE, BLACK).convert()
+            self._rendered_lines[line] = image
+        return image
+
+    def evict_rendered_lines(self):
+        """Forget the images of the lines scrolled more than a terminal away from view."""
+        end = len(self._history) + self._scroll_id
+        start = max(0, end - 2 * self._n_rows_shown)
+        near_lines = set(self._history[start : end + self._n_rows_shown])
+        for line in self._rendered_lines.keys() - near_lines:
+            del self._rendered_lines[line]
+
     def draw_history(self):
-        """Draw command line's history on command line."""
-        for i_line in range(self._n_rows_shown):
-            try:
-                text = self._input.font.render(
-                    self._history[-(i_line + 1) + self._scroll_id], True, WHITE
-                )
-            except IndexError:
-                break
-            text_rect = text.get_rect()
-            text_rect.y = self._height - self._line_height * (i_line + 2)
-            self._surface.blit(text, text_rect)
+        """Draw command line's history on command line, if it changed since the last draw.
+
+        The surface keeps the composited history until then, and the lines are rendered
+        once while they stay near the view.
+        """
+        # The scroll bar depends on the length of the history and the scroll position
+        visible_history = self.get_visible_history()
+        drawn_history = (len(self._history), self._scroll_id, visible_history)
+        if drawn_history == self._drawn_history:
+            return
+        self._drawn_history = drawn_history
+
+        history_rect = pygame.Rect(0, 0, self._width, self._height - self._line_height)
+        self._surface.fill(BLACK, history_rect)
+        bottom_line_y = history_rect.bottom - self._line_height
+        self._surface.blits(
+            [
+                (self.render_line(line), (0, bottom_line_y - self._line_height * i))
+                for i, line in enumerate(visible_history)
+            ],
+            doreturn=False,
+        )
+        self._dirty_rects.append(history_rect)
+        self.evict_rendered_lines()
+
+        # The previous scroll bar may reach the input line, so clear it as well
+        self._clear_input_line = True
+
+    def get_input_rect(self):
+        """Return the rect of the input line on the command line surface."""
+        return pygame.Rect(
+            0, self._height - self._line_height, self._width, self._line_height
+        )
+
+    def draw_cursor(self):
+        """Draw the cursor and the input value, clipped to the input line."""
+        self._surface.set_clip(self.get_input_rect())
+        self.cursor.draw(self._surface)
+        self._surface.set_clip(None)
+
+    def draw_input_line(self):
+        """Draw the input line if it changed since the last draw, and clear it once it loses focus.
+
+        While in focus, the cursor runs every frame but the line is only drawn again when its
+        layout changes, e.g. when typing or when the cursor blinks.
+        """
+        if self._input.focus:
+            self.cursor.run()
+            layout = self.cursor.update_layout()
+        else:
+            layout = None
+        if layout == self._drawn_input_line and not self._clear_input_line:
+            return
+        self._drawn_input_line = layout
+        self._clear_input_line = False
+
+        input_rect = self.get_input_rect()
+        self._surface.fill(BLACK, input_rect)
+        if layout is not None:
+            self.draw_cursor()
+        self._dirty_rects.append(input_rect)
 
     def reset_after_enter(self, user_input):
         """Store user input and reset command line with an empty string."""
@@ -159,7 +253,8 @@ class CL:
         self._input.value = ""
         self._input.focus = False
         self.check_prompt()
-        self.cursor.draw(self._surface)
+        self.cursor.update_layout()
+        self._clear_input_line = True
 
     def maximize(self):
         """Maximize command line to fill the entire screen."""
@@ -170,6 +265,7 @@ class CL:
         self._input = self._get_input(self._height)
         self._input.focus = True
         self._scroll_id = 0
+        self.redraw()
 
     def minimize(self):
         """Minimise command line to its original size."""
@@ -180,10 +276,11 @@ class CL:
         self._input = self._get_input(self._height)
         self._input.focus = True
         self._scroll_id = 0
+        self.redraw()
 
     def scrolling(self):
         """Scroll up and down through CL history when in full scren mode."""
-        key_pressed_is = pygame.key.get_pressed()
+        key_pressed_is = keyboard.get_pressed()
         if key_pressed_is[locals.K_UP] and not key_pressed_is[locals.K_DOWN]:
             if self._scroll_id > (self._n_rows_shown - len(self._history)):
                 self._scroll_id -= 1
@@ -192,7 +289,10 @@ class CL:
                 self._scroll_id += 1
 
     def draw_scroll_bar(self):
-        """Draw scroll bar indicating which part of the history is currently being displayed."""
+        """Draw scroll bar indicating which part of the history is currently being displayed.
+
+        It is drawn over the history and input line, so it is drawn again whenever they are.
+        """
         bar_height = self._height * self._n_rows_shown / len(self._history)
         x_pos = self._width - self._scroll_bar_width
         y_pos = (
@@ -201,11 +301,10 @@ class CL:
             - (self._scroll_id / (self._n_rows_shown - len(self._history)))
             * (self._height - bar_height)
         )
-        if not self._full_screen:
-            y_pos += self._canvas_height - self._height
         scroll_bar = pygame.Rect((x_pos, y_pos), (self._scroll_bar_width, bar_height))
 
-        pygame.draw.rect(self._canvas, WHITE, scroll_bar, 0, 3)
+        pygame.draw.rect(self._surface, WHITE, scroll_bar, 0, 3)
+        self._dirty_rects.append(scroll_bar)
 
     def split_long_user_input(self, user_input):
         """Split user input if it is longer than MAX_CL_LENGTH."""
@@ -227,16 +326,27 @@ class CL:
     @staticmethod
     def get_command_from_user_input(user_input):
         """Return main command and the arguments introduced by the user."""
-        for command in cmd_dict.keys():
-            index_ini = user_input.find(command)
-            if index_ini == 0:
-                break
-        else:
+        words = user_input.split()
+        command, end = command_trie.match(words)
+        if command is None:
             message = f"Command '{user_input}' is not a valid command"
             return None, None, message
-        assert index_ini == 0, "The command must be introduced in the first place"
-        index_end = len(command)
-        return user_input[index_ini:index_end], user_input[index_end + 1 :], ""
+        return command, " ".join(words[end:]), ""
+
+    def complete_input(self):
+        """Complete the last word of the input with the command or argument words it starts.
+
+        If there are several, complete their common prefix or list them in the history.
+        """
+        partial, completions = get_completions(self._input.value)
+        if len(completions) == 1:
+            self._input.value += completions[0][len(partial) :] + " "
+        elif completions:
+            common_prefix = os.path.commonprefix(completions)
+            if len(common_prefix) > len(partial):
+                self._input.value += common_prefix[len(partial) :]
+            else:
+                self._history.append("  " + "  ".join(completions))
 
     def write_command_response(self, prompt="  "):
         """Write on CL the content of input.value and store it in CL history."""
@@ -264,20 +374,12 @@ class CL:
         if len(self.history) > self.n_rows_shown:
             if not self._input.focus:
                 self.scrolling()
-            self.draw_scroll_bar()
 
     def resolve_user_commands(self, player, sprites):
         """Resolve commands introduced by the user via command line."""
         self.reset_after_enter(self._user_input)
         self.trigger_user_commands(player, sprites)
 
-    def get_command_history(self):
-        """Get old commands from the entire CL history."""
-        self._command_history = []
-        for line in self._history:
-            if line[0] == ">":
-                self._command_history.append(line[2:])
-
     def recover_old_commands(self, event):
         """Use up and down keys to recover old commands stored in history."""
         if self._input.focus:
@@ -287,19 +389,19 @@ class CL:
                 elif event.key == locals.K_DOWN:
                     self.old_command_counter -= 1
 
-        # Get only the commands from CL history
-        self.get_command_history()
+        # Commands are indexed apart from the rest of the CL history
+        commands = self._history.commands
 
         # Check for incompatible indices
         if self.old_command_counter < 0:
             self._input.value = ""
             self.old_command_counter = 0
-        elif self.old_command_counter > len(self._command_history):
-            self.old_command_counter = len(self._command_history)
+        elif self.old_command_counter > len(commands):
+            self.old_command_counter = len(commands)
 
         # Apply index and display command
         if not self.old_command_counter == 0:
-            self._input.value = self._command_history[-self.old_command_counter]
+            self._input.value = commands[-self.old_command_counter]
 
     def activate_cl_commands(self, event, level):
         """Activate CL commands coming from events."""
@@ -317,29 +419,26 @@ class CL:
         if event.type == VALLEY:
             self.previous_map_state = self.map_state
             self.map_state = "valley"
-            level.sprites_setup(level.valley_path)
-            level.create_map(level.valley_layouts, level.valley_graphics)
+            level.load_map(
+                level.valley_path, level.valley_layouts, level.valley_graphics
+            )
 
         if event.type == ENTRY_CAVE:
             self.previous_map_state = self.map_state
             self.map_state = "entry_cave"
-            level.sprites_setup(level.entry_cave_path)
-            level.create_map(level.entry_cave_layouts)
+            level.load_map(level.entry_cave_path, level.entry_cave_layouts)
 
     def run(self, room_text):
         """Run CL methods."""
         # Run methods that control the CL behaviour
         self.scroll_history()
 
-        # Run methods that draw in the CL
-        self._surface.fill(BLACK)
+        # Run methods that draw in the CL, only where it changed
         self.draw_history()
         room_text.update_room_first_entry()
-
-        # Run CL specific methods when in focus mode
-        if self.input.focus:
-            self.cursor.run()
-            self.cursor.draw(self.surface)
+        self.draw_input_line()
+        if self._dirty_rects and len(self.history) > self.n_rows_shown:
+            self.draw_scroll_bar()
 
     def run_event(self, event, level):
         """Run CL methods that interact with event."""
@@ -348,6 +447,13 @@ class CL:
         self.activate_cl_commands(event, level)
         self.check_focus(event)
         self.recover_old_commands(event)
+        if (
+            event.type == pygame.KEYDOWN
+            and event.key == pygame.K_TAB
+            and self._input.focus
+            and self.cursor.position == 0
+        ):
+            self.complete_input()
         self._user_input = self._input.update(event, self.cursor)
         if self._user_input and self.active_player:
             self.cursor.init_selection_variables()
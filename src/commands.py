@@ -3,6 +3,9 @@
 import pygame
 
 from src.events_definition import CMD_FULL_SCREEN, CMD_REGULAR_SIZE, VALLEY
+from src.profiler import profiler
+from src.trie import Trie
+from src.utils import import_image
 
 # from src.object_interaction import get_closest_object_requested_by_user
 # from src.objects import BreakableWall, Wall
@@ -21,53 +24,72 @@ class Command:
         self.extended_description = extended_description
         self.arguments = arguments
         self.examples = examples
+        self.compile_arguments()
+
+    def compile_arguments(self):
+        """Compile the argument grammar in a trie of names and tries of their values.
+
+        Arguments are either names or lists of alternative names, optionally followed by
+        the values they take.
+        """
+        self.argument_trie = Trie()
+        self.argument_values = {}
+        for cmd_args in self.arguments:
+            if type(cmd_args) is str:
+                self.argument_trie.insert(cmd_args)
+                continue
+            for name in cmd_args[0]:
+                self.argument_trie.insert(name)
+                if len(cmd_args) > 1:
+                    self.argument_values[name] = (cmd_args[1], Trie(cmd_args[1]))
 
     def parse_arguments(self, arguments):
-        """Return the arguments introduced by the users after the command."""
+        """Return the arguments introduced by the users after the command.
+
+        Arguments are matched word by word, the longest first, and the arguments taking
+        values must be followed by one of them.
+        """
+        words = arguments.split()
         user_args = []
-        for cmd_args in self.arguments:
-            if type(cmd_args) is list:
-                for names in cmd_args:
-                    for name in names:
-                        ini_idx = arguments.find(name)
-                        if not ini_idx == -1:
-                            user_args.append(arguments[ini_idx : ini_idx + len(name)])
-                            arguments = (
-                                arguments[:ini_idx] + arguments[ini_idx + len(name) :]
-                            )
-                        if arguments.isspace():
-                            break
-                    if arguments.isspace():
-                        break
-            elif type(cmd_args) is str:
-                ini_idx = arguments.find(cmd_args)
-                if not ini_idx == -1:
-                    user_args.append(arguments[ini_idx : ini_idx + len(cmd_args)])
-                    arguments = (
-                        arguments[:ini_idx] + arguments[ini_idx + len(cmd_args) :]
-                    )
-                if arguments.isspace():
-                    break
-            else:
-                ini_idx = arguments.find(cmd_args[0])
-                if not ini_idx == -1:
-                    user_args.append(arguments[ini_idx : ini_idx + len(cmd_args[0])])
-                    arguments = (
-                        arguments[:ini_idx] + arguments[ini_idx + len(cmd_args[0]) :]
+        i = 0
+        while i < len(words):
+            name, i = self.argument_trie.match(words, i)
+            if name is None:
+                message = (
+                    f"The argument '{' '.join(words[i:])}' is not a valid argument for the "
+                    f"command '{self.name}'."
+                )
+                return user_args, message
+            user_args.append(name)
+            if name in self.argument_values:
+                values, value_trie = self.argument_values[name]
+                value, i = value_trie.match(words, i)
+                if value is None:
+                    choices = " or ".join(f"'{value}'" for value in values)
+                    return (
+                        user_args,
+                        f"The argument '{name}' must be followed by {choices}.",
                     )
-                if arguments.isspace():
-                    break
-        if not arguments.isspace():
-            message = (
-                f"The argument '{arguments}' is not a valid argument for the "
-                f"command '{self.name}'."
-            )
-        else:
-            message = ""
-        return user_args, message
+                user_args.append(value)
+        return user_args, ""
 
+    def complete_arguments(self, words, partial):
+        """Return the argument words that may follow the given ones, starting with partial."""
+        i = 0
+        while i < len(words):
+            name, end = self.argument_trie.match(words, i)
+            if name is None:
+                return self.argument_trie.complete(words[i:], partial)
+            i = end
+            if name in self.argument_values:
+                _, value_trie = self.argument_values[name]
+                value, i = value_trie.match(words, end)
+                if value is None:
+                    return value_trie.complete(words[end:], partial)
+        return self.argument_trie.complete([], partial)
 
-HELP_ARGUMENTS = [[("command line", "cl")], "look at"]
+
+HELP_ARGUMENTS = [[("command line", "cl")], "look at", "perf"]
 
 
 class Help(Command):
@@ -177,7 +199,7 @@ class Cmd_line(Command):
                             "either 'on' or 'off'."
                         )
                 if arg == "clear":
-                    cmd_line._history = []
+                    cmd_line.history.clear()
 
 
 class Look_at(Command):
@@ -239,7 +261,7 @@ class Break(Command):
             if arguments in closest_sprite.sprite_type:
                 cmd_line.input.value = closest_sprite.break_it()
                 cmd_line.entry_cave_opened = True
-                closest_sprite.image = pygame.image.load("src/images/map/doors/315.png")
+                closest_sprite.image = import_image("src/images/map/doors/315.png")
                 closest_sprite.update()
             else:
                 cmd_line.input.value = f"You don't find a '{arguments}' nearby."
@@ -280,11 +302,45 @@ class Crawl_into(Command):
         cmd_line.write_command_response()
 
 
+class Perf(Command):
+    """Perf command."""
+
+    def __init__(self):
+        """Initialize."""
+        parameters = {
+            "name": "perf",
+            "short_name": "",
+            "description": "Show the frame profiler.",
+            "extended_description": "The frame profiler draws the time taken by each part of "
+            "the game in the last frames. The timings are saved on exit.",
+            "arguments": [
+                [("on", "off")],
+            ],
+            "examples": ["perf on", "perf off"],
+        }
+        super().__init__(**parameters)
+
+    def execute(self, cmd_line, arguments, _, __):
+        """Execute command."""
+        if arguments == "on":
+            profiler.enable()
+            cmd_line.input.value = "Frame profiler on."
+        elif arguments == "off":
+            profiler.disable()
+            cmd_line.input.value = "Frame profiler off."
+        else:
+            cmd_line.input.value = (
+                "The 'perf' command must be followed by 'on' or 'off'."
+            )
+        cmd_line.write_command_response()
+
+
 help = Help()
 cl = Cmd_line()
 look_at = Look_at()
 break_ = Break()
 crawl_into = Crawl_into()
+perf = Perf()
 
 cmd_dict = {
     "help": help,
@@ -294,4 +350,22 @@ cmd_dict = {
     "look at": look_at,
     "break": break_,
     "crawl into": crawl_into,
+    "perf": perf,
 }
+
+# Command names compiled in a trie once, to match the start of the user input
+command_trie = Trie(cmd_dict)
+
+
+def get_completions(user_input):
+    """Return the last word of the user input and the command or argument words it starts.
+
+    The last word is empty if the input ends with a space.
+    """
+    words = user_input.split()
+    partial = "" if not words or user_input[-1].isspace() else words.pop()
+    completions = command_trie.complete(words, partial)
+    command, end = command_trie.match(words)
+    if command is not None:
+        completions += cmd_dict[command].complete_arguments(words[end:], partial)
+    return partial, sorted(set(completions))
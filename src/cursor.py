@@ -6,7 +6,10 @@ import pygame
 import pygame.locals as locals
 
 from src.colors import BLACK, WHITE
+from src.game_clock import game_clock
+from src.keyboard import keyboard
 from src.text import Text
+from src.text_cache import text_cache
 
 
 class Cursor:
@@ -36,8 +39,15 @@ class Cursor:
         self.BLINKING_SPEED = 200
         self.INI_PAUSE = 20
         self.FAST_PAUSE = 10
+        self.layout = None
 
         self.init_selection_variables()
+        self.text = Text(
+            text=self.input.value,
+            start=self.select_start,
+            end=self.select_end,
+            modes=self.text_modes,
+        )
 
     def init_selection_variables(self):
         """Initialize selection variables so they are not polluted."""
@@ -76,7 +86,7 @@ class Cursor:
 
     def blinking_cursor_cooldown(self):
         """Implement cooldowns for the blinking cursor."""
-        current_time = pygame.time.get_ticks()
+        current_time = game_clock.get_ticks()
         if not self.blinking_active:
             if current_time - self.blinking_past >= self.BLINKING_SPEED:
                 self.blinking_active = True
@@ -85,16 +95,16 @@ class Cursor:
         """Update blinking cursor cooldowns."""
         # Check blinking cooldowns
         if self.blinking_bool:
-            self.blinking_start = pygame.time.get_ticks()
+            self.blinking_start = game_clock.get_ticks()
             self.blinking_bool = False
 
         # Reset after cooldowns
-        current_time = pygame.time.get_ticks()
+        current_time = game_clock.get_ticks()
         if not (
             self.text_modes["select_maintain"] or self.text_modes["select_ongoing"]
         ):
             if current_time - self.blinking_start >= self.BLINKING_SPEED:
-                self.blinking_past = pygame.time.get_ticks()
+                self.blinking_past = game_clock.get_ticks()
                 self.blinking_active = False
                 self.blinking_bool = True
                 self.blinking_start = 0
@@ -344,31 +354,31 @@ class Cursor:
                 # Turn off ongoing mode if there is no selection
                 self.set_cl_modes(False, "select_ongoing")
 
+    def get_width(self, string):
+        """Return the width of a string in the input font."""
+        return text_cache.get_width(self.input.font, string)
+
     def create_rectangle(self):
         """Create white rectangle with thin width or with the select_text width if select."""
-        # Get text based on cursor position
-        delta_text = self.input.font.render(
-            self.input.prompt + self.input.value[: self.left_position], 1, WHITE
+        # Get the offset of the cursor position and the width of the selection
+        delta_width = self.get_width(
+            self.input.prompt + self.input.value[: self.left_position]
         )
-
-        # Render selection text, whether is a empty string or not
-        select_text = self.input.font.render(self.selection, 1, WHITE)
+        select_width = self.get_width(self.selection)
 
         # Create rectangle
         if self.text_modes["select_maintain"] or self.text_modes["select_ongoing"]:
             if self.text.is_inverted:
-                blinking_rect_x = (
-                    self.input.x + delta_text.get_width() - select_text.get_width()
-                )
+                blinking_rect_x = self.input.x + delta_width - select_width
             else:
-                blinking_rect_x = self.input.x + delta_text.get_width()
+                blinking_rect_x = self.input.x + delta_width
         else:
-            blinking_rect_x = self.input.x + delta_text.get_width()
+            blinking_rect_x = self.input.x + delta_width
 
         blinking_rect_y = self.input.y
 
         if self.text_modes["select_maintain"] or self.text_modes["select_ongoing"]:
-            blinking_rect_width = select_text.get_width()
+            blinking_rect_width = select_width
         else:
             blinking_rect_width = self.BLINKING_WIDTH
 
@@ -381,9 +391,36 @@ class Cursor:
             blinking_rect_height,
         )
 
+    def get_text_chunks(self):
+        """Return the strings of the input line with their colors and positions."""
+        x, y = self.input.x, self.input.y
+        if self.text_modes["select_maintain"] or self.text_modes["select_ongoing"]:
+            # Display the total string in 3 chunks to display black letters in selection
+            # First chunk
+            string_1 = self.input.prompt + self.input.value[: self.disp_start]
+            chunks = [(string_1, WHITE, (x, y))]
+
+            # Second chunk if it exists
+            if not self.disp_start == None:
+                x += self.get_width(string_1)
+                string_2 = self.input.value[self.disp_start : self.disp_end]
+                chunks.append((string_2, BLACK, (x, y)))
+
+            # Display 3rd chunk if it exists
+            if not self.disp_end == None:
+                x += self.get_width(string_2)
+                chunks.append((self.input.value[self.disp_end :], WHITE, (x, y)))
+            return tuple(chunks)
+
+        # Display the entire string
+        return ((self.input.prompt + self.input.value, WHITE, (x, y)),)
+
     def insert_letter_in_position(self):
         """Insert letter if typing in the middle of the string."""
         if self.position < 0 and self.delta_typing > 0:
+            # The character typed by a key may still be replaced by its text input
+            if self.input.key_text_index == len(self.input.value) - 1:
+                self.input.key_text_index = self.left_position - 1
             self.input.value = (
                 self.input.value[: self.left_position - 1]
                 + self.input.value[-1]
@@ -393,13 +430,13 @@ class Cursor:
     def run(self):
         """Execute all cursor methods."""
         # Some keys (arrows, cntrl, backspace, return) have to be runed outside the event loop
-        pressed = pygame.key.get_pressed()
+        pressed = keyboard.get_pressed()
         self.move_cursor(pressed)
         self.running_selection(pressed)
         if not self.text_modes["select_delete"]:
             self.delete(pressed)
 
-        self.text = Text(
+        self.text.update(
             text=self.input.value,
             start=self.select_start,
             end=self.select_end,
@@ -419,8 +456,12 @@ class Cursor:
         else:
             self.selection = ""
 
-    def draw(self, surface):
-        """Run all cursor methods that draw in the CL."""
+    def update_layout(self):
+        """Update the state shown by the cursor and return the layout of the input line.
+
+        The layout holds the blinking rectangle, if displayed, and the strings to draw, so
+        that the input line only has to be drawn again when it changes.
+        """
         # Check cooldowns and display user input
         self.blinking_cursor_cooldown()
 
@@ -444,48 +485,13 @@ class Cursor:
         if self.text.has_selection:
             self.disp_start, self.disp_end = self.text.correct_idxs_for_display()
 
-        # Create blinking rectangle
-        blinking_rect = self.create_rectangle()
-
-        # Display rectangle if needed and update cooldowns
+        # Create blinking rectangle if needed and update cooldowns
         if self.blinking_active:
-            pygame.draw.rect(surface, WHITE, blinking_rect)
+            blinking_rect = tuple(self.create_rectangle())
             self.update_cooldowns()
-
-        # Display input value
-        if self.text_modes["select_maintain"] or self.text_modes["select_ongoing"]:
-            # Display the total string in 3 chunks to display black letters in selection
-            # First chunk
-            text_1 = self.input.font.render(
-                self.input.prompt + self.input.value[: self.disp_start], 1, WHITE
-            )
-            surface.blit(text_1, (self.input.x, self.input.y))
-
-            # Second chunk if it exists
-            if not self.disp_start == None:
-                text_2 = self.input.font.render(
-                    self.input.value[self.disp_start : self.disp_end], 1, BLACK
-                )
-                surface.blit(text_2, (self.input.x + text_1.get_width(), self.input.y))
-
-            # Display 3rd chunk if it exists
-            if not self.disp_end == None:
-                text_3 = self.input.font.render(
-                    self.input.value[self.disp_end :], 1, WHITE
-                )
-                surface.blit(
-                    text_3,
-                    (
-                        self.input.x + text_1.get_width() + text_2.get_width(),
-                        self.input.y,
-                    ),
-                )
         else:
-            # Render and display the entire string
-            text = self.input.font.render(
-                self.input.prompt + self.input.value, 1, WHITE
-            )
-            surface.blit(text, (self.input.x, self.input.y))
+            blinking_rect = None
+        self.layout = (blinking_rect, self.get_text_chunks())
 
         # Update variables
         self.prev_typing_len = self.new_typing_len
@@ -493,3 +499,17 @@ class Cursor:
         if self.text_modes["select_substitute"] or self.text_modes["select_delete"]:
             self.text_modes["select_substitute"] = False
             self.text_modes["select_delete"] = False
+        return self.layout
+
+    def draw(self, surface):
+        """Draw the last layout of the input line in the CL."""
+        blinking_rect, chunks = self.layout
+        if blinking_rect is not None:
+            pygame.draw.rect(surface, WHITE, blinking_rect)
+        surface.blits(
+            [
+                (text_cache.render(self.input.font, string, 1, color), position)
+                for string, color, position in chunks
+            ],
+            doreturn=False,
+        )
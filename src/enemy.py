@@ -3,7 +3,9 @@
 import pygame
 
 from src.entity import Entity
+from src.game_clock import game_clock
 from src.settings import monster_data
+from src.sound_bank import sound_bank
 from src.utils import import_folder
 
 
@@ -21,7 +23,7 @@ class Enemy(Entity):
         add_exp,
     ):
         """Initialize Enemy object."""
-        super().__init__(groups)
+        super().__init__([])
         self.sprite_type = "enemy"
 
         # Graphics setup
@@ -61,12 +63,12 @@ class Enemy(Entity):
         self.invencibility_duration = 300
 
         # Sound effects
-        self.death_sound = pygame.mixer.Sound("src/audio/death.wav")
-        self.hit_sound = pygame.mixer.Sound("src/audio/hit.wav")
-        self.attack_sound = pygame.mixer.Sound(monster_info["attack_sound"])
-        self.death_sound.set_volume(0.2)
-        self.hit_sound.set_volume(0.6)
-        self.attack_sound.set_volume(0.3)
+        self.death_sound = sound_bank.get("src/audio/death.wav", "enemy", 0.2)
+        self.hit_sound = sound_bank.get("src/audio/hit.wav", "enemy", 0.6)
+        self.attack_sound = sound_bank.get(monster_info["attack_sound"], "enemy", 0.3)
+
+        # Join the groups once set up, as the enemy group reads the radii
+        self.add(groups)
 
     def import_graphics(self, name):
         """Import graphics to animate enemies."""
@@ -86,29 +88,22 @@ class Enemy(Entity):
             direction = pygame.math.Vector2()
         return (distance, direction)
 
-    def get_status(self, player):
-        """Get enemy status."""
-        distance = self.get_player_distance_direction(player)[0]
-
-        if distance <= self.attack_radius and self.can_attack:
-            if self.status != "attack":
-                self.frame_index = 0
-            self.status = "attack"
-        elif distance <= self.notice_radius:
-            self.status = "move"
-        else:
-            self.status = "idle"
+    def set_status(self, status):
+        """Set enemy status, computed by its group (see EnemyGroup)."""
+        if status == "attack" and self.status != "attack":
+            self.frame_index = 0
+        self.status = status
 
-    def actions(self, player):
-        """Define enemy actions."""
+    def actions(self, direction):
+        """Define enemy actions, given its direction to the player."""
         if self.status == "attack":
-            self.attack_time = pygame.time.get_ticks()
+            self.attack_time = game_clock.get_ticks()
             self.damage_player(self.attack_damage, self.attack_type)
             self.attack_sound.play()
         elif self.status == "move":
-            self.move_direction = self.get_player_distance_direction(player)[1]
+            self.move_direction.update(direction)
         else:
-            self.move_direction = pygame.math.Vector2()
+            self.move_direction.update(0, 0)
 
     def animate(self):
         """Animate enemies."""
@@ -122,16 +117,16 @@ class Enemy(Entity):
         self.image = animation[int(self.frame_index)]
         self.rect = self.image.get_rect(center=self.hitbox.center)
 
-        # Flicker when being hit
+        # Flicker when being hit. Animation frames are shared by all enemies of the same kind,
+        # so the flickering enemy uses its own copy of the frame.
         if not self.vulnerable:
             alpha = self.wave_value()
+            self.image = self.image.copy()
             self.image.set_alpha(alpha)
-        else:
-            self.image.set_alpha(255)
 
     def cooldowns(self):
         """Enemy attack cooldown."""
-        current_time = pygame.time.get_ticks()
+        current_time = game_clock.get_ticks()
         if not self.can_attack:
             if current_time - self.attack_time >= self.attack_cooldown:
                 self.can_attack = True
@@ -149,7 +144,7 @@ class Enemy(Entity):
                 self.health -= player.get_full_weapon_damage()
             else:
                 self.health -= player.get_full_magic_damage()
-            self.hit_time = pygame.time.get_ticks()
+            self.hit_time = game_clock.get_ticks()
             self.vulnerable = False
 
     def check_death(self):
@@ -173,7 +168,7 @@ class Enemy(Entity):
         self.cooldowns()
         self.check_death()
 
-    def enemy_update(self, player):
-        """Update enemy."""
-        self.get_status(player)
-        self.actions(player)
+    def enemy_update(self, status, direction):
+        """Update enemy with its status and direction to the player."""
+        self.set_status(status)
+        self.actions(direction)
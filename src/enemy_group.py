@@ -0,0 +1,100 @@
+"""Module containing the group of enemies reacting to the player together."""
+
+import numpy as np
+import pygame
+
+ENEMY_STATUSES = ("idle", "move", "attack")
+IDLE, MOVE, ATTACK = range(len(ENEMY_STATUSES))
+
+
+class EnemyGroup(pygame.sprite.Group):
+    """Group of enemies whose reaction to the player is computed in one vectorized pass.
+
+    The positions, radii and attack state of the enemies are kept in arrays, one row per
+    enemy in the order they were added. Each frame, the distances and directions to the
+    player and the status of every enemy are computed for all of them at once, and each
+    enemy then reads its row.
+    """
+
+    def __init__(self, *sprites, capacity=16):
+        """Initialize object with the number of enemies the arrays hold before growing."""
+        self.enemies = []
+        self.rows = {}
+        self.positions = np.zeros((capacity, 2))
+        self.attack_radii = np.zeros(capacity)
+        self.notice_radii = np.zeros(capacity)
+        self.can_attack = np.zeros(capacity, dtype=bool)
+        super().__init__(*sprites)
+
+    def grow(self):
+        """Double the number of rows of the arrays."""
+        self.positions = np.concatenate((self.positions, np.zeros_like(self.positions)))
+        self.attack_radii = np.concatenate(
+            (self.attack_radii, np.zeros_like(self.attack_radii))
+        )
+        self.notice_radii = np.concatenate(
+            (self.notice_radii, np.zeros_like(self.notice_radii))
+        )
+        self.can_attack = np.concatenate(
+            (self.can_attack, np.zeros_like(self.can_attack))
+        )
+
+    def add_internal(self, sprite, layer=None):
+        """Add sprite to the group, in a new row of the arrays."""
+        super().add_internal(sprite, layer)
+        row = len(self.enemies)
+        if row == len(self.attack_radii):
+            self.grow()
+        self.enemies.append(sprite)
+        self.rows[sprite] = row
+        self.attack_radii[row] = sprite.attack_radius
+        self.notice_radii[row] = sprite.notice_radius
+
+    def remove_internal(self, sprite):
+        """Remove sprite from the group, moving the rows after its row up."""
+        super().remove_internal(sprite)
+        row = self.rows.pop(sprite)
+        del self.enemies[row]
+        end = len(self.enemies)
+        self.attack_radii[row:end] = self.attack_radii[row + 1 : end + 1]
+        self.notice_radii[row:end] = self.notice_radii[row + 1 : end + 1]
+        for enemy in self.enemies[row:]:
+            self.rows[enemy] -= 1
+
+    def get_statuses(self, player):
+        """Return the status of each enemy and its direction to the player.
+
+        An enemy attacks the player within its attack radius if it can attack, moves towards
+        the player within its notice radius and stays idle otherwise.
+        """
+        n = len(self.enemies)
+        positions = self.positions[:n]
+        positions[:] = [enemy.rect.center for enemy in self.enemies]
+        can_attack = self.can_attack[:n]
+        can_attack[:] = [enemy.can_attack for enemy in self.enemies]
+
+        # Same operations as pygame.math.Vector2.magnitude and normalize
+        vectors = np.asarray(player.rect.center, dtype=float) - positions
+        distances = np.sqrt(
+            vectors[:, 0] * vectors[:, 0] + vectors[:, 1] * vectors[:, 1]
+        )
+        directions = np.divide(
+            vectors,
+            distances[:, np.newaxis],
+            out=np.zeros_like(vectors),
+            where=distances[:, np.newaxis] > 0,
+        )
+
+        statuses = np.where(distances <= self.notice_radii[:n], MOVE, IDLE)
+        statuses[(distances <= self.attack_radii[:n]) & can_attack] = ATTACK
+        return statuses, directions
+
+    def enemy_update(self, player):
+        """Update the status and actions of the enemies."""
+        if not self.enemies:
+            return
+        statuses, directions = self.get_statuses(player)
+        for enemy, status, direction in zip(
+            self.enemies, statuses.tolist(), directions.tolist()
+        ):
+            enemy.enemy_update(ENEMY_STATUSES[status], direction)
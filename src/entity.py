@@ -4,6 +4,8 @@ from math import sin
 
 import pygame
 
+from src.game_clock import game_clock
+
 
 class Entity(pygame.sprite.Sprite):
     """Generic Entity class."""
@@ -30,15 +32,17 @@ class Entity(pygame.sprite.Sprite):
 
     def collision(self, move_direction):
         """Check for horizontal and vertigal collisions."""
+        # Only check the obstacles in the grid cells overlapped by the hitbox
+        obstacle_sprites = self.obstacle_sprites.get_sprites_in_rect(self.hitbox)
         if move_direction == "horizontal":
-            for sprite in self.obstacle_sprites:
+            for sprite in obstacle_sprites:
                 if sprite.hitbox.colliderect(self.hitbox):
                     if self.move_direction.x > 0:  # moving right
                         self.hitbox.right = sprite.hitbox.left
                     if self.move_direction.x < 0:  # moving left
                         self.hitbox.left = sprite.hitbox.right
         if move_direction == "vertical":
-            for sprite in self.obstacle_sprites:
+            for sprite in obstacle_sprites:
                 if sprite.hitbox.colliderect(self.hitbox):
                     if self.move_direction.y > 0:  # moving down
                         self.hitbox.bottom = sprite.hitbox.top
@@ -47,7 +51,7 @@ class Entity(pygame.sprite.Sprite):
 
     def wave_value(self):
         """Sign wave going from 0 to 255 several times."""
-        value = sin(pygame.time.get_ticks())
+        value = sin(game_clock.get_ticks())
         if value >= 0:
             return 255
         else:
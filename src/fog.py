@@ -1,10 +1,11 @@
 """Module containing the Fog object."""
 
+from collections import OrderedDict
 import math
 
 import pygame
 
-from src.settings import HEIGHT, WIDTH
+from src.settings import HEIGHT, TILESIZE, WIDTH
 
 
 class Fog:
@@ -13,13 +14,18 @@ class Fog:
     def __init__(self, floor_rect):
         """Initialize object."""
         self.fog = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        self.fog_of_war = pygame.Surface(
-            (floor_rect.width, floor_rect.height), pygame.SRCALPHA
-        )
         # self.ref_surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
 
+        # Fog-Of-War is stored in a coarse grid where each cell covers FOW_CELL_SIZE pixels
+        # of the map. Use a FOW_CELL_SIZE of 1 to store it at full map resolution.
+        self.FOW_CELL_SIZE = TILESIZE // 4
+        self.fow_grid_size = (
+            math.ceil(floor_rect.width / self.FOW_CELL_SIZE),
+            math.ceil(floor_rect.height / self.FOW_CELL_SIZE),
+        )
+
         # Initialize FOW only once
-        self.fog_of_war.fill((0, 0, 0, 255))
+        self.fog_of_war_grid, self.fog_of_war = self.get_fow_grid(self.fow_grid_size)
 
         # Vision camp parameters
         self.AWARENESS_RADIUS = 100
@@ -31,6 +37,35 @@ class Fog:
         self.SCALE_FACTOR = 0.996
         self.NUM_POLYGONS = 100
 
+        # FOV gradient masks are built once per angle bucket and kept in a LRU cache. Masks
+        # are only built for angles kept at least two frames: while the player turns, each
+        # angle is seen once and the polygons are drawn directly.
+        self.FOV_ANGLE_BUCKET = 1  # units: degrees [º]
+        self.FOV_MASK_CACHE_SIZE = 32
+        self.fov_masks = OrderedDict()
+        self.last_fov_angle = None
+
+    @staticmethod
+    def get_fow_grid(grid_size):
+        """Return the FOW grid as an RGBA bytearray together with a surface sharing its memory.
+
+        Only the alpha channel is used. All cells start unexplored (alpha = 255). The BGRA
+        layout matches the fog surface, so blending the grid onto it needs no pixel conversion.
+        """
+        grid = bytearray(b"\x00\x00\x00\xff" * grid_size[0] * grid_size[1])
+        return grid, pygame.image.frombuffer(grid, grid_size, "BGRA")
+
+    def get_fow_window(self, offset):
+        """Return the FOW grid rectangle (in cells) covering the screen for a given offset."""
+        cell = self.FOW_CELL_SIZE
+        col_ini = max(int(offset[0]) // cell, 0)
+        row_ini = max(int(offset[1]) // cell, 0)
+        col_end = min(-(-(int(offset[0]) + WIDTH) // cell), self.fow_grid_size[0])
+        row_end = min(-(-(int(offset[1]) + HEIGHT) // cell), self.fow_grid_size[1])
+        return pygame.Rect(
+            col_ini, row_ini, max(col_end - col_ini, 0), max(row_end - row_ini, 0)
+        )
+
     @staticmethod
     def get_polygon_centroid(vertices):
         """Return the centroid of a polygon defined with a list of vertices."""
@@ -87,12 +122,8 @@ class Fog:
             )
         return vertices
 
-    def update_FOV_vertices(self, player, offset):
-        """Return the vertices of the player's field of view."""
-        # Get current player's parameters
-        player_pos = player.rect.center - offset
-        player_angle = player.aim_angle
-
+    def get_FOV_vertices(self, player_pos, player_angle):
+        """Return the vertices of the field of view of a player at a position and angle."""
         circle_vertices = self.get_circle_vertices(player_pos, player_angle)
         FOV_vertices = [
             (
@@ -112,7 +143,15 @@ class Fog:
                 * self.VISION_LENGTH,
             ),
         ]
-        self.FOV_vertices = FOV_vertices + circle_vertices
+        return FOV_vertices + circle_vertices
+
+    def update_FOV_vertices(self, player, offset):
+        """Update the vertices of the player's field of view."""
+        # Get current player's parameters
+        self.player_pos = player.rect.center - offset
+        self.player_angle = player.aim_angle
+
+        self.FOV_vertices = self.get_FOV_vertices(self.player_pos, self.player_angle)
 
     def update_ref_surface(self):
         """Update reference surface by drawing the polygon into the surface."""
@@ -134,30 +173,122 @@ class Fog:
             alpha = max_alpha - i / self.NUM_POLYGONS * max_alpha
             pygame.draw.polygon(surface, (0, 0, 0, alpha), polygons[i])
 
+    def get_fov_mask_key(self, player_angle):
+        """Return the cache key of the FOV mask used for a given player angle."""
+        angle_bucket = (
+            player_angle // self.FOV_ANGLE_BUCKET * self.FOV_ANGLE_BUCKET % 360
+        )
+        return (
+            angle_bucket,
+            self.VISION_ANGLE,
+            self.VISION_LENGTH,
+            self.AWARENESS_RADIUS,
+        )
+
+    def build_fov_mask(self, player_angle):
+        """Return the FOV light mask of a player angle and the player position within it.
+
+        The mask alpha is the amount of fog removed by the FOV gradient, so it is zero outside
+        the FOV and the mask can be blitted rotated without revealing its corners.
+        """
+        vertices = self.get_FOV_vertices((0, 0), player_angle)
+        x_min = math.floor(min(x for x, _ in vertices)) - 1
+        y_min = math.floor(min(y for _, y in vertices)) - 1
+        x_max = math.ceil(max(x for x, _ in vertices)) + 1
+        y_max = math.ceil(max(y for _, y in vertices)) + 1
+        vertices = [(x - x_min, y - y_min) for x, y in vertices]
+
+        # Draw the gradient polygons in the same way as the fog surface
+        size = (x_max - x_min, y_max - y_min)
+        gradient = pygame.Surface(size, pygame.SRCALPHA)
+        gradient.fill((0, 0, 0, self.FOG_OPACITY))
+        polygons = self.compute_polygons(vertices)
+        self.draw_polygons(polygons, self.FOG_OPACITY, gradient)
+
+        # Invert the gradient so its alpha is the fog removed
+        mask = pygame.Surface(size, pygame.SRCALPHA)
+        mask.fill((0, 0, 0, self.FOG_OPACITY))
+        mask.blit(gradient, (0, 0), special_flags=pygame.BLEND_RGBA_SUB)
+        return mask, (-x_min, -y_min)
+
+    def get_fov_mask(self, player_angle):
+        """Return the cached FOV mask for a player angle, building it if required."""
+        key = self.get_fov_mask_key(player_angle)
+        if key in self.fov_masks:
+            self.fov_masks.move_to_end(key)
+        else:
+            self.fov_masks[key] = self.build_fov_mask(key[0])
+            if len(self.fov_masks) > self.FOV_MASK_CACHE_SIZE:
+                self.fov_masks.popitem(last=False)
+        return self.fov_masks[key]
+
+    def blit_fov_mask(self, surface, player_pos, player_angle):
+        """Remove the fog under the player's field of view using the cached FOV mask."""
+        mask, pivot = self.get_fov_mask(player_angle)
+        surface.blit(
+            mask,
+            (int(player_pos[0]) - pivot[0], int(player_pos[1]) - pivot[1]),
+            special_flags=pygame.BLEND_RGBA_SUB,
+        )
+
+    def remove_fov_fog(self, surface, player_pos, player_angle):
+        """Remove the fog under the player's field of view, from its mask if it is worth it."""
+        steady = player_angle == self.last_fov_angle
+        self.last_fov_angle = player_angle
+        if steady or self.get_fov_mask_key(player_angle) in self.fov_masks:
+            self.blit_fov_mask(surface, player_pos, player_angle)
+        else:
+            vertices = self.get_FOV_vertices(player_pos, player_angle)
+            polygons = self.compute_polygons(vertices)
+            self.draw_polygons(polygons, self.FOG_OPACITY, surface)
+
     def draw_FOW_surface(self, offset):
-        """Draw the reference polygon to the fog of war surface."""
-        shifted_vertices = [vertex + offset for vertex in self.FOV_vertices]
+        """Draw the reference polygon to the fog of war grid."""
+        shifted_vertices = [
+            (
+                (vertex[0] + offset[0]) / self.FOW_CELL_SIZE,
+                (vertex[1] + offset[1]) / self.FOW_CELL_SIZE,
+            )
+            for vertex in self.FOV_vertices
+        ]
 
         pygame.draw.polygon(
             self.fog_of_war, (0, 0, 0, self.FOW_OPACITY), shifted_vertices
         )
 
+    def blit_FOW_window(self, offset):
+        """Upscale the on-screen part of the FOW grid and blit it onto the fog surface."""
+        window = self.get_fow_window(offset)
+        if not window.width or not window.height:
+            return
+
+        cell = self.FOW_CELL_SIZE
+        fog_of_war_window = self.fog_of_war.subsurface(window)
+        if cell > 1:
+            fog_of_war_window = pygame.transform.smoothscale(
+                fog_of_war_window, (window.width * cell, window.height * cell)
+            )
+
+        # Take the minimum alpha values between fog and FOW
+        self.fog.blit(
+            fog_of_war_window,
+            (window.x * cell - int(offset[0]), window.y * cell - int(offset[1])),
+            special_flags=pygame.BLEND_RGBA_MIN,
+        )
+
     def draw(self, surface, offset):
         """Draw fog object to visualize the player's field of view."""
         # Fill surface with black color and alpha = fog_opacity
         self.fog.fill((0, 0, 0, self.FOG_OPACITY))
 
-        # Compute and draw polygons from FOV vertices
-        polygons = self.compute_polygons(self.FOV_vertices)
-        self.draw_polygons(polygons, self.FOG_OPACITY, self.fog)
+        # Remove the fog under the FOV, with a single blit of its gradient mask if cached
+        self.remove_fov_fog(self.fog, self.player_pos, self.player_angle)
 
         # Update and draw FOW surface
         self.draw_FOW_surface(offset)
 
-        # Blit FOW onto fog surface with the correct offset. Take the minimum alpha values.
-        self.fog.blit(
-            self.fog_of_war, (0, 0) - offset, special_flags=pygame.BLEND_RGBA_MIN
-        )
+        # Blit the on-screen FOW window onto fog surface with the correct offset
+        self.blit_FOW_window(offset)
 
         # Blit fog surface on the screen
         surface.blit(self.fog, (0, 0))
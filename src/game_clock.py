@@ -0,0 +1,38 @@
+"""Module containing the clock used by the game timers and cooldowns."""
+
+import pygame
+
+from src.settings import FPS
+
+
+class GameClock:
+    """Clock following real time or, in simulation mode, a fixed timestep per frame."""
+
+    def __init__(self):
+        """Initialize object."""
+        self.simulated_time = None
+
+    def get_ticks(self):
+        """Return the number of milliseconds since the game (or simulation) started."""
+        if self.simulated_time is None:
+            return pygame.time.get_ticks()
+        return int(self.simulated_time)
+
+    def start_simulation(self):
+        """Switch to simulated time, starting at zero."""
+        self.simulated_time = 0
+
+    def stop_simulation(self):
+        """Switch back to real time."""
+        self.simulated_time = None
+
+    def set_ticks(self, ticks):
+        """Set simulated time, e.g. to the ticks of a recorded frame."""
+        self.simulated_time = ticks
+
+    def advance(self, frames=1):
+        """Advance simulated time by the fixed timestep of a number of frames."""
+        self.simulated_time += frames * 1000 / FPS
+
+
+game_clock = GameClock()
@@ -0,0 +1,79 @@
+"""Module containing the keyboard state read by the game."""
+
+import pygame
+
+
+class ScriptedKeys:
+    """Keys pressed by a script, indexable by key code like pygame.key.get_pressed()."""
+
+    def __init__(self):
+        """Initialize object."""
+        self.keys = set()
+
+    def __getitem__(self, key):
+        """Return whether a key is pressed."""
+        return key in self.keys
+
+
+class RecordingKeys:
+    """Key state recording the keys found pressed by the game."""
+
+    def __init__(self, pressed, recorded_keys):
+        """Initialize object."""
+        self.pressed = pressed
+        self.recorded_keys = recorded_keys
+
+    def __getitem__(self, key):
+        """Return whether a key is pressed, recording it if so."""
+        if self.pressed[key]:
+            self.recorded_keys.add(key)
+            return True
+        return False
+
+
+class Keyboard:
+    """Keyboard state read from pygame or, when scripted, from the keys set by a script.
+
+    While recording, the keys the game finds pressed are collected so that a replay can press
+    exactly the same ones.
+    """
+
+    def __init__(self):
+        """Initialize object."""
+        self.scripted_keys = None
+        self.recorded_keys = None
+
+    def start_script(self):
+        """Ignore the real keyboard and return the keys to be set by a script."""
+        self.scripted_keys = ScriptedKeys()
+        return self.scripted_keys
+
+    def stop_script(self):
+        """Read the real keyboard again."""
+        self.scripted_keys = None
+
+    def start_recording(self):
+        """Start collecting the keys found pressed."""
+        self.recorded_keys = set()
+
+    def pop_recorded_keys(self):
+        """Return the keys found pressed since the last call."""
+        recorded_keys, self.recorded_keys = self.recorded_keys, set()
+        return recorded_keys
+
+    def stop_recording(self):
+        """Stop collecting the keys found pressed."""
+        self.recorded_keys = None
+
+    def get_pressed(self):
+        """Return the state of all keys."""
+        if self.scripted_keys is None:
+            pressed = pygame.key.get_pressed()
+        else:
+            pressed = self.scripted_keys
+        if self.recorded_keys is not None:
+            return RecordingKeys(pressed, self.recorded_keys)
+        return pressed
+
+
+keyboard = Keyboard()
@@ -1,21 +1,36 @@
 """Level and Camera objects file."""
 
+from bisect import bisect_left, bisect_right
+from itertools import count
 from random import choice, randint
 
 import pygame
 
+from src.assets import assets
 from src.enemy import Enemy
+from src.enemy_group import EnemyGroup
 from src.fog import Fog
+from src.game_clock import game_clock
 from src.magic import MagicPlayer
+from src.map_preloader import MapPreloader
 from src.particles import AnimationPlayer
 from src.player import Player
+from src.profiler import profiler
 from src.room_text import RoomText
-from src.settings import TILESIZE
-from src.tile import Tile
+from src.scene_cache import Scene, SceneCache
+from src.settings import (
+    BAKE_STATIC_TILES,
+    BAKED_TILE_TYPES,
+    CHUNK_SIZE,
+    MAP_PRELOAD_RADIUS,
+    TILESIZE,
+)
+from src.spatial_grid import SpatialGrid, SpatialGroup
+from src.tile import Tile, TileChunk
 from src.ui import UI
 
 # from src.upgrade import Upgrade
-from src.utils import import_csv_layout, import_folder
+from src.utils import import_csv_layout, import_folder, import_image
 from src.weapon import Weapon
 
 
@@ -64,132 +79,187 @@ class Level:
             "objects": import_folder("src/images/map/objects"),
         }
 
+        # The floor of the next map is decoded in the background when nearing an exit
+        self.map_preloader = MapPreloader()
+
+        # Scenes of the maps visited recently, restored instead of built again
+        self.scene_cache = SceneCache()
+
         # Create map of the entry cave where the place starts
+        self.player = None
         self.sprites_setup(self.entry_cave_path)
         self.create_map(self.entry_cave_layouts)
         self.room_text = RoomText(cmd_line)
 
+    def load_map(self, map_path, layouts, graphics={}):
+        """Switch to a map, restoring its scene if it is cached or building it otherwise."""
+        # The assets of a map stay loaded while its scene is cached
+        self.destroy_attack()
+        for evicted_path in self.scene_cache.put(self.map_path, Scene(self)):
+            assets.release_scope(evicted_path)
+
+        scene = self.scene_cache.pop(map_path)
+        if scene is None:
+            self.sprites_setup(map_path)
+            self.create_map(layouts, graphics)
+        else:
+            scene.restore(self)
+            self.map_path = map_path
+            assets.set_scope(map_path)
+            assets.evict_unused()
+        self.place_player()
+
+    def place_player(self):
+        """Move the player into the sprite groups of the current map, at its entrance."""
+        self.player.kill()
+        self.visible_sprites.add(self.player)
+        self.player.obstacle_sprites = self.obstacle_sprites
+        self.player.door_sprites = self.door_sprites
+        self.player.set_position(self.get_player_spawn())
+
     def sprites_setup(self, map_path):
         """Setup all the sprite groups in the game."""
+        # Assets loaded from now on belong to the new map. They are evicted once its scene
+        # leaves the scene cache, unless another map uses them too.
+        self.map_path = map_path
+        assets.set_scope(map_path)
+        floor_surf = self.map_preloader.take(map_path)
+        if floor_surf is not None:
+            assets.add_image(map_path, floor_surf, alpha=False)
+
         # Sprite group setup
         self.visible_sprites = YsortedCameraGroup(self, self.display_surface, map_path)
-        self.obstacle_sprites = pygame.sprite.Group()
+        self.obstacle_sprites = SpatialGroup()
         self.interactable_sprites = pygame.sprite.Group()
         self.door_sprites = pygame.sprite.Group()
 
+        # Tiles leading to another map and the floor path of that map
+        self.map_exits = {}
+
         # Attack sprites
         self.current_attack = None
         self.attack_sprites = pygame.sprite.Group()
         self.attackable_sprites = pygame.sprite.Group()
+        self.enemy_sprites = EnemyGroup()
 
     def create_map(self, layouts, graphics={}):
         """Create open world map from csv files."""
+        self.create_tiles(layouts, graphics)
+        assets.evict_unused()
+
+    def create_tiles(self, layouts, graphics):
+        """Create the tiles, player and enemies of the map layouts."""
         for style, layout in layouts.items():
-            for i_row, row in enumerate(layout):
-                for i_col, col in enumerate(row):
-                    if col != "-1":
-                        x = i_col * TILESIZE
-                        y = i_row * TILESIZE
-                        if style == "wall":
-                            Tile(
-                                (x, y),
-                                [self.obstacle_sprites, self.interactable_sprites],
-                                "wall",
-                            )
-                        if style == "ocean":
-                            Tile(
-                                (x, y),
-                                [self.obstacle_sprites, self.interactable_sprites],
-                                "ocean",
-                            )
-                        if style == "grass":
-                            random_grass_img = choice(graphics["grass"])
-                            Tile(
-                                (x, y),
-                                [
-                                    self.visible_sprites,
-                                    self.obstacle_sprites,
-                                    self.attackable_sprites,
-                                ],
-                                "grass",
-                                random_grass_img,
+            for i_row, i_col, tile_id in layout.get_tiles():
+                x = i_col * TILESIZE
+                y = i_row * TILESIZE
+                if style == "wall":
+                    Tile(
+                        (x, y),
+                        [self.obstacle_sprites, self.interactable_sprites],
+                        "wall",
+                    )
+                if style == "ocean":
+                    Tile(
+                        (x, y),
+                        [self.obstacle_sprites, self.interactable_sprites],
+                        "ocean",
+                    )
+                if style == "grass":
+                    random_grass_img = choice(graphics["grass"])
+                    Tile(
+                        (x, y),
+                        [
+                            self.visible_sprites,
+                            self.obstacle_sprites,
+                            self.attackable_sprites,
+                        ],
+                        "grass",
+                        random_grass_img,
+                    )
+                if style == "trees":
+                    surf = graphics["objects"][tile_id]
+                    Tile(
+                        (x, y),
+                        [
+                            self.visible_sprites,
+                            self.obstacle_sprites,
+                            self.interactable_sprites,
+                        ],
+                        "tree",
+                        surf,
+                    )
+                if style == "wall_hole":
+                    if self.cmd_line.entry_cave_opened:
+                        wall_image = import_image("src/images/map/doors/315.png")
+                    else:
+                        wall_image = import_image("src/images/map/doors/217.png")
+                    wall_hole = Tile(
+                        (x, y),
+                        [self.visible_sprites, self.interactable_sprites],
+                        "wall_hole",
+                        wall_image,
+                    )
+                    self.map_exits[wall_hole] = self.valley_path
+                if style == "entry_cave":
+                    if tile_id == 152:
+                        door = Tile(
+                            (x, y),
+                            [self.door_sprites],
+                            "entry_cave_entrance",
+                        )
+                        self.map_exits[door] = self.entry_cave_path
+
+                if style == "entities":
+                    if tile_id == 394:
+                        self.player_spawn = (x, y)
+                        # The player goes from map to map, it is only created once
+                        if self.player is None:
+                            self.player = Player(
+                                self.get_player_spawn(),
+                                [self.visible_sprites],
+                                self.obstacle_sprites,
+                                self.door_sprites,
+                                self.create_attack,
+                                self.destroy_attack,
+                                self.create_magic,
                             )
-                        if style == "trees":
-                            surf = graphics["objects"][int(col)]
-                            Tile(
-                                (x, y),
-                                [
-                                    self.visible_sprites,
-                                    self.obstacle_sprites,
-                                    self.interactable_sprites,
-                                ],
-                                "tree",
-                                surf,
-                            )
-                        if style == "wall_hole":
-                            if self.cmd_line.entry_cave_opened:
-                                wall_image = pygame.image.load(
-                                    "src/images/map/doors/315.png"
-                                )
-                            else:
-                                wall_image = pygame.image.load(
-                                    "src/images/map/doors/217.png"
-                                )
-                            Tile(
-                                (x, y),
-                                [self.visible_sprites, self.interactable_sprites],
-                                "wall_hole",
-                                wall_image,
-                            )
-                        if style == "entry_cave":
-                            if col == "152":
-                                Tile(
-                                    (x, y),
-                                    [self.door_sprites],
-                                    "entry_cave_entrance",
-                                )
-
-                        if style == "entities":
-                            if col == "394":
-                                if (
-                                    self.cmd_line.previous_map_state == "entry_cave"
-                                    and self.cmd_line.map_state == "valley"
-                                ):
-                                    x = 43 * TILESIZE
-                                    y = 17 * TILESIZE
-                                elif (
-                                    self.cmd_line.previous_map_state == "valley"
-                                    and self.cmd_line.map_state == "entry_cave"
-                                ):
-                                    x = 4 * TILESIZE
-                                    y = 8 * TILESIZE
-                                self.player = Player(
-                                    (x, y),
-                                    [self.visible_sprites],
-                                    self.obstacle_sprites,
-                                    self.door_sprites,
-                                    self.create_attack,
-                                    self.destroy_attack,
-                                    self.create_magic,
-                                )
-                            else:
-                                if col == "390":
-                                    monster_name = "bamboo"
-                                elif col == "391":
-                                    monster_name = "spirit"
-                                elif col == "392":
-                                    monster_name = "raccoon"
-                                elif col == "393":
-                                    monster_name = "squid"
-                                Enemy(
-                                    monster_name,
-                                    (x, y),
-                                    [self.visible_sprites, self.attackable_sprites],
-                                    self.obstacle_sprites,
-                                    self.damage_player,
-                                    self.trigger_death_particles,
-                                    self.add_exp,
-                                )
+                    else:
+                        if tile_id == 390:
+                            monster_name = "bamboo"
+                        elif tile_id == 391:
+                            monster_name = "spirit"
+                        elif tile_id == 392:
+                            monster_name = "raccoon"
+                        elif tile_id == 393:
+                            monster_name = "squid"
+                        Enemy(
+                            monster_name,
+                            (x, y),
+                            [
+                                self.visible_sprites,
+                                self.attackable_sprites,
+                                self.enemy_sprites,
+                            ],
+                            self.obstacle_sprites,
+                            self.damage_player,
+                            self.trigger_death_particles,
+                            self.add_exp,
+                        )
+
+    def get_player_spawn(self):
+        """Return the position where the player enters the map, given the previous map."""
+        if (
+            self.cmd_line.previous_map_state == "entry_cave"
+            and self.cmd_line.map_state == "valley"
+        ):
+            return (43 * TILESIZE, 17 * TILESIZE)
+        elif (
+            self.cmd_line.previous_map_state == "valley"
+            and self.cmd_line.map_state == "entry_cave"
+        ):
+            return (4 * TILESIZE, 8 * TILESIZE)
+        return self.player_spawn
 
     def create_attack(self):
         """Create attack based on current attack."""
@@ -240,7 +310,7 @@ class Level:
         if self.player.vulnerable:
             self.player.health -= amount
             self.player.vulnerable = False
-            self.player.hurt_time = pygame.time.get_ticks()
+            self.player.hurt_time = game_clock.get_ticks()
 
             # Spawn particles
             self.animation_player.create_particles(
@@ -255,28 +325,45 @@ class Level:
         """Gain player experience."""
         self.player.exp += amount
 
+    def preload_next_map(self):
+        """Start preloading the map behind the exits the player is close to."""
+        player_pos = pygame.math.Vector2(self.player.rect.center)
+        for exit_tile, map_path in self.map_exits.items():
+            distance = player_pos.distance_to(exit_tile.rect.center)
+            if distance < MAP_PRELOAD_RADIUS and not assets.has_image(map_path, False):
+                self.map_preloader.preload(map_path)
+
     def toggle_menu(self):
         """Open upgrade menu with the game being paused."""
         self.game_paused = not self.game_paused
 
     def run(self):
         """Run all Level interactions, draw and display UI, sprites and CL."""
-        # Display sprites and UI
-        self.visible_sprites.custom_draw(self.player)
-        self.ui.display(self.player)
+        # Display sprites and UI, unless the command line hides them
+        if not self.cmd_line.full_screen:
+            with profiler.section("camera.draw"):
+                self.visible_sprites.custom_draw(self.player)
+            with profiler.section("ui.display"):
+                self.ui.display(self.player)
 
         if self.game_paused:
             # Display menu when game is paused
             self.upgrade.display()
+            self.room_text.pause_animated_text()
         else:
             # Game actions
-            self.visible_sprites.update()
-            self.visible_sprites.player_update(self.cmd_line.input.focus)
-            self.visible_sprites.enemy_update(self.player)
-            self.player_attack_logic()
+            with profiler.section("sprites.update"):
+                self.visible_sprites.update()
+                self.visible_sprites.player_update(self.cmd_line.input.focus)
+            with profiler.section("enemy_update"):
+                self.enemy_sprites.enemy_update(self.player)
+            with profiler.section("attack_logic"):
+                self.player_attack_logic()
+            self.preload_next_map()
 
             # Command Line actions
-            self.cmd_line.run(self.room_text)
+            with profiler.section("cl.run"):
+                self.cmd_line.run(self.room_text)
 
 
 class YsortedCameraGroup(pygame.sprite.Group):
@@ -292,12 +379,141 @@ class YsortedCameraGroup(pygame.sprite.Group):
         self.offset = pygame.math.Vector2()
 
         # Create floor
-        self.floor_surf = pygame.image.load(ground_map_path).convert()
+        self.floor_surf = import_image(ground_map_path, alpha=False)
         self.floor_rect = self.floor_surf.get_rect(topleft=(0, 0))
 
         # Create fog object
         self.fog = Fog(self.floor_rect)
 
+        # Static tiles are indexed in a spatial grid to find the ones on screen. The rest of
+        # sprites (player, enemies, particles, weapons) are checked one by one.
+        self.static_sprites = SpatialGrid("rect")
+        self.dynamic_sprites = {}
+
+        # All sprites are kept sorted by their depth key (centery, insertion order)
+        self.sprite_counter = count()
+        self.depth_keys = {}
+        self.ysorted_keys = []
+        self.ysorted_sprites = []
+
+        # Static decoration tiles are pre-composited in chunks of tiles sharing the same depth
+        # (centery) so they are drawn with a single blit while keeping the depth order.
+        self.tile_chunks = {}
+        self.dirty_chunks = {}
+
+    @staticmethod
+    def get_chunk_key(tile):
+        """Return the key of the chunk where a tile is baked."""
+        chunk_size = CHUNK_SIZE * TILESIZE
+        return (
+            tile.rect.x // chunk_size,
+            tile.rect.y // chunk_size,
+            tile.rect.centery,
+        )
+
+    def add_to_chunk(self, tile):
+        """Add tile to its chunk, creating the chunk if needed."""
+        key = self.get_chunk_key(tile)
+        if key not in self.tile_chunks:
+            self.tile_chunks[key] = TileChunk(key, next(self.sprite_counter))
+        chunk = self.tile_chunks[key]
+        chunk.add_tile(tile)
+        self.dirty_chunks[chunk] = None
+
+    def remove_from_chunk(self, tile):
+        """Remove tile from its chunk. The chunk will be baked again on the next draw."""
+        chunk = self.tile_chunks[self.get_chunk_key(tile)]
+        chunk.remove_tile(tile)
+        self.dirty_chunks[chunk] = None
+
+    def bake_dirty_chunks(self):
+        """Bake again the chunks whose tiles have changed and update their indices."""
+        for chunk in self.dirty_chunks:
+            if chunk in self.depth_keys:
+                self.static_sprites.remove(chunk)
+                self.remove_depth(chunk)
+            if chunk.tiles:
+                chunk.bake()
+                self.static_sprites.add(chunk)
+                self.insert_depth(chunk, (chunk.rect.centery, chunk.order))
+            else:
+                del self.tile_chunks[chunk.key]
+        self.dirty_chunks = {}
+
+    def add_internal(self, sprite, layer=None):
+        """Add sprite to the group, the static or dynamic sprites and the depth order."""
+        super().add_internal(sprite, layer)
+        if isinstance(sprite, Tile) and (
+            BAKE_STATIC_TILES and sprite.sprite_type in BAKED_TILE_TYPES
+        ):
+            self.add_to_chunk(sprite)
+        elif isinstance(sprite, Tile):
+            self.static_sprites.add(sprite)
+            self.insert_depth(sprite, (sprite.rect.centery, next(self.sprite_counter)))
+        else:
+            # Dynamic sprites may join the group before having a rect. They are inserted in
+            # the depth order on the next draw.
+            self.dynamic_sprites[sprite] = next(self.sprite_counter)
+
+    def remove_internal(self, sprite):
+        """Remove sprite from the group, the static or dynamic sprites and the depth order."""
+        super().remove_internal(sprite)
+        if sprite in self.dynamic_sprites:
+            del self.dynamic_sprites[sprite]
+        elif sprite in self.static_sprites:
+            self.static_sprites.remove(sprite)
+        else:
+            self.remove_from_chunk(sprite)
+        if sprite in self.depth_keys:
+            self.remove_depth(sprite)
+
+    def insert_depth(self, sprite, key):
+        """Insert sprite in the depth order with a given key."""
+        index = bisect_right(self.ysorted_keys, key)
+        self.ysorted_keys.insert(index, key)
+        self.ysorted_sprites.insert(index, sprite)
+        self.depth_keys[sprite] = key
+
+    def remove_depth(self, sprite):
+        """Remove sprite from the depth order."""
+        index = bisect_left(self.ysorted_keys, self.depth_keys.pop(sprite))
+        del self.ysorted_keys[index]
+        del self.ysorted_sprites[index]
+
+    def update_depth(self):
+        """Insert new dynamic sprites and move the ones whose centery has changed."""
+        for sprite, order in self.dynamic_sprites.items():
+            if sprite not in self.depth_keys:
+                self.insert_depth(sprite, (sprite.rect.centery, order))
+            elif self.depth_keys[sprite][0] != sprite.rect.centery:
+                self.remove_depth(sprite)
+                self.insert_depth(sprite, (sprite.rect.centery, order))
+
+    def get_sprites_on_screen(self, screen_rect):
+        """Return the sprites on screen sorted by their depth."""
+        visible_sprites = {
+            sprite
+            for sprite in self.static_sprites.get_sprites_in_rect(screen_rect)
+            if sprite.rect.colliderect(screen_rect)
+        }
+        visible_sprites.update(
+            sprite
+            for sprite in self.dynamic_sprites
+            if sprite.rect.colliderect(screen_rect)
+        )
+        if not visible_sprites:
+            return []
+
+        # Only walk the depth order between the first and last visible sprites
+        depths = [self.depth_keys[sprite] for sprite in visible_sprites]
+        index_ini = bisect_left(self.ysorted_keys, min(depths))
+        index_end = bisect_right(self.ysorted_keys, max(depths))
+        return [
+            sprite
+            for sprite in self.ysorted_sprites[index_ini:index_end]
+            if sprite in visible_sprites
+        ]
+
     def custom_draw(self, player):
         """Custom draw for sprites."""
         # Get offset
@@ -312,23 +528,17 @@ class YsortedCameraGroup(pygame.sprite.Group):
         floor_offset_pos = self.floor_rect.topleft - self.offset
         self.display_surface.blit(self.floor_surf, floor_offset_pos)
 
-        # Draw sprites with offset
-        for sprite in sorted(self.sprites(), key=lambda sprite: sprite.rect.centery):
+        # Draw sprites on screen with offset
+        self.bake_dirty_chunks()
+        self.update_depth()
+        screen_rect = self.display_surface.get_rect(topleft=self.offset)
+        for sprite in self.get_sprites_on_screen(screen_rect):
             offset_pos = sprite.rect.topleft - self.offset
             self.display_surface.blit(sprite.image, offset_pos)
 
         # Display fog
-        self.fog.draw(self.display_surface, self.offset)
-
-    def enemy_update(self, player):
-        """Update enemy sprites."""
-        enemy_sprites = [
-            sprite
-            for sprite in self.sprites()
-            if hasattr(sprite, "sprite_type") and sprite.sprite_type == "enemy"
-        ]
-        for enemy in enemy_sprites:
-            enemy.enemy_update(player)
+        with profiler.section("fog.draw"):
+            self.fog.draw(self.display_surface, self.offset)
 
     def player_update(self, cl_focus):
         """Update player sprite."""
@@ -5,6 +5,7 @@ from random import randint
 import pygame
 
 from src.settings import TILESIZE
+from src.sound_bank import sound_bank
 
 
 class MagicPlayer:
@@ -14,8 +15,8 @@ class MagicPlayer:
         """Initialize object."""
         self.animation_player = animation_player
         self.sounds = {  ## TODO: Move this to settings
-            "heal": pygame.mixer.Sound("src/audio/heal.wav"),
-            "flame": pygame.mixer.Sound("src/audio/Fire.wav"),
+            "heal": sound_bank.get("src/audio/heal.wav", "magic"),
+            "flame": sound_bank.get("src/audio/Fire.wav", "magic"),
         }
 
     def heal(self, player, strength, cost, groups):
@@ -0,0 +1,83 @@
+"""Module containing the map layouts compiled from the csv files exported by Tiled."""
+
+from array import array
+from csv import reader
+from os import makedirs, path, stat
+import struct
+
+from src.settings import MAP_CACHE_PATH
+
+EMPTY_TILE = -1
+
+# Cached layout header: mtime of the csv file (ns), number of rows and columns
+HEADER = struct.Struct("<qII")
+
+
+class MapLayout:
+    """Layout of a map layer stored as a flat array of int16 tile ids.
+
+    The layout may cover only a region of the map, whose top left tile is at origin.
+    """
+
+    def __init__(self, rows, cols, data, origin=(0, 0)):
+        """Initialize object."""
+        self.rows = rows
+        self.cols = cols
+        self.data = data
+        self.origin = origin
+
+    def __getitem__(self, pos):
+        """Return the tile id at a (row, col) position of the map."""
+        i_row, i_col = pos
+        return self.data[(i_row - self.origin[0]) * self.cols + i_col - self.origin[1]]
+
+    def get_tiles(self):
+        """Yield the (row, col, tile id) of the non empty tiles of the layout."""
+        top, left = self.origin
+        cols = self.cols
+        for i, tile_id in enumerate(self.data):
+            if tile_id != EMPTY_TILE:
+                yield top + i // cols, left + i % cols, tile_id
+
+    @classmethod
+    def from_csv(cls, csv_path):
+        """Parse a layout from a csv file."""
+        with open(csv_path) as level_map:
+            rows = [row for row in reader(level_map, delimiter=",") if row]
+        cols = max((len(row) for row in rows), default=0)
+        data = array("h")
+        for row in rows:
+            data.extend(int(tile_id) for tile_id in row)
+            data.extend([EMPTY_TILE] * (cols - len(row)))
+        return cls(len(rows), cols, data)
+
+
+def get_cache_path(csv_path, cache_path=MAP_CACHE_PATH):
+    """Return the path of the compiled layout of a csv file."""
+    return path.join(cache_path, path.splitext(path.basename(csv_path))[0] + ".bin")
+
+
+def load_layout(csv_path, cache_path=MAP_CACHE_PATH):
+    """Load the layout of a csv file, compiling it first if its cache is missing or stale.
+
+    The compiled layout stores the mtime of the csv file it was built from and is regenerated
+    whenever that mtime changes.
+    """
+    csv_mtime = stat(csv_path).st_mtime_ns
+    layout_path = get_cache_path(csv_path, cache_path)
+    try:
+        with open(layout_path, "rb") as layout_file:
+            mtime, rows, cols = HEADER.unpack(layout_file.read(HEADER.size))
+            if mtime == csv_mtime:
+                data = array("h")
+                data.fromfile(layout_file, rows * cols)
+                return MapLayout(rows, cols, data)
+    except (OSError, EOFError, struct.error):
+        pass
+
+    layout = MapLayout.from_csv(csv_path)
+    makedirs(cache_path, exist_ok=True)
+    with open(layout_path, "wb") as layout_file:
+        layout_file.write(HEADER.pack(csv_mtime, layout.rows, layout.cols))
+        layout.data.tofile(layout_file)
+    return layout
@@ -0,0 +1,50 @@
+"""Module containing the background preloader of the next map."""
+
+from threading import Thread
+
+import pygame
+
+
+class MapPreloader:
+    """Preloader decoding the floor image of the next map in a worker thread.
+
+    The decoded floor is converted to the display format in the worker too, so swapping maps
+    on the main thread only has to pick it up.
+    """
+
+    def __init__(self):
+        """Initialize object."""
+        self.map_path = None
+        self.floor_surf = None
+        self.thread = None
+
+    def worker(self, map_path):
+        """Decode the floor image of a map. Failures are left to the synchronous load."""
+        try:
+            self.floor_surf = pygame.image.load(map_path).convert()
+        except (OSError, pygame.error):
+            self.floor_surf = None
+
+    def preload(self, map_path):
+        """Start preloading a map unless it is already being preloaded."""
+        if map_path == self.map_path:
+            return
+        self.discard()
+        self.map_path = map_path
+        self.thread = Thread(target=self.worker, args=(map_path,), daemon=True)
+        self.thread.start()
+
+    def discard(self):
+        """Wait for the current preload, if any, and drop its result."""
+        if self.thread is not None:
+            self.thread.join()
+        self.map_path = self.floor_surf = self.thread = None
+
+    def take(self, map_path):
+        """Return the preloaded floor of a map, waiting for it if needed, or None."""
+        if map_path != self.map_path:
+            return None
+        self.thread.join()
+        floor_surf = self.floor_surf
+        self.discard()
+        return floor_surf
@@ -7,9 +7,12 @@ import pygame.locals as locals
 
 from src.entity import Entity
 from src.events_definition import ENTRY_CAVE
+from src.game_clock import game_clock
+from src.keyboard import keyboard
 from src.settings import HITBOX_OFFSET, magic_data, weapon_data
+from src.sound_bank import sound_bank
 from src.tile_interaction import PLAYER_ACTION_RADIUS, TILE_PRIORITY
-from src.utils import import_folder
+from src.utils import import_folder, import_image
 
 
 class Player(Entity):
@@ -28,7 +31,7 @@ class Player(Entity):
         """Initialize player object."""
         super().__init__(groups)
         self.sprite_type = "player"
-        self.image = pygame.image.load("src/images/player/S/S_0.png").convert_alpha()
+        self.image = import_image("src/images/player/S/S_0.png")
         self.rect = self.image.get_rect(topleft=pos)
         self.hitbox = self.rect.inflate(-6, HITBOX_OFFSET["player"])
 
@@ -89,8 +92,7 @@ class Player(Entity):
         self.invulnerablility_duration = 500
 
         # Sound effects
-        self.weapon_attack_sound = pygame.mixer.Sound("src/audio/sword.wav")
-        self.weapon_attack_sound.set_volume(0.4)
+        self.weapon_attack_sound = sound_bank.get("src/audio/sword.wav", "player", 0.4)
 
     def import_player_assets(self):
         """Import player images to construct walking animations."""
@@ -129,7 +131,7 @@ class Player(Entity):
     def input(self):
         """Get user's input from keyboard."""
         if not self.attacking:
-            keys_pressed = pygame.key.get_pressed()
+            keys_pressed = keyboard.get_pressed()
 
             if keys_pressed[locals.K_RIGHT] or keys_pressed[locals.K_LEFT]:
                 self.rotating = True
@@ -215,14 +217,14 @@ class Player(Entity):
             # Attack input
             if keys_pressed[pygame.K_SPACE]:
                 self.attacking = True
-                self.attack_time = pygame.time.get_ticks()
+                self.attack_time = game_clock.get_ticks()
                 self.create_attack()
                 self.weapon_attack_sound.play()
 
             # Magic input
             if keys_pressed[pygame.K_LCTRL]:
                 self.attacking = True
-                self.attack_time = pygame.time.get_ticks()
+                self.attack_time = game_clock.get_ticks()
                 style = list(magic_data.keys())[self.magic_index]
                 strength = (
                     list(magic_data.values())[self.magic_index]["strength"]
@@ -234,7 +236,7 @@ class Player(Entity):
             # Switch weapon
             if keys_pressed[pygame.K_q] and self.can_switch_weapon:
                 self.can_switch_weapon = False
-                self.weapon_switch_time = pygame.time.get_ticks()
+                self.weapon_switch_time = game_clock.get_ticks()
                 if self.weapon_index < len(list(weapon_data.keys())) - 1:
                     self.weapon_index += 1
                 else:
@@ -245,7 +247,7 @@ class Player(Entity):
             # Switch magic
             if keys_pressed[pygame.K_e] and self.can_switch_magic:
                 self.can_switch_magic = False
-                self.magic_switch_time = pygame.time.get_ticks()
+                self.magic_switch_time = game_clock.get_ticks()
                 if self.magic_index < len(list(magic_data.keys())) - 1:
                     self.magic_index += 1
                 else:
@@ -276,7 +278,7 @@ class Player(Entity):
 
     def cooldowns(self):
         """Set attack cooldowns."""
-        current_time = pygame.time.get_ticks()
+        current_time = game_clock.get_ticks()
 
         if self.attacking:
             if (
@@ -345,6 +347,11 @@ class Player(Entity):
         else:
             self.energy = self.stats["energy"]
 
+    def set_position(self, pos):
+        """Move the player to a position, e.g. when entering a map."""
+        self.rect.topleft = pos
+        self.hitbox = self.rect.inflate(-6, HITBOX_OFFSET["player"])
+
     def check_doors(self):
         """Check if the player collides with a door."""
         for sprite in self.door_sprites:
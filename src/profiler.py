@@ -0,0 +1,198 @@
+"""Module containing the frame profiler timing the subsystems of the game."""
+
+from collections import deque
+from contextlib import nullcontext
+import csv
+import json
+from time import perf_counter_ns
+
+import pygame
+
+from src.settings import (
+    FPS,
+    PROFILER_FONT_SIZE,
+    PROFILER_HISTORY,
+    PROFILER_OUTPUT,
+    PROFILER_REFRESH,
+    PROFILER_TRACE_LENGTH,
+    TEXT_COLOR,
+    UI_FONT,
+)
+
+NO_SECTION = nullcontext()
+
+
+class ProfilerSection:
+    """Timed section of a frame, idle if it is spent waiting rather than working."""
+
+    def __init__(self, profiler, name, idle=False):
+        """Initialize object."""
+        self.profiler = profiler
+        self.name = name
+        self.idle = idle
+        self.start = None
+
+    def __enter__(self):
+        """Start timing the section."""
+        self.start = perf_counter_ns()
+
+    def __exit__(self, *_):
+        """Stop timing the section and store its duration."""
+        self.profiler.add_timing(
+            self.name, self.start, perf_counter_ns() - self.start, self.idle
+        )
+
+
+class FrameProfiler:
+    """Profiler timing named sections of each frame.
+
+    Sections are timed with `with profiler.section(name):`, which costs a single attribute
+    check while the profiler is disabled. The frame total only counts the time spent working,
+    not the idle sections (`profiler.section(name, idle=True)`) such as waiting for the next
+    frame. When enabled, it keeps the durations of the last PROFILER_HISTORY frames to compute
+    rolling percentiles, draws them in a corner of the screen, and keeps the last
+    PROFILER_TRACE_LENGTH timings to be dumped as a CSV file and a Chrome trace
+    (chrome://tracing, Perfetto).
+    """
+
+    def __init__(self):
+        """Initialize object."""
+        self.enabled = False
+        self.frame = 0
+        self.frame_start = None
+        self.frame_timings = {}
+        self.frame_idle = 0
+        self.history = {}
+        self.trace = deque(maxlen=PROFILER_TRACE_LENGTH)
+        self.font = None
+        self.overlay = None
+
+    def enable(self):
+        """Start profiling."""
+        self.enabled = True
+        self.frame_start = perf_counter_ns()
+
+    def disable(self):
+        """Stop profiling. The timings are kept until dumped."""
+        self.enabled = False
+        self.overlay = None
+
+    def section(self, name, idle=False):
+        """Return a context manager timing a section of the frame."""
+        if not self.enabled:
+            return NO_SECTION
+        return ProfilerSection(self, name, idle)
+
+    def add_timing(self, name, start, duration, idle=False):
+        """Add the duration (ns) of a section run in the current frame."""
+        self.frame_timings[name] = self.frame_timings.get(name, 0) + duration
+        if idle:
+            self.frame_idle += duration
+        self.trace.append((self.frame, name, start, duration))
+
+    def end_frame(self):
+        """Store the timings of the frame that just ended, including its total working time."""
+        if not self.enabled:
+            return
+        frame_end = perf_counter_ns()
+        self.add_timing(
+            "frame", self.frame_start, frame_end - self.frame_start - self.frame_idle
+        )
+        for name, duration in self.frame_timings.items():
+            if name not in self.history:
+                self.history[name] = deque(maxlen=PROFILER_HISTORY)
+            self.history[name].append(duration / 1e6)
+        self.frame_timings = {}
+        self.frame_idle = 0
+        self.frame += 1
+        self.frame_start = frame_end
+        if self.frame % PROFILER_REFRESH == 0:
+            self.overlay = None
+
+    def get_percentiles(self, name, percentiles=(50, 95, 99)):
+        """Return the rolling percentiles of the duration (ms) of a section."""
+        durations = sorted(self.history[name])
+        return [
+            durations[min(len(durations) - 1, len(durations) * p // 100)]
+            for p in percentiles
+        ]
+
+    def render_overlay(self):
+        """Render the frame time graph and the percentiles of each section."""
+        if self.font is None:
+            self.font = pygame.font.Font(UI_FONT, PROFILER_FONT_SIZE)
+        names = sorted(self.history, key=lambda name: name != "frame")
+        lines = [f"{'ms':<14}   p50   p95   p99"] + [
+            f"{name[:14]:<14}"
+            + "".join(f"{p:6.1f}" for p in self.get_percentiles(name))
+            for name in names
+        ]
+        texts = [self.font.render(line, False, TEXT_COLOR) for line in lines]
+        line_height = self.font.get_linesize()
+        graph_height = 4 * line_height
+        width = max(text.get_width() for text in texts)
+        overlay = pygame.Surface(
+            (width, graph_height + len(texts) * line_height), pygame.SRCALPHA
+        )
+        overlay.fill((0, 0, 0, 160))
+
+        # Frame time graph, one pixel column per frame, scaled to two frame budgets
+        budget = 1000 / FPS
+        frame_times = list(self.history.get("frame", []))[-width:]
+        for x, frame_time in enumerate(frame_times, width - len(frame_times)):
+            height = min(graph_height, frame_time / (2 * budget) * graph_height)
+            color = "green" if frame_time <= budget else "red"
+            pygame.draw.line(
+                overlay, color, (x, graph_height), (x, graph_height - height)
+            )
+        pygame.draw.line(
+            overlay, "white", (0, graph_height // 2), (width, graph_height // 2)
+        )
+
+        for i, text in enumerate(texts):
+            overlay.blit(text, (0, graph_height + i * line_height))
+        return overlay
+
+    def draw(self, surface):
+        """Draw the profiler overlay in the top right corner of a surface.
+
+        Return the rect of the overlay, or None if it is not drawn.
+        """
+        if not self.enabled or not self.history:
+            return None
+        if self.overlay is None:
+            self.overlay = self.render_overlay()
+        return surface.blit(
+            self.overlay, self.overlay.get_rect(topright=surface.get_rect().topright)
+        )
+
+    def dump(self, path=PROFILER_OUTPUT):
+        """Write the recorded timings to path.csv and path.json (Chrome trace format)."""
+        if not self.trace:
+            return
+        with open(f"{path}.csv", "w", newline="") as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(["frame", "section", "start_us", "duration_ms"])
+            for frame, name, start, duration in self.trace:
+                writer.writerow([frame, name, start // 1000, duration / 1e6])
+        with open(f"{path}.json", "w") as json_file:
+            json.dump(
+                {
+                    "traceEvents": [
+                        {
+                            "name": name,
+                            "ph": "X",
+                            "ts": start / 1000,
+                            "dur": duration / 1000,
+                            "pid": 0,
+                            "tid": 0,
+                            "args": {"frame": frame},
+                        }
+                        for frame, name, start, duration in self.trace
+                    ]
+                },
+                json_file,
+            )
+
+
+profiler = FrameProfiler()
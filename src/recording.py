@@ -0,0 +1,161 @@
+"""Module containing the recorder and player of input logs.
+
+An input log stores the seed of the random number generator and, for every frame, the ticks
+of the game clock, the keys found pressed by the game and the events it handled. Replaying
+a log on a game created with the same seed reproduces the recorded session frame by frame.
+
+Log layout (little endian):
+
+    header: magic, format version, seed
+    frame:  ticks, number of pressed keys, number of events
+            pressed key codes
+            events: type, key, mod, length of the text, utf-8 text
+"""
+
+from array import array
+import os
+import struct
+import sys
+
+import pygame
+
+from src.game_clock import game_clock
+from src.keyboard import keyboard
+
+MAGIC = b"CLRL"
+VERSION = 1
+HEADER = struct.Struct("<4sBQ")
+FRAME = struct.Struct("<IHH")
+EVENT = struct.Struct("<IiHB")
+
+KEY_EVENTS = (pygame.KEYDOWN, pygame.KEYUP)
+
+
+def is_recorded(event):
+    """Return whether an event is stored in input logs (keyboard, text or game event)."""
+    return (
+        event.type in KEY_EVENTS
+        or event.type == pygame.TEXTINPUT
+        or pygame.USEREVENT <= event.type < pygame.NUMEVENTS
+    )
+
+
+def encode_event(event):
+    """Return the bytes of an event in an input log."""
+    if event.type in KEY_EVENTS:
+        key, mod, text = event.key, event.mod, event.unicode
+    else:
+        key, mod, text = 0, 0, getattr(event, "text", "")
+    text = text.encode()
+    return EVENT.pack(event.type, key, mod, len(text)) + text
+
+
+def decode_event(log, offset):
+    """Return the event stored at an offset of an input log and the offset after it."""
+    event_type, key, mod, text_length = EVENT.unpack_from(log, offset)
+    offset += EVENT.size
+    text = log[offset : offset + text_length].decode()
+    offset += text_length
+    if event_type in KEY_EVENTS:
+        event = pygame.event.Event(event_type, key=key, mod=mod, unicode=text)
+    elif event_type == pygame.TEXTINPUT:
+        event = pygame.event.Event(event_type, text=text)
+    else:
+        event = pygame.event.Event(event_type)
+    return event, offset
+
+
+def get_random_seed():
+    """Return a new seed for the random number generator."""
+    return int.from_bytes(os.urandom(8), "little")
+
+
+class InputRecorder:
+    """Recorder writing the input of a game session to a log file."""
+
+    def __init__(self, path, seed):
+        """Initialize object, writing the header of the log."""
+        self.log = open(path, "wb")
+        self.log.write(HEADER.pack(MAGIC, VERSION, seed))
+        self.start_ticks = None
+
+    def start(self):
+        """Make the game clock stand still during each frame and start recording keys.
+
+        Start the recorder before creating the game, so that the game starts at tick zero as
+        it does when replayed.
+        """
+        game_clock.start_simulation()
+        keyboard.start_recording()
+        self.start_ticks = pygame.time.get_ticks()
+
+    def start_frame(self):
+        """Set the game clock to the real time elapsed since the recording started."""
+        game_clock.set_ticks(pygame.time.get_ticks() - self.start_ticks)
+
+    def end_frame(self, events):
+        """Write the ticks, pressed keys and events of the frame just run."""
+        keys = array("i", sorted(keyboard.pop_recorded_keys()))
+        events = [event for event in events if is_recorded(event)]
+        self.log.write(FRAME.pack(game_clock.get_ticks(), len(keys), len(events)))
+        if sys.byteorder == "big":
+            keys.byteswap()
+        self.log.write(keys.tobytes())
+        for event in events:
+            self.log.write(encode_event(event))
+
+    def close(self):
+        """Stop recording and close the log."""
+        keyboard.stop_recording()
+        self.log.close()
+
+
+class InputReplay:
+    """Player of an input log."""
+
+    def __init__(self, seed, frames):
+        """Initialize object with the seed and the (ticks, keys, events) of each frame."""
+        self.seed = seed
+        self.frames = frames
+        self.pressed_keys = None
+
+    def __len__(self):
+        """Return the number of frames of the log."""
+        return len(self.frames)
+
+    @classmethod
+    def from_file(cls, path):
+        """Read an input log."""
+        with open(path, "rb") as log_file:
+            log = log_file.read()
+        magic, version, seed = HEADER.unpack_from(log)
+        assert (magic, version) == (MAGIC, VERSION), f"{path} is not an input log"
+
+        frames = []
+        offset = HEADER.size
+        while offset < len(log):
+            ticks, num_keys, num_events = FRAME.unpack_from(log, offset)
+            offset += FRAME.size
+            keys = array("i")
+            keys.frombytes(log[offset : offset + num_keys * keys.itemsize])
+            if sys.byteorder == "big":
+                keys.byteswap()
+            offset += num_keys * keys.itemsize
+            events = []
+            for _ in range(num_events):
+                event, offset = decode_event(log, offset)
+                events.append(event)
+            frames.append((ticks, set(keys), events))
+        return cls(seed, frames)
+
+    def start(self):
+        """Replace the real clock and keyboard by the recorded ones."""
+        game_clock.start_simulation()
+        self.pressed_keys = keyboard.start_script()
+
+    def get_events(self, frame):
+        """Set the clock and keys of a frame and return its events."""
+        ticks, keys, events = self.frames[frame]
+        game_clock.set_ticks(ticks)
+        self.pressed_keys.keys = set(keys)
+        return events
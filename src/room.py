@@ -4,6 +4,7 @@ import pygame
 
 from src.commands import write_command_response
 from src.objects import NPC, BreakableWall, Door, Wall
+from src.utils import import_image
 
 
 class Room:
@@ -23,9 +24,7 @@ class Room:
         self.n_cells_x = screen.surface.get_width() // self.cells_size[0]
         self.n_cells_y = screen.surface.get_height() // self.cells_size[1]
         ## TODO: move the loading image and scale it properly
-        self.img_guide = pygame.image.load(
-            "src/images/NPCs/npc_guide.jpg"
-        ).convert_alpha()
+        self.img_guide = import_image("src/images/NPCs/npc_guide.jpg")
         self.img_guide = pygame.transform.scale(self.img_guide, (30, 30))
         # self._check_map_size()
         self._build()
@@ -1,8 +1,10 @@
 """Module containing the rooms' descriptions and how they are displayed."""
 
-from random import randint
+from itertools import accumulate
 
-import pygame
+from src.game_clock import game_clock
+from src.settings import ROOM_TEXT_LINE_PAUSE, ROOM_TEXT_MAX_STEP, ROOM_TEXT_SPEED
+from src.sound_bank import sound_bank
 
 ENTRY_CAVE_TEXT = (
     "As you awaken in a dimly lit room, confusion sets in. Your surroundings are unfamiliar "
@@ -25,7 +27,14 @@ VALLEY_TEXT = (
 
 
 class RoomText:
-    """Room text object displaying the room's description."""
+    """Room text object displaying the room's description.
+
+    The description is typed into the CL history at a fixed number of letters per second of
+    the game clock, whatever the frame rate: several letters are typed in a frame if needed.
+    Only the time between consecutive updates is counted, so the text does not jump ahead
+    after the game was paused. Its lines are split once, with the number of letters typed
+    when each of them starts.
+    """
 
     def __init__(self, cmd_line):
         """Initialize object."""
@@ -36,73 +45,100 @@ class RoomText:
             "valley": VALLEY_TEXT,
         }
         self.room_first_entry = dict.fromkeys(self.room_text_dict.keys(), True)
-        self.update_text = True
-        self.past_updated_text = 0
-        self.update_text_speed = 20
-        self.letter_counter = 0
+        self.text_speed = ROOM_TEXT_SPEED
+        self.room_text = []
+        self.line_offsets = []
         self.line_counter = 0
-        self.prev_value = ""
-        self.is_first = True
-
-        self.keyboard_sound = pygame.mixer.Sound("src/audio/mech_keyboard.wav")
-        self.enter_sound = pygame.mixer.Sound("src/audio/mech_keyboard_enter.wav")
-        self.enter_sound.set_volume(0.1)
-
-    def update_text_cooldowns(self):
-        """Update cooldowns to type the next letter."""
-        current_time = pygame.time.get_ticks()
-        if not self.update_text:
-            if current_time - self.past_updated_text >= (
-                self.update_text_speed - randint(-20, 20)
-            ):
-                self.update_text = True
+        self.letter_counter = 0
+        self.typing_time = None
+        self.last_tick = None
+
+        self.keyboard_sound = sound_bank.get("src/audio/mech_keyboard.wav", "text")
+        self.enter_sound = sound_bank.get(
+            "src/audio/mech_keyboard_enter.wav", "text", 0.1
+        )
 
     def update_room_first_entry(self):
         """Check if current room has been already accessed in the past."""
         if self.room_first_entry[self.cmd_line.map_state]:
-            self.cmd_line.active_player = False
-            self.room_name = self.cmd_line.map_state.upper().replace("_", " ")
-            self.room_text = self.room_text_dict[self.cmd_line.map_state]
-            self.room_text = self.cmd_line.split_long_user_input(self.room_text)
-            self.update_text_cooldowns()
+            if self.typing_time is None:
+                self.start_animated_text()
+            self.update_typing_time()
             self.display_animated_text()
 
-    def display_animated_text(self):
-        """Display text letter by letter directly into the CL history."""
-        # Get the current length of the CL history as starting point
-        if self.is_first:
-            self.prev_line_counter = self.cmd_line.len_history
-            self.is_first = False
+    def start_animated_text(self):
+        """Split the description of the current room in lines and start typing it."""
+        self.cmd_line.active_player = False
+        self.room_name = self.cmd_line.map_state.upper().replace("_", " ")
+        self.room_text = self.cmd_line.split_long_user_input(
+            self.room_text_dict[self.cmd_line.map_state]
+        )
+        # Each line is followed by a pause as long as typing a few letters
+        self.line_offsets = list(
+            accumulate(
+                (len(line) + ROOM_TEXT_LINE_PAUSE for line in self.room_text), initial=0
+            )
+        )
+        self.line_counter = 0
+        self.letter_counter = 0
+        self.typing_time = 0
+
+    def update_typing_time(self):
+        """Add the time elapsed since the last update, up to ROOM_TEXT_MAX_STEP."""
+        tick = game_clock.get_ticks()
+        if self.last_tick is not None:
+            self.typing_time += min(tick - self.last_tick, ROOM_TEXT_MAX_STEP)
+        self.last_tick = tick
+
+    def pause_animated_text(self):
+        """Stop counting the time until the next update, while the game is paused."""
+        self.last_tick = None
+
+    def get_typed_letters(self):
+        """Return the number of letters (and pauses) typed since the start of the text."""
+        # Ticks are whole milliseconds, so the letters are counted to the nearest one
+        return 1 + round(self.typing_time * self.text_speed / 1000)
 
+    def display_animated_text(self):
+        """Display the letters typed since the last frame directly into the CL history."""
         # Write room description as it was typed in a mechanical keyboard
-        if self.update_text == True:
-            self.play_keyboard_sound()
-            self.letter_counter += 1
-            text = self.room_text[self.line_counter][: self.letter_counter]
-            try:
-                self.cmd_line._history[
-                    self.prev_line_counter + self.line_counter
-                ] = text
-            except IndexError:
-                self.cmd_line._history.append(text)
-            self.past_updated_text = pygame.time.get_ticks()
-            if self.letter_counter == len(self.room_text[self.line_counter]) + 2:
-                self.line_counter += 1
-                self.letter_counter = 0
-                if self.line_counter == len(self.room_text):
-                    self.update_text = False
-                    self.is_first = True
-                    self.line_counter = 0
-                    self.room_first_entry[self.cmd_line.map_state] = False
-                    self.keyboard_sound.stop()
-                    self.cmd_line.input.value = ""
-                    self.cmd_line.active_player = True
-                    self.enter_sound.play()
+        typed_letters = self.get_typed_letters()
+        while self.line_counter < len(self.room_text):
+            line = self.room_text[self.line_counter]
+            line_length = len(line) + ROOM_TEXT_LINE_PAUSE
+            letters = min(
+                typed_letters - self.line_offsets[self.line_counter], line_length
+            )
+            if letters <= self.letter_counter:
+                return
+
+            # Each line is added with its first letters and then completed in place
+            if self.letter_counter == 0:
+                self.play_keyboard_sound()
+                self.cmd_line.history.append(line[:letters])
+            elif self.letter_counter < len(line):
+                self.cmd_line.history[-1] = line[:letters]
+            self.letter_counter = letters
+            if letters < line_length:
+                return
+            self.line_counter += 1
+            self.letter_counter = 0
+        self.end_animated_text()
+
+    def end_animated_text(self):
+        """Give the control back to the player once the description is typed."""
+        self.typing_time = None
+        self.last_tick = None
+        self.line_counter = 0
+        self.room_first_entry[self.cmd_line.map_state] = False
+        self.keyboard_sound.stop()
+        self.cmd_line.input.value = ""
+        self.cmd_line.active_player = True
+        self.enter_sound.play()
 
     def play_keyboard_sound(self):
         """Play the sound of a mechanical keyboard typing."""
-        if self.letter_counter == 0:
-            self.keyboard_sound.play(loops=-1)
+        self.keyboard_sound.play(loops=-1)
 
     def display_letter_on_cl(self, prev_value, new_letter):
         """Display room's description."""
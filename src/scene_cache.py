@@ -0,0 +1,78 @@
+"""Module containing the cache keeping the scenes of visited maps resident."""
+
+from collections import OrderedDict
+
+from src.settings import SCENE_CACHE_BUDGET
+
+
+class Scene:
+    """Sprite groups and state of a built map, saved from and restored into the level.
+
+    The player is not part of the scene: the same player goes from map to map.
+    """
+
+    ATTRIBUTES = (
+        "visible_sprites",
+        "obstacle_sprites",
+        "interactable_sprites",
+        "door_sprites",
+        "current_attack",
+        "attack_sprites",
+        "attackable_sprites",
+        "enemy_sprites",
+        "map_exits",
+    )
+
+    def __init__(self, level):
+        """Initialize object saving the current scene of the level."""
+        self.state = {name: getattr(level, name) for name in self.ATTRIBUTES}
+
+    def restore(self, level):
+        """Make the scene the current one of the level."""
+        for name, value in self.state.items():
+            setattr(level, name, value)
+
+    def get_size(self):
+        """Return an estimate of the memory used by the scene images, in bytes.
+
+        Chunks that have not been baked yet (map left before being drawn) hold no image.
+        """
+        camera = self.state["visible_sprites"]
+        surfaces = [camera.floor_surf]
+        surfaces += [
+            chunk.image
+            for chunk in camera.tile_chunks.values()
+            if chunk.image is not None
+        ]
+        return sum(
+            surface.get_bytesize() * surface.get_width() * surface.get_height()
+            for surface in surfaces
+        )
+
+
+class SceneCache:
+    """Least recently used cache of scenes within a memory budget."""
+
+    def __init__(self, budget=SCENE_CACHE_BUDGET):
+        """Initialize object with a memory budget in bytes."""
+        self.budget = budget
+        self.scenes = OrderedDict()
+
+    def put(self, map_path, scene):
+        """Store the scene of a map and return the maps evicted to stay within the budget.
+
+        The scene stored last is never evicted, even if it does not fit in the budget alone.
+        """
+        self.scenes[map_path] = scene
+        self.scenes.move_to_end(map_path)
+        evicted = []
+        size = sum(scene.get_size() for scene in self.scenes.values())
+        while size > self.budget and len(self.scenes) > 1:
+            evicted_path, evicted_scene = self.scenes.popitem(last=False)
+            size -= evicted_scene.get_size()
+            evicted.append(evicted_path)
+        return evicted
+
+    def pop(self, map_path):
+        """Remove and return the scene of a map, or None if it is not cached."""
+        return self.scenes.pop(map_path, None)
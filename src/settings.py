@@ -6,6 +6,31 @@ HEIGHT = 720
 FPS = 60
 TILESIZE = 64
 
+# Static tiles pre-composited in chunks of CHUNK_SIZE x CHUNK_SIZE tiles. Set
+# BAKE_STATIC_TILES to False to draw them one by one.
+BAKE_STATIC_TILES = True
+BAKED_TILE_TYPES = ["grass", "tree"]
+CHUNK_SIZE = 16
+
+# Texture atlas: animation frames of the folders under ATLAS_FOLDERS are packed in sheets of
+# ATLAS_SIZE x ATLAS_SIZE pixels, generated in ATLAS_PATH
+ATLAS_FOLDERS = [
+    "src/images/player",
+    "src/images/monsters",
+    "src/images/particles",
+]
+ATLAS_PATH = "src/images/atlas"
+ATLAS_SIZE = 2048
+
+# Map layouts compiled from the Tiled csv files
+MAP_CACHE_PATH = "src/images/map/cache"
+
+# Distance to an exit of the map from which the next map is preloaded in the background
+MAP_PRELOAD_RADIUS = 6 * TILESIZE
+
+# Memory budget (bytes) of the scenes of visited maps kept resident in the background
+SCENE_CACHE_BUDGET = 256 * 2**20
+
 # Hitbox info for improved visualization
 HITBOX_OFFSET = {
     "player": -26,
@@ -17,6 +42,41 @@ HITBOX_OFFSET = {
     "entry_cave_entrance": 0,
 }
 
+# Sound voices: maximum number of sounds of each category playing at the same time
+SOUND_VOICES = {
+    "music": 1,
+    "player": 2,
+    "magic": 2,
+    "enemy": 6,
+    "text": 2,
+}
+
+# Frame profiler: rolling percentiles over PROFILER_HISTORY frames, overlay refreshed every
+# PROFILER_REFRESH frames and the last PROFILER_TRACE_LENGTH timings dumped on exit to
+# PROFILER_OUTPUT.csv and PROFILER_OUTPUT.json
+PROFILER_HISTORY = 240
+PROFILER_REFRESH = 15
+PROFILER_TRACE_LENGTH = 100_000
+PROFILER_OUTPUT = "perf_trace"
+PROFILER_FONT_SIZE = 10
+
+# Command line history: the last CL_HISTORY_LENGTH lines are kept in memory, and older ones
+# appended to the CL_HISTORY_LOG file if it is not None. The last CL_COMMAND_HISTORY_LENGTH
+# commands can be recalled with the up and down keys.
+CL_HISTORY_LENGTH = 2000
+CL_HISTORY_LOG = None
+CL_COMMAND_HISTORY_LENGTH = 500
+
+# Number of rendered texts (and of measured widths) kept by the text cache
+TEXT_CACHE_SIZE = 256
+
+# Room descriptions are typed in the command line at ROOM_TEXT_SPEED letters per second of
+# the game clock, with a pause as long as ROOM_TEXT_LINE_PAUSE letters after each line.
+# At most ROOM_TEXT_MAX_STEP ms are counted between two frames typing the text
+ROOM_TEXT_SPEED = 60
+ROOM_TEXT_LINE_PAUSE = 2
+ROOM_TEXT_MAX_STEP = 100
+
 # UI settings
 BAR_HEIGHT = 20
 HEALTH_BAR_WIDTH = 200
@@ -0,0 +1,63 @@
+"""Module containing the scripted input of the headless simulation mode.
+
+Input scripts are text files with one key action per line:
+
+    # frame action key
+    0 down d
+    120 up d
+    121 down space
+
+Actions are "down" and "up", and keys are named as in pygame.key.name (e.g. "w", "space",
+"left", "return"). Empty lines and lines starting with # are ignored.
+"""
+
+import pygame
+
+from src.keyboard import keyboard
+
+KEY_EVENTS = {"down": pygame.KEYDOWN, "up": pygame.KEYUP}
+
+
+class InputScript:
+    """Scripted key actions replacing the keyboard in the headless simulation mode."""
+
+    def __init__(self, actions=()):
+        """Initialize object with a list of (frame, action, key name) tuples."""
+        self.actions = {}
+        for frame, action, key_name in actions:
+            assert action in KEY_EVENTS, f"Unknown key action '{action}'"
+            self.actions.setdefault(frame, []).append((action, key_name))
+        self.pressed_keys = None
+
+    @classmethod
+    def from_file(cls, path):
+        """Parse an input script file."""
+        actions = []
+        with open(path) as script:
+            for line in script:
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    frame, action, key_name = line.split(maxsplit=2)
+                    actions.append((int(frame), action, key_name))
+        return cls(actions)
+
+    def start(self):
+        """Replace the real keyboard by the keys pressed by the script."""
+        self.pressed_keys = keyboard.start_script()
+
+    def get_events(self, frame):
+        """Press and release the keys of a frame and return their key events."""
+        events = []
+        for action, key_name in self.actions.get(frame, []):
+            key = pygame.key.key_code(key_name)
+            if action == "down":
+                self.pressed_keys.keys.add(key)
+            else:
+                self.pressed_keys.keys.discard(key)
+            unicode = (
+                " " if key_name == "space" else key_name if len(key_name) == 1 else ""
+            )
+            events.append(
+                pygame.event.Event(KEY_EVENTS[action], key=key, mod=0, unicode=unicode)
+            )
+        return events
@@ -0,0 +1,96 @@
+"""Module containing the sound bank shared by the whole game."""
+
+import pygame
+
+from src.settings import SOUND_VOICES
+
+
+class BankSound:
+    """Sound of the sound bank played in the channels of a category at a given volume."""
+
+    def __init__(self, sound_bank, sound, category, volume):
+        """Initialize object."""
+        self.sound_bank = sound_bank
+        self.sound = sound
+        self.category = category
+        self.volume = volume
+
+    def play(self, loops=0):
+        """Play sound in one of the channels of its category."""
+        return self.sound_bank.play(self, loops)
+
+    def stop(self):
+        """Stop all playbacks of the sound."""
+        self.sound.stop()
+
+
+class SoundBank:
+    """Sound bank loading each sound file once and limiting the voices of each category.
+
+    Each category in SOUND_VOICES gets its own pool of reserved mixer channels, so a category
+    never plays more sounds at once than its number of voices. When all the voices of a
+    category are busy, the one that started playing first is reused.
+    """
+
+    def __init__(self, voices=SOUND_VOICES):
+        """Initialize object with the number of voices of each category."""
+        self.voices = voices
+        self.reset()
+
+    def reset(self):
+        """Drop all sounds and channels, e.g. after the mixer has been initialized again."""
+        self.sounds = {}
+        self.bank_sounds = {}
+        self.channels = None
+
+    def setup_channels(self):
+        """Reserve a pool of mixer channels for each category."""
+        num_channels = sum(self.voices.values())
+        pygame.mixer.set_num_channels(
+            max(num_channels, pygame.mixer.get_num_channels())
+        )
+        pygame.mixer.set_reserved(num_channels)
+
+        self.channels = {}
+        channel_id = 0
+        for category, voices in self.voices.items():
+            self.channels[category] = [
+                pygame.mixer.Channel(i) for i in range(channel_id, channel_id + voices)
+            ]
+            channel_id += voices
+
+    def get(self, path, category, volume=1.0):
+        """Return the shared sound of a file to be played in a category at a given volume."""
+        assert category in self.voices, f"Unknown sound category '{category}'"
+        key = (path, category, volume)
+        if key not in self.bank_sounds:
+            if path not in self.sounds:
+                self.sounds[path] = pygame.mixer.Sound(path)
+            self.bank_sounds[key] = BankSound(self, self.sounds[path], category, volume)
+        return self.bank_sounds[key]
+
+    def get_channel(self, category):
+        """Return a free channel of a category or, if all are busy, the oldest one.
+
+        The channels of each category are kept ordered from the least to the most recently
+        used one.
+        """
+        channels = self.channels[category]
+        channel = next(
+            (channel for channel in channels if not channel.get_busy()), channels[0]
+        )
+        channels.remove(channel)
+        channels.append(channel)
+        return channel
+
+    def play(self, bank_sound, loops=0):
+        """Play a sound of the bank in one of the channels of its category."""
+        if self.channels is None:
+            self.setup_channels()
+        channel = self.get_channel(bank_sound.category)
+        channel.play(bank_sound.sound, loops=loops)
+        channel.set_volume(bank_sound.volume)
+        return channel
+
+
+sound_bank = SoundBank()
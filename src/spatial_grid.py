@@ -0,0 +1,85 @@
+"""Module containing the spatial grid used to find the sprites close to a rectangle."""
+
+import pygame
+
+from src.settings import TILESIZE
+
+
+class SpatialGrid:
+    """Uniform grid of TILESIZE cells indexing sprites by one of their rectangles.
+
+    Sprites are indexed when they are added to the grid, so only sprites whose rectangle does
+    not move should be stored in it.
+    """
+
+    def __init__(self, rect_name="hitbox"):
+        """Initialize object with the name of the sprite rectangle to index."""
+        self.rect_name = rect_name
+        self.cells = {}
+        self.sprite_cells = {}
+
+    def __contains__(self, sprite):
+        """Return whether a sprite is indexed in the grid."""
+        return sprite in self.sprite_cells
+
+    @staticmethod
+    def get_cells(rect):
+        """Return the grid cells overlapped by a rectangle."""
+        col_ini = rect.left // TILESIZE
+        row_ini = rect.top // TILESIZE
+        col_end = max(rect.right - 1, rect.left) // TILESIZE
+        row_end = max(rect.bottom - 1, rect.top) // TILESIZE
+        return [
+            (col, row)
+            for row in range(row_ini, row_end + 1)
+            for col in range(col_ini, col_end + 1)
+        ]
+
+    def add(self, sprite):
+        """Add sprite to the cells overlapped by its rectangle."""
+        cells = self.get_cells(getattr(sprite, self.rect_name))
+        for cell in cells:
+            self.cells.setdefault(cell, {})[sprite] = None
+        self.sprite_cells[sprite] = cells
+
+    def remove(self, sprite):
+        """Remove sprite from the cells where it was indexed."""
+        for cell in self.sprite_cells.pop(sprite):
+            del self.cells[cell][sprite]
+            if not self.cells[cell]:
+                del self.cells[cell]
+
+    def get_sprites_in_rect(self, rect):
+        """Return the sprites indexed in the cells overlapped by a rectangle."""
+        sprites = {}
+        for cell in self.get_cells(rect):
+            if cell in self.cells:
+                sprites.update(self.cells[cell])
+        return list(sprites)
+
+
+class SpatialGroup(pygame.sprite.Group):
+    """Sprite group indexing the hitboxes of its sprites in a SpatialGrid.
+
+    Sprites are removed from the grid when they leave the group (e.g. when they are killed),
+    so only static sprites should be stored in this group.
+    """
+
+    def __init__(self, *sprites):
+        """Initialize object."""
+        self.grid = SpatialGrid("hitbox")
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        """Add sprite to the group and to the grid."""
+        super().add_internal(sprite, layer)
+        self.grid.add(sprite)
+
+    def remove_internal(self, sprite):
+        """Remove sprite from the group and from the grid."""
+        super().remove_internal(sprite)
+        self.grid.remove(sprite)
+
+    def get_sprites_in_rect(self, rect):
+        """Return the sprites of the group close to a rectangle."""
+        return self.grid.get_sprites_in_rect(rect)
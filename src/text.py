@@ -6,6 +6,21 @@ class Text:
 
     def __init__(self, text, start, end, modes):
         """Initialize selection class with a text and the two indices of the selection."""
+        self.modes = None
+        self._inputs = None
+        self.update(text, start, end, modes)
+
+    def update(self, text, start, end, modes):
+        """Set the text and the indices of the selection.
+
+        The object is long-lived: it is only recomputed when its inputs changed since the
+        last update or the text was edited since then, so an idle prompt costs nothing.
+        """
+        inputs = (text, start, end, tuple(modes.items()))
+        if modes is self.modes and inputs == self._inputs:
+            return
+        self._inputs = inputs
+
         # It is assumed that start and end are negative integers (position from the right)
         # Mode can be either "delete" or "substitute".
         self.text = text
@@ -133,6 +148,7 @@ class Text:
                 text = self.text[: self.position - 1] + self.text[self.position :]
                 idx = self.position
         self.has_selection = False
+        self._inputs = None
         return text, idx
 
     def substitute(self):
@@ -0,0 +1,55 @@
+"""Module containing the text cache shared by the whole game."""
+
+from collections import OrderedDict
+
+from src.settings import TEXT_CACHE_SIZE
+
+
+class TextCache:
+    """Text cache rendering each text once per font, antialiasing, color and background.
+
+    The images of the texts and their widths are kept in least recently used order, up to a
+    capacity, so the texts drawn every frame (e.g. the experience or the upgrade menu) are
+    rendered once while the texts that stopped being drawn are evicted. Widths are measured
+    without rendering.
+
+    Fonts already cache the images of their glyphs, so whole texts are cached instead of
+    composing them glyph by glyph, which is several times slower than rendering them.
+    """
+
+    def __init__(self, capacity=TEXT_CACHE_SIZE):
+        """Initialize object with the number of images and widths kept."""
+        self.capacity = capacity
+        self.reset()
+
+    def reset(self):
+        """Drop all images and widths, e.g. after the fonts have been created again."""
+        self.images = OrderedDict()
+        self.widths = OrderedDict()
+
+    def get(self, cache, key, loader):
+        """Return the value of a key of a cache, loading it with the loader if required."""
+        value = cache.get(key)
+        if value is None:
+            value = loader()
+            cache[key] = value
+            if len(cache) > self.capacity:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return value
+
+    def render(self, font, text, antialias, color, background=None):
+        """Return the image of a text, as rendered by font.render."""
+        return self.get(
+            self.images,
+            (font, text, antialias, color, background),
+            lambda: font.render(text, antialias, color, background),
+        )
+
+    def get_width(self, font, text):
+        """Return the width of a text, measured without rendering it."""
+        return self.get(self.widths, (font, text), lambda: font.size(text)[0])
+
+
+text_cache = TextCache()
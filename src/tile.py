@@ -17,7 +17,7 @@ class Tile(pygame.sprite.Sprite):
         surface=pygame.Surface((TILESIZE, TILESIZE)),
     ):
         """Initialize Tile object."""
-        super().__init__(groups)
+        super().__init__()
         self.sprite_type = sprite_type
         self.image = surface
         self.look_at_msg = LOOK_AT_MESSAGE[sprite_type]
@@ -31,6 +31,9 @@ class Tile(pygame.sprite.Sprite):
             self.rect = self.image.get_rect(topleft=pos)
         self.hitbox = self.rect.inflate(0, y_offset)
 
+        # Join groups once the hitbox is known so spatial groups can index the tile
+        self.add(groups)
+
     def look_at(self):
         """Look at a tile."""
         return self.look_at_msg
@@ -38,3 +41,37 @@ class Tile(pygame.sprite.Sprite):
     def break_it(self):
         """Break a tile."""
         return self.break_it_msg
+
+
+class TileChunk(pygame.sprite.Sprite):
+    """Static tiles of a map chunk sharing the same depth, pre-composited in a single image."""
+
+    def __init__(self, key, order):
+        """Initialize TileChunk object with its key and its order among the drawn sprites."""
+        super().__init__()
+        self.key = key
+        self.order = order
+        self.tiles = {}
+        self.image = None
+        self.rect = None
+
+    def add_tile(self, tile):
+        """Add tile to the chunk. The chunk has to be baked again."""
+        self.tiles[tile] = None
+
+    def remove_tile(self, tile):
+        """Remove tile from the chunk. The chunk has to be baked again."""
+        del self.tiles[tile]
+
+    def bake(self):
+        """Compose the images of all tiles in the chunk into a single image."""
+        tile_rects = [tile.rect for tile in self.tiles]
+        self.rect = tile_rects[0].unionall(tile_rects)
+        self.image = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        self.image.blits(
+            [
+                (tile.image, (tile.rect.x - self.rect.x, tile.rect.y - self.rect.y))
+                for tile in self.tiles
+            ],
+            doreturn=False,
+        )
@@ -0,0 +1,121 @@
+"""Module containing the loader of the tile layers of Tiled .tmx maps."""
+
+from array import array
+import base64
+from bisect import bisect_right
+import gzip
+import sys
+import xml.etree.ElementTree as ET
+import zlib
+
+from src.map_layout import EMPTY_TILE, MapLayout
+
+# Bits of a global tile id storing its flips and rotations
+GID_MASK = 0x0FFFFFFF
+
+
+def decode_data(data, encoding=None, compression=None):
+    """Return the flat list of global tile ids of a <data> or <chunk> element."""
+    if encoding is None:
+        return [int(tile.get("gid", 0)) for tile in data.iter("tile")]
+    if encoding == "csv":
+        return [int(gid) for gid in data.text.replace("\n", "").split(",") if gid]
+    if encoding != "base64":
+        raise ValueError(f"Unsupported tmx layer encoding '{encoding}'")
+
+    raw = base64.b64decode(data.text.strip())
+    if compression == "zlib":
+        raw = zlib.decompress(raw)
+    elif compression == "gzip":
+        raw = gzip.decompress(raw)
+    elif compression is not None:
+        raise ValueError(f"Unsupported tmx layer compression '{compression}'")
+    gids = array("I", raw)
+    if sys.byteorder == "big":
+        gids.byteswap()
+    return gids
+
+
+class TmxTilesets:
+    """First global ids of the tilesets of a map, converting global ids to local ones."""
+
+    def __init__(self):
+        """Initialize object."""
+        self.firstgids = []
+
+    def add(self, tileset):
+        """Add a <tileset> element."""
+        self.firstgids.append(int(tileset.get("firstgid")))
+        self.firstgids.sort()
+
+    def get_local_id(self, gid):
+        """Return the id of a tile in its tileset, as in the csv exports, or EMPTY_TILE."""
+        gid &= GID_MASK
+        if gid == 0:
+            return EMPTY_TILE
+        return gid - self.firstgids[bisect_right(self.firstgids, gid) - 1]
+
+
+def read_layer(layer, tilesets, region=None):
+    """Return the layout of a <layer> element, cropped to a (x, y, width, height) tile region.
+
+    Layers of infinite maps store their tiles in chunks. Only the chunks overlapping the
+    region are decoded.
+    """
+    data = layer.find("data")
+    encoding, compression = data.get("encoding"), data.get("compression")
+    chunks = data.findall("chunk")
+    if chunks:
+        bounds = [
+            [int(chunk.get(attr)) for attr in ("x", "y", "width", "height")]
+            for chunk in chunks
+        ]
+    else:
+        # Finite layers hold their tiles in a single chunk covering the whole layer
+        chunks = [data]
+        bounds = [[0, 0, int(layer.get("width")), int(layer.get("height"))]]
+
+    if region is None:
+        left = min(x for x, _, __, ___ in bounds)
+        top = min(y for _, y, __, ___ in bounds)
+        right = max(x + width for x, _, width, __ in bounds)
+        bottom = max(y + height for _, y, __, height in bounds)
+        region = (left, top, right - left, bottom - top)
+    left, top, cols, rows = region
+
+    tiles = array("h", [EMPTY_TILE]) * (rows * cols)
+    for chunk, (x, y, width, height) in zip(chunks, bounds):
+        # Intersection of the chunk and the region
+        x_min, x_max = max(x, left), min(x + width, left + cols)
+        y_min, y_max = max(y, top), min(y + height, top + rows)
+        if x_min >= x_max or y_min >= y_max:
+            continue
+        gids = decode_data(chunk, encoding, compression)
+        for row in range(y_min, y_max):
+            start = (row - y) * width + x_min - x
+            end = start + x_max - x_min
+            offset = (row - top) * cols - left
+            tiles[offset + x_min : offset + x_max] = array(
+                "h", map(tilesets.get_local_id, gids[start:end])
+            )
+    return MapLayout(rows, cols, tiles, (top, left))
+
+
+def load_tmx_layouts(tmx_path, layer_names, region=None):
+    """Load the tile layers of a .tmx file by name, optionally cropped to a tile region.
+
+    The file is streamed and only the layers in layer_names are decoded. The tile ids are
+    local to their tileset, as in the csv exports of Tiled.
+    """
+    tilesets = TmxTilesets()
+    layouts = {}
+    for _, element in ET.iterparse(tmx_path):
+        if element.tag == "tileset":
+            tilesets.add(element)
+        elif element.tag == "layer":
+            if element.get("name") in layer_names:
+                layouts[element.get("name")] = read_layer(element, tilesets, region)
+            element.clear()
+    missing = set(layer_names) - set(layouts)
+    assert not missing, f"Layers {sorted(missing)} not found in {tmx_path}"
+    return layouts
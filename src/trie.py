@@ -0,0 +1,66 @@
+"""Module containing the prefix tree matching the phrases of the command line."""
+
+
+class TrieNode:
+    """Node of a trie, reached by the words of a phrase prefix."""
+
+    def __init__(self):
+        """Initialize object."""
+        self.children = {}
+        self.phrase = None
+
+
+class Trie:
+    """Prefix tree of phrases, one word per level.
+
+    Matching a phrase from a position of a list of words follows the words down the tree,
+    so it takes time proportional to the length of the phrase and not to the number of
+    phrases. The longest phrase wins, e.g. 'help' over 'h', independently of their order.
+    """
+
+    def __init__(self, phrases=()):
+        """Initialize object with its phrases."""
+        self.root = TrieNode()
+        for phrase in phrases:
+            self.insert(phrase)
+
+    def insert(self, phrase):
+        """Add a phrase. Empty phrases are ignored."""
+        words = phrase.split()
+        if not words:
+            return
+        node = self.root
+        for word in words:
+            node = node.children.setdefault(word, TrieNode())
+        node.phrase = phrase
+
+    def walk(self, words, start=0):
+        """Return the node reached following the words from start, or None."""
+        node = self.root
+        for word in words[start:]:
+            node = node.children.get(word)
+            if node is None:
+                return None
+        return node
+
+    def match(self, words, start=0):
+        """Return the longest phrase at a position of the words and the position after it.
+
+        Return None and the start position if no phrase matches.
+        """
+        node = self.root
+        phrase, end = None, start
+        for i in range(start, len(words)):
+            node = node.children.get(words[i])
+            if node is None:
+                break
+            if node.phrase is not None:
+                phrase, end = node.phrase, i + 1
+        return phrase, end
+
+    def complete(self, words, partial):
+        """Return the words that may follow the given ones and start with a partial word."""
+        node = self.walk(words)
+        if node is None:
+            return []
+        return sorted(word for word in node.children if word.startswith(partial))
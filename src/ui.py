@@ -18,6 +18,8 @@ from src.settings import (
     magic_data,
     weapon_data,
 )
+from src.text_cache import text_cache
+from src.utils import import_image
 
 
 class UI:
@@ -37,13 +39,13 @@ class UI:
         self.weapon_graphics = []
         for weapon in weapon_data.values():
             path = weapon["graphic"]
-            weapon = pygame.image.load(path).convert_alpha()
+            weapon = import_image(path)
             self.weapon_graphics.append(weapon)
 
         # Convert magic dict
         self.magic_graphics = []
         for magic in magic_data.values():
-            magic = pygame.image.load(magic["graphic"]).convert_alpha()
+            magic = import_image(magic["graphic"])
             self.magic_graphics.append(magic)
 
     def show_bar(self, current, max_amount, bg_rect, color):
@@ -63,7 +65,7 @@ class UI:
 
     def show_exp(self, exp):
         """Show experience in bottom right corner."""
-        text_surf = self.font.render(str(int(exp)), False, TEXT_COLOR)
+        text_surf = text_cache.render(self.font, str(int(exp)), False, TEXT_COLOR)
         x = self.display_surface.get_size()[0] - 20
         y = self.display_surface.get_size()[1] - 20
         text_rect = text_surf.get_rect(bottomright=(x, y))
@@ -2,6 +2,8 @@
 
 import pygame
 
+from src.game_clock import game_clock
+from src.keyboard import keyboard
 from src.settings import (
     BAR_COLOR,
     BAR_COLOR_SELECTED,
@@ -13,6 +15,7 @@ from src.settings import (
     UI_FONT_SIZE,
     UPGRADE_BG_COLOR_SELECTED,
 )
+from src.text_cache import text_cache
 
 
 class Upgrade:
@@ -42,26 +45,26 @@ class Upgrade:
 
     def input(self):
         """Capture user input."""
-        keys = pygame.key.get_pressed()
+        keys = keyboard.get_pressed()
         if self.can_move:
             if keys[pygame.K_RIGHT] and self.selection_index < self.attribute_num - 1:
                 self.selection_index += 1
                 self.can_move = False
-                self.selection_time = pygame.time.get_ticks()
+                self.selection_time = game_clock.get_ticks()
             elif keys[pygame.K_LEFT] and self.selection_index >= 1:
                 self.selection_index -= 1
                 self.can_move = False
-                self.selection_time = pygame.time.get_ticks()
+                self.selection_time = game_clock.get_ticks()
 
             if keys[pygame.K_SPACE]:
                 self.can_move = False
-                self.selection_time = pygame.time.get_ticks()
+                self.selection_time = game_clock.get_ticks()
                 self.item_list[self.selection_index].trigger(self.player)
 
     def selection_cooldown(self):
         """Add cooldown on selection."""
         if not self.can_move:
-            current_time = pygame.time.get_ticks()
+            current_time = game_clock.get_ticks()
             if current_time - self.selection_time >= 300:
                 self.can_move = True
 
@@ -108,12 +111,12 @@ class Item:
         color = TEXT_COLOR_SELECTED if selected else TEXT_COLOR
 
         # Title
-        title_surf = self.font.render(name, False, color)
+        title_surf = text_cache.render(self.font, name, False, color)
         title_rect = title_surf.get_rect(
             midtop=self.rect.midtop + pygame.math.Vector2(0, 20)
         )
         # Cost
-        cost_surf = self.font.render(f"{int(cost)}", False, color)
+        cost_surf = text_cache.render(self.font, f"{int(cost)}", False, color)
         cost_rect = cost_surf.get_rect(
             midbottom=self.rect.midbottom - pygame.math.Vector2(0, 20)
         )
@@ -1,27 +1,25 @@
 """Functions that are used in the game."""
 
-from csv import reader
-from os import walk
-
-import pygame
+from src.assets import assets
+from src.map_layout import load_layout
+from src.tmx import load_tmx_layouts
 
 
 def import_csv_layout(path):
-    """Import layouts from csv files."""
-    terrain_map = []
-    with open(path) as level_map:
-        layout = reader(level_map, delimiter=",")
-        for row in layout:
-            terrain_map.append(list(row))
-        return terrain_map
+    """Import layouts from csv files, compiled to int16 arrays cached on disk."""
+    return load_layout(path)
 
 
 def import_folder(path):
-    """Import all images in a folder."""
-    surface_list = []
-    for _, __, img_files in walk(path):
-        for image in img_files:
-            full_path = path + "/" + image
-            image_surf = pygame.image.load(full_path).convert_alpha()
-            surface_list.append(image_surf)
-    return surface_list
+    """Import all images in a folder through the shared asset manager."""
+    return assets.load_folder(path)
+
+
+def import_image(path, alpha=True):
+    """Import an image through the shared asset manager."""
+    return assets.load_image(path, alpha)
+
+
+def import_tmx_layouts(path, layer_names, region=None):
+    """Import layouts from the layers of a Tiled tmx file."""
+    return load_tmx_layouts(path, layer_names, region)
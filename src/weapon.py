@@ -2,6 +2,8 @@
 
 import pygame
 
+from src.utils import import_image
+
 
 class Weapon(pygame.sprite.Sprite):
     """Weapon class that uses weapon images and weapon data."""
@@ -14,7 +16,7 @@ class Weapon(pygame.sprite.Sprite):
 
         # graphic
         full_path = f"src/images/weapons/{player.weapon}/{direction}.png"
-        self.image = pygame.image.load(full_path)
+        self.image = import_image(full_path)
 
         # scale image
         self.image = pygame.transform.scale(self.image, (18, 18))
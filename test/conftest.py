@@ -0,0 +1,65 @@
+"""Module containing the fixtures shared by the tests."""
+
+import os
+
+import pygame
+import pytest
+
+from src.game_clock import game_clock
+from src.keyboard import keyboard
+from src.sound_bank import sound_bank
+
+# Run pygame without a window nor a sound card
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+@pytest.fixture
+def pygame_session():
+    """Fixture initializing pygame, with the sounds of a previous session forgotten."""
+    pygame.init()
+    sound_bank.reset()
+    yield
+    pygame.quit()
+
+
+@pytest.fixture
+def pygame_display():
+    """Fixture initializing the display only, with a 1x1 window to convert images."""
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    yield
+    pygame.display.quit()
+
+
+@pytest.fixture
+def headless():
+    """Fixture collecting the games to quit and restoring the real clock and keyboard."""
+    games = []
+    yield games
+    for game in games:
+        game.quit()
+    game_clock.stop_simulation()
+    keyboard.stop_script()
+    keyboard.stop_recording()
+    pygame.quit()
+
+
+@pytest.fixture
+def key_actions():
+    """Fixture returning scripted key actions moving the player right, then down."""
+    return [(0, "down", "d"), (30, "up", "d"), (31, "down", "s"), (60, "up", "s")]
+
+
+@pytest.fixture
+def world_state():
+    """Fixture returning a function giving the positions of the player and enemies."""
+
+    def get_world_state(game):
+        return [game.level.player.rect.topleft] + sorted(
+            sprite.rect.topleft
+            for sprite in game.level.attackable_sprites
+            if sprite.sprite_type == "enemy"
+        )
+
+    return get_world_state
@@ -0,0 +1,55 @@
+"""Module containing tests for the AssetManager class."""
+
+import pygame
+import pytest
+
+from src.assets import AssetManager
+
+DOOR_PATH = "src/images/map/doors/217.png"
+GRASS_PATH = "src/images/map/grass"
+
+
+@pytest.fixture
+def asset_manager(pygame_display):
+    """Fixture returning an empty asset manager with an initialized display."""
+    return AssetManager()
+
+
+def test_assets_are_loaded_once(asset_manager):
+    """Test that images and folders are decoded once and shared."""
+    image = asset_manager.load_image(DOOR_PATH)
+    assert asset_manager.load_image(DOOR_PATH) is image
+    assert image.get_flags() & pygame.SRCALPHA
+    assert asset_manager.load_image(DOOR_PATH, alpha=False) is not image
+
+    folder = asset_manager.load_folder(GRASS_PATH)
+    assert len(folder) == 3
+    assert asset_manager.load_folder(GRASS_PATH) is folder
+
+
+def test_released_scopes_evict_unused_assets(asset_manager):
+    """Test that assets are evicted once no scope references them."""
+    permanent = asset_manager.load_image(DOOR_PATH)
+
+    asset_manager.set_scope("valley")
+    asset_manager.load_image(DOOR_PATH)
+    folder = asset_manager.load_folder(GRASS_PATH)
+
+    asset_manager.release_scope("valley")
+    asset_manager.set_scope("entry_cave")
+    asset_manager.evict_unused()
+    assert asset_manager.load_image(DOOR_PATH) is permanent
+    assert asset_manager.load_folder(GRASS_PATH) is not folder
+
+
+def test_shared_assets_survive_scope_switch(asset_manager):
+    """Test that an asset used by the previous and next scope is not evicted."""
+    asset_manager.set_scope("valley")
+    folder = asset_manager.load_folder(GRASS_PATH)
+
+    asset_manager.release_scope("valley")
+    asset_manager.set_scope("entry_cave")
+    assert asset_manager.load_folder(GRASS_PATH) is folder
+    asset_manager.evict_unused()
+    assert asset_manager.ref_counts[("folder", GRASS_PATH)] == 1
+    assert asset_manager.load_folder(GRASS_PATH) is folder
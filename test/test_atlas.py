@@ -0,0 +1,73 @@
+"""Module containing tests for the texture atlas."""
+
+import os
+
+import pygame
+import pytest
+
+from src.assets import AssetManager
+from src.atlas import TextureAtlas, pack_frames
+
+ROOTS = ["src/images/monsters/bamboo", "src/images/particles/claw"]
+BAMBOO_IDLE_PATH = "src/images/monsters/bamboo/idle"
+
+
+@pytest.fixture
+def atlas(tmp_path, pygame_display):
+    """Fixture returning a texture atlas generated in a temporary folder."""
+    return TextureAtlas(ROOTS, str(tmp_path), 512)
+
+
+def test_pack_frames():
+    """Test that packed frames fit in their sheets without overlapping."""
+    sizes = [(200, 150), (64, 64), (240, 240), (30, 48)] * 5
+    locations = pack_frames(sizes, 512)
+    assert max(sheet for sheet, _, __ in locations) > 0
+
+    rects = [
+        (sheet, pygame.Rect(x, y, *size))
+        for (sheet, x, y), size in zip(locations, sizes)
+    ]
+    for i, (sheet, rect) in enumerate(rects):
+        assert pygame.Rect(0, 0, 512, 512).contains(rect)
+        for other_sheet, other_rect in rects[i + 1 :]:
+            assert sheet != other_sheet or not rect.colliderect(other_rect)
+
+
+def test_atlas_frames_match_images(atlas):
+    """Test that the atlas hands out the frames of a folder in import_folder order."""
+    assert BAMBOO_IDLE_PATH in atlas
+    assert "src/images/monsters/squid/idle" not in atlas
+
+    frames = atlas.get_frames(BAMBOO_IDLE_PATH)
+    images = [
+        pygame.image.load(os.path.join(BAMBOO_IDLE_PATH, image)).convert_alpha()
+        for image in next(os.walk(BAMBOO_IDLE_PATH))[2]
+    ]
+    assert len(frames) == len(images) > 0
+    for frame, image in zip(frames, images):
+        assert frame.get_parent() in atlas.sheets
+        assert frame.get_size() == image.get_size()
+        assert all(
+            frame.get_at((x, y)) == image.get_at((x, y))
+            for x in range(image.get_width())
+            for y in range(image.get_height())
+        )
+
+
+def test_atlas_is_rebuilt_when_stale(atlas):
+    """Test that the atlas is built on first use and rebuilt when its sources change."""
+    assert atlas.is_stale()
+    atlas.get_frames(BAMBOO_IDLE_PATH)
+    assert not atlas.is_stale()
+
+    stale_atlas = TextureAtlas(ROOTS[:1], atlas.atlas_path, 512)
+    assert stale_atlas.is_stale()
+
+
+def test_asset_manager_uses_atlas(atlas):
+    """Test that the asset manager loads folders in the atlas from its sheets."""
+    asset_manager = AssetManager(atlas)
+    frames = asset_manager.load_folder(BAMBOO_IDLE_PATH)
+    assert all(frame.get_parent() in atlas.sheets for frame in frames)
+    assert asset_manager.load_folder("src/images/map/grass")[0].get_parent() is None
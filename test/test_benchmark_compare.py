@@ -0,0 +1,34 @@
+"""Module containing tests for the comparison of benchmark results."""
+
+import json
+
+from benchmarks.compare import compare, main
+
+
+def write_results(path, stats):
+    """Write benchmark medians (s) in the pytest-benchmark JSON format."""
+    benchmarks = [
+        {"fullname": name, "stats": {"median": median}}
+        for name, median in stats.items()
+    ]
+    path.write_text(json.dumps({"benchmarks": benchmarks}))
+
+
+def test_slowdowns_above_threshold_are_regressions():
+    """Test that only benchmarks slower than the threshold are flagged."""
+    rows = compare({"draw": 1.0, "fog": 2.0}, {"draw": 1.05, "fog": 3.0}, 10)
+    assert [(name, regressed) for name, *_, regressed in rows] == [
+        ("draw", False),
+        ("fog", True),
+    ]
+
+
+def test_exit_status(tmp_path):
+    """Test that the comparison fails only when a benchmark regressed."""
+    write_results(tmp_path / "before.json", {"draw": 1.0, "fog": 2.0})
+    write_results(tmp_path / "faster.json", {"draw": 0.5, "fog": 2.1, "new": 1.0})
+    write_results(tmp_path / "slower.json", {"draw": 1.5, "fog": 2.0})
+    before = str(tmp_path / "before.json")
+    assert main([before, str(tmp_path / "faster.json")]) == 0
+    assert main([before, str(tmp_path / "slower.json")]) == 1
+    assert main([before, str(tmp_path / "slower.json"), "--threshold", "60"]) == 0
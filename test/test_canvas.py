@@ -0,0 +1,79 @@
+"""Module containing tests for the dirty rects of the canvas."""
+
+import pygame
+import pytest
+
+from src.canvas import build_canvas, get_union
+from src.command_line import CL
+from src.screen import Screen
+
+
+class RoomText:
+    """Room text that is already displayed."""
+
+    def update_room_first_entry(self):
+        """Do nothing."""
+
+
+@pytest.fixture
+def layers(pygame_session):
+    """Fixture returning a 640x480 canvas with its screen and command line."""
+    canvas = pygame.display.set_mode((640, 480))
+    cmd_line = CL(canvas)
+    return canvas, Screen(canvas, cmd_line), cmd_line
+
+
+def test_contained_rects_are_merged():
+    """Test that the rects inside other rects are dropped from the union."""
+    rects = [
+        pygame.Rect(0, 0, 10, 10),
+        pygame.Rect(0, 0, 20, 20),
+        pygame.Rect(30, 0, 5, 5),
+    ]
+    assert get_union(rects) == [pygame.Rect(0, 0, 20, 20), pygame.Rect(30, 0, 5, 5)]
+
+
+def test_only_changed_layers_are_pushed(layers):
+    """Test that the command line is only pushed where it changed."""
+    canvas, screen, cmd_line = layers
+    screen_rect = pygame.Rect(0, 0, 640, 480 - cmd_line.height)
+    cl_rect = pygame.Rect(0, screen_rect.bottom, 640, cmd_line.height)
+
+    cmd_line.run(RoomText())
+    assert build_canvas(canvas, screen, cmd_line) == [screen_rect, cl_rect]
+    cmd_line.run(RoomText())
+    assert build_canvas(canvas, screen, cmd_line) == [screen_rect]
+
+    cmd_line.history.append("> help")
+    cmd_line.run(RoomText())
+    history_rect = pygame.Rect(
+        0, cl_rect.top, 640, cmd_line.height - cmd_line.line_height
+    )
+    input_rect = pygame.Rect(0, history_rect.bottom, 640, cmd_line.line_height)
+    assert build_canvas(canvas, screen, cmd_line) == [
+        screen_rect,
+        history_rect,
+        input_rect,
+    ]
+
+    # Overlays drawn on the canvas are restored from the layers below
+    overlay_rect = pygame.Rect(600, 470, 40, 10)
+    canvas.fill("red", overlay_rect)
+    build_canvas(canvas, screen, cmd_line, [overlay_rect])
+    assert canvas.get_at(overlay_rect.center) == cmd_line.surface.get_at((620, 155))
+
+
+def test_screen_is_hidden_by_full_screen_command_line(layers):
+    """Test that the screen is not pushed while the command line fills the canvas."""
+    canvas, screen, cmd_line = layers
+    cmd_line.maximize()
+    cmd_line.run(RoomText())
+    assert build_canvas(canvas, screen, cmd_line) == [canvas.get_rect()]
+    cmd_line.input.focus = False
+    cmd_line.run(RoomText())
+    cmd_line.run(RoomText())
+    assert build_canvas(canvas, screen, cmd_line) == [
+        pygame.Rect(0, 480 - cmd_line.line_height, 640, cmd_line.line_height)
+    ]
+    cmd_line.run(RoomText())
+    assert build_canvas(canvas, screen, cmd_line) == []
@@ -0,0 +1,41 @@
+"""Module containing tests for the History class."""
+
+import pytest
+
+from src.cl_history import History
+
+
+def test_oldest_lines_are_dropped():
+    """Test that the history keeps its last lines in order once full."""
+    history = History(capacity=3)
+    history.extend(["a", "b"])
+    assert list(history) == ["a", "b"]
+    history.extend(["c", "d", "e"])
+    assert list(history) == ["c", "d", "e"]
+    assert len(history) == 3
+    assert history[0] == "c"
+    assert history[-1] == "e"
+    assert history[1:] == ["d", "e"]
+    with pytest.raises(IndexError):
+        history[3]
+
+    history[-1] = "f"
+    assert history[-3:] == ["c", "d", "f"]
+
+
+def test_dropped_lines_are_logged(tmp_path):
+    """Test that the lines dropped from the buffer are appended to the log."""
+    log_path = tmp_path / "history.log"
+    history = History(capacity=2, log_path=log_path)
+    history.extend(["a", "b", "c", "d"])
+    history.close()
+    assert log_path.read_text() == "a\nb\n"
+
+
+def test_commands_are_indexed():
+    """Test that the commands are indexed as they are added and cleared with the lines."""
+    history = History(capacity=2, command_capacity=2)
+    history.extend(["> help", "  Usage:", "> look at wall", "> cl fc on"])
+    assert list(history.commands) == ["look at wall", "cl fc on"]
+    history.clear()
+    assert len(history) == 0 and not history.commands
@@ -0,0 +1,73 @@
+"""Module containing tests for the Input class."""
+
+import pygame
+import pytest
+
+from src.cl_text_input import ConfigError, Input
+
+
+def key_down(key):
+    """Return the KEYDOWN event of a key."""
+    return pygame.event.Event(pygame.KEYDOWN, key=key, mod=0)
+
+
+def text_input(text):
+    """Return a TEXTINPUT event."""
+    return pygame.event.Event(pygame.TEXTINPUT, text=text)
+
+
+@pytest.fixture
+def text_box():
+    """Fixture returning an input in focus, allowing up to 10 characters."""
+    pygame.font.init()
+    yield Input(focus=True, maxlength=10)
+    pygame.font.quit()
+
+
+def test_keys_are_decoded_with_shift(text_box):
+    """Test that the characters of the keys depend on the shift keys."""
+    for event in [
+        key_down(pygame.K_h),
+        key_down(pygame.K_1),
+        key_down(pygame.K_LSHIFT),
+        key_down(pygame.K_h),
+        key_down(pygame.K_1),
+        key_down(pygame.K_SLASH),
+        pygame.event.Event(pygame.KEYUP, key=pygame.K_LSHIFT, mod=0),
+        key_down(pygame.K_SPACE),
+        key_down(pygame.K_BACKSLASH),
+        key_down(pygame.K_F1),
+    ]:
+        text_box.update(event, None)
+    assert text_box.value == "h1H!? \\"
+    assert text_box.update(key_down(pygame.K_RETURN), None) == "h1H!? \\"
+
+
+def test_text_input_replaces_key_characters(text_box):
+    """Test that the text typed with the keyboard layout replaces the key character."""
+    for event in [
+        key_down(pygame.K_a),
+        text_input("a"),
+        key_down(pygame.K_1),
+        text_input("&"),
+        key_down(pygame.K_SPACE),
+        text_input(" "),
+        text_input("é€"),
+        text_input("\t"),
+    ]:
+        text_box.update(event, None)
+    assert text_box.value == "a& é€"
+
+
+def test_restricted_characters_and_length(text_box):
+    """Test that only the allowed characters are typed, up to the maximum length."""
+    text_box = Input(focus=True, maxlength=4, restricted="ab")
+    for event in [key_down(pygame.K_a), key_down(pygame.K_c), text_input("bcbbb")]:
+        text_box.update(event, None)
+    assert text_box.value == "abbb"
+
+
+def test_unexpected_options_are_rejected(text_box):
+    """Test that the options of the input are checked."""
+    with pytest.raises(ConfigError):
+        Input(colour="white")
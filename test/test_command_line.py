@@ -0,0 +1,101 @@
+"""Module containing tests for the CL class."""
+
+import pygame
+import pytest
+
+from src.command_line import CL
+from src.game_clock import game_clock
+from src.settings import FPS
+
+
+@pytest.fixture
+def cmd_line(pygame_session):
+    """Fixture returning a command line with a hundred lines of history."""
+    cmd_line = CL(pygame.display.set_mode((640, 480)))
+    cmd_line.history.extend(f"line {i}" for i in range(100))
+    return cmd_line
+
+
+@pytest.fixture
+def simulated_clock():
+    """Fixture running the game clock on simulated time."""
+    game_clock.start_simulation()
+    yield game_clock
+    game_clock.stop_simulation()
+
+
+def test_history_lines_are_rendered_once(cmd_line):
+    """Test that the history lines are rendered again only when they change."""
+    cmd_line.draw_history()
+    image = cmd_line.render_line("line 99")
+    assert len(cmd_line._rendered_lines) == cmd_line.n_rows_shown
+
+    cmd_line.history.append("line 100")
+    cmd_line.draw_history()
+    assert cmd_line.render_line("line 99") is image
+    assert "line 100" in cmd_line._rendered_lines
+
+
+def test_rendered_lines_far_from_view_are_evicted(cmd_line):
+    """Test that the lines scrolled far out of view are forgotten."""
+    cmd_line.draw_history()
+    cmd_line._scroll_id = -1
+    cmd_line.draw_history()
+    assert "line 99" in cmd_line._rendered_lines
+
+    cmd_line._scroll_id = -50
+    cmd_line.draw_history()
+    assert "line 99" not in cmd_line._rendered_lines
+    assert "line 49" in cmd_line._rendered_lines
+    assert len(cmd_line._rendered_lines) == cmd_line.n_rows_shown
+
+
+def test_idle_input_line_is_drawn_once(cmd_line, simulated_clock):
+    """Test that the focused input line is only drawn again when its layout changes."""
+    cmd_line.input.focus = True
+    cmd_line.input.value = "help"
+    cmd_line.draw_input_line()
+    assert cmd_line.pop_dirty_rects()
+
+    cmd_line.draw_input_line()
+    assert not cmd_line.pop_dirty_rects()
+
+    cmd_line.input.value = "help "
+    cmd_line.draw_input_line()
+    assert cmd_line.pop_dirty_rects() == [cmd_line.get_input_rect()]
+
+    # Blinking the cursor
+    simulated_clock.advance(FPS)
+    cmd_line.draw_input_line()
+    assert cmd_line.pop_dirty_rects() == [cmd_line.get_input_rect()]
+
+
+def test_input_line_is_cleared_once_out_of_focus(cmd_line):
+    """Test that the input line is cleared once after losing focus."""
+    cmd_line.input.focus = True
+    cmd_line.input.value = "help"
+    cmd_line.draw_input_line()
+    cmd_line.pop_dirty_rects()
+
+    cmd_line.input.focus = False
+    cmd_line.draw_input_line()
+    assert cmd_line.pop_dirty_rects() == [cmd_line.get_input_rect()]
+    cmd_line.draw_input_line()
+    assert not cmd_line.pop_dirty_rects()
+
+
+def test_text_input_replaces_key_character_in_mid_line(cmd_line):
+    """Test that the text input replaces the key character the cursor moved mid-line."""
+    cmd_line.input.focus = True
+    cmd_line.input.value = "abc"
+    cmd_line.draw_input_line()
+    cmd_line.cursor.position = -1
+    cmd_line.draw_input_line()
+
+    for key, text in [(pygame.K_z, "z"), (pygame.K_2, "é")]:
+        cmd_line.run_event(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0), None)
+        cmd_line.draw_input_line()
+        cmd_line.draw_input_line()
+        cmd_line.run_event(pygame.event.Event(pygame.TEXTINPUT, text=text), None)
+        cmd_line.draw_input_line()
+    assert cmd_line.input.value == "abzéc"
@@ -0,0 +1,42 @@
+"""Module containing tests for the parsing and completion of the commands."""
+
+from src.command_line import CL
+from src.commands import cl, get_completions, help
+
+
+def test_commands_are_dispatched_by_whole_words():
+    """Test that the longest command is matched and its arguments normalized."""
+    assert CL.get_command_from_user_input("help  cl") == ("help", "cl", "")
+    assert CL.get_command_from_user_input("h perf") == ("h", "perf", "")
+    assert CL.get_command_from_user_input("command line fc on") == (
+        "command line",
+        "fc on",
+        "",
+    )
+    assert CL.get_command_from_user_input("hello")[0] is None
+    assert CL.get_command_from_user_input("clx")[0] is None
+
+
+def test_arguments_follow_the_grammar():
+    """Test that arguments and their values are parsed in order."""
+    assert help.parse_arguments("cl") == (["cl"], "")
+    assert help.parse_arguments("look at") == (["look at"], "")
+    assert cl.parse_arguments("clear") == (["clear"], "")
+    assert cl.parse_arguments("full screen off") == (["full screen", "off"], "")
+    assert cl.parse_arguments("fc on clear") == (["fc", "on", "clear"], "")
+
+    args, message = cl.parse_arguments("fc")
+    assert message == "The argument 'fc' must be followed by 'on' or 'off'."
+    args, message = cl.parse_arguments("on fc")
+    assert "'on fc' is not a valid argument" in message
+
+
+def test_commands_and_arguments_are_completed():
+    """Test that the last word is completed with commands, arguments or values."""
+    assert get_completions("he") == ("he", ["help"])
+    assert get_completions("h") == ("h", ["h", "help"])
+    assert get_completions("look a") == ("a", ["at"])
+    assert get_completions("help c") == ("c", ["cl", "command"])
+    assert get_completions("cl full screen ") == ("", ["off", "on"])
+    assert get_completions("perf o") == ("o", ["off", "on"])
+    assert get_completions("dance ") == ("", [])
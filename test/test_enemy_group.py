@@ -0,0 +1,68 @@
+"""Module containing tests for the EnemyGroup class."""
+
+import pygame
+
+from src.enemy_group import EnemyGroup
+
+
+class FakeEnemy(pygame.sprite.Sprite):
+    """Sprite with the attributes read by the enemy group."""
+
+    def __init__(self, center, groups, can_attack=True):
+        """Initialize object."""
+        super().__init__()
+        self.rect = pygame.Rect(0, 0, 10, 10)
+        self.rect.center = center
+        self.attack_radius = 50
+        self.notice_radius = 200
+        self.can_attack = can_attack
+        self.status = None
+        self.direction = None
+        self.add(groups)
+
+    def enemy_update(self, status, direction):
+        """Store the status and direction given by the group."""
+        self.status = status
+        self.direction = direction
+
+
+def get_player(center):
+    """Return a sprite standing for the player."""
+    player = pygame.sprite.Sprite()
+    player.rect = pygame.Rect(0, 0, 10, 10)
+    player.rect.center = center
+    return player
+
+
+def test_statuses_and_directions():
+    """Test the status of each enemy and its direction to the player."""
+    group = EnemyGroup()
+    attacking = FakeEnemy((30, 40), [group])
+    tired = FakeEnemy((0, 40), [group], can_attack=False)
+    moving = FakeEnemy((0, 100), [group])
+    idle = FakeEnemy((300, 0), [group])
+    above = FakeEnemy((0, 0), [group])
+    group.enemy_update(get_player((0, 0)))
+
+    assert attacking.status == "attack"
+    assert tired.status == "move"
+    assert moving.status == "move"
+    assert idle.status == "idle"
+    assert above.status == "attack"
+    assert attacking.direction == list(pygame.math.Vector2(-30, -40).normalize())
+    assert moving.direction == [0, -1]
+    assert above.direction == [0, 0]
+
+
+def test_rows_follow_removed_enemies():
+    """Test that each enemy keeps reading its own row after other enemies are removed."""
+    group = EnemyGroup(capacity=2)
+    enemies = [FakeEnemy((x, 0), [group]) for x in (0, 100, 300, 30)]
+    enemies[1].kill()
+    enemies[2].kill()
+    FakeEnemy((500, 0), [group])
+    group.enemy_update(get_player((0, 0)))
+
+    assert group.enemies == [enemies[0], enemies[3], group.enemies[2]]
+    assert [enemy.status for enemy in group.enemies] == ["attack", "attack", "idle"]
+    assert enemies[1].status is None
@@ -1,8 +1,10 @@
 """Module containing the tests of the Fog object."""
 
+import pygame
 import pytest
 
 from src.fog import Fog
+from src.settings import HEIGHT, WIDTH
 
 polygons = [
     [(-200, 100), (50, 100), (50, 200), (-200, 200)],
@@ -121,3 +123,98 @@ def test_get_scaled_polygons():
                     < ref_polygon[i_vertex][i_coord]
                     < scaled_polygon[i_vertex][i_coord] + 1
                 )
+
+
+def test_fow_grid_size():
+    """Test that the FOW grid is stored per cell and not per map pixel."""
+    fog = Fog(pygame.Rect(0, 0, 6400, 6400))
+    n_cells = (6400 // fog.FOW_CELL_SIZE) ** 2
+    assert fog.fow_grid_size == (6400 // fog.FOW_CELL_SIZE, 6400 // fog.FOW_CELL_SIZE)
+    assert len(fog.fog_of_war_grid) == 4 * n_cells
+    assert fog.fog_of_war_grid[3::4] == bytes([255]) * n_cells
+
+
+def test_fow_window():
+    """Test that the FOW window only covers the cells on screen, clamped to the map."""
+    fog = Fog(pygame.Rect(0, 0, 6400, 6400))
+    cell = fog.FOW_CELL_SIZE
+
+    window = fog.get_fow_window(pygame.math.Vector2(10 * cell + 3, 5 * cell))
+    assert window.topleft == (10, 5)
+    assert window.right == -(-(10 * cell + 3 + WIDTH) // cell)
+    assert window.bottom == 5 + -(-HEIGHT // cell)
+
+    window = fog.get_fow_window(pygame.math.Vector2(-WIDTH // 2, 6400 - HEIGHT // 2))
+    assert window.topleft == (0, (6400 - HEIGHT // 2) // cell)
+    assert window.bottomright == (-(-(WIDTH // 2) // cell), 6400 // cell)
+
+
+def test_fow_explored_cells():
+    """Test that drawing the FOV marks the covered FOW cells as explored."""
+    fog = Fog(pygame.Rect(0, 0, 640, 640))
+    cell = fog.FOW_CELL_SIZE
+    fog.FOV_vertices = [(0, 0), (4 * cell, 0), (4 * cell, 4 * cell), (0, 4 * cell)]
+    fog.draw_FOW_surface(pygame.math.Vector2(cell, cell))
+
+    assert fog.fog_of_war.get_at((2, 2)).a == fog.FOW_OPACITY
+    assert fog.fog_of_war.get_at((8, 8)).a == 255
+    assert fog.fog_of_war_grid[3] == 255
+
+
+@pytest.mark.parametrize("angle_bucket", [1, 2])
+@pytest.mark.parametrize("player_angle", [90, 45, -135, 180, 17, 454])
+def test_fov_mask_matches_polygons(player_angle, angle_bucket):
+    """Test that the cached FOV mask matches the gradient drawn with scaled polygons."""
+    fog = Fog(pygame.Rect(0, 0, 640, 640))
+    fog.FOV_ANGLE_BUCKET = angle_bucket
+    player_pos = (WIDTH // 2, HEIGHT // 2)
+
+    # Gradient drawn polygon by polygon
+    reference = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+    reference.fill((0, 0, 0, fog.FOG_OPACITY))
+    polygons = fog.compute_polygons(fog.get_FOV_vertices(player_pos, player_angle))
+    fog.draw_polygons(polygons, fog.FOG_OPACITY, reference)
+
+    # Gradient blitted from the FOV mask
+    masked = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+    masked.fill((0, 0, 0, fog.FOG_OPACITY))
+    fog.blit_fov_mask(masked, player_pos, player_angle)
+
+    reference_alpha = pygame.image.tostring(reference, "RGBA")[3::4]
+    masked_alpha = pygame.image.tostring(masked, "RGBA")[3::4]
+    diffs = [abs(a - b) for a, b in zip(reference_alpha, masked_alpha)]
+    assert sum(diffs) / len(diffs) < 2
+    assert sum(diff > 32 for diff in diffs) / len(diffs) < 0.05
+
+
+def test_fov_mask_cache():
+    """Test that FOV masks are reused within an angle bucket and evicted in LRU order."""
+    fog = Fog(pygame.Rect(0, 0, 640, 640))
+    fog.FOV_ANGLE_BUCKET = 5
+    fog.FOV_MASK_CACHE_SIZE = 2
+
+    mask = fog.get_fov_mask(90)
+    assert fog.get_fov_mask(90 + 360) is mask
+    assert fog.get_fov_mask(94) is mask
+    assert fog.get_fov_mask(95) is not mask
+
+    fog.get_fov_mask(0)
+    fog.get_fov_mask(90)
+    fog.get_fov_mask(180)
+    assert list(fog.fov_masks) == [fog.get_fov_mask_key(90), fog.get_fov_mask_key(180)]
+
+
+def test_fov_masks_are_built_for_steady_angles():
+    """Test that FOV masks are only built for angles kept more than one frame."""
+    fog = Fog(pygame.Rect(0, 0, 640, 640))
+    surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+    player_pos = (WIDTH // 2, HEIGHT // 2)
+    for player_angle in range(0, 90, 10):
+        fog.remove_fov_fog(surface, player_pos, player_angle)
+    assert not fog.fov_masks
+
+    fog.remove_fov_fog(surface, player_pos, 80)
+    assert list(fog.fov_masks) == [fog.get_fov_mask_key(80)]
+    fog.remove_fov_fog(surface, player_pos, 0)
+    fog.remove_fov_fog(surface, player_pos, 80)
+    assert list(fog.fov_masks) == [fog.get_fov_mask_key(80)]
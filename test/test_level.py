@@ -0,0 +1,147 @@
+"""Module containing tests for the Level and YsortedCameraGroup classes."""
+
+import pygame
+import pytest
+
+from main import Game
+from src.events_definition import ENTRY_CAVE, VALLEY
+from src.level import YsortedCameraGroup
+from src.settings import CHUNK_SIZE, TILESIZE
+from src.tile import Tile, TileChunk
+
+
+class Sprite(pygame.sprite.Sprite):
+    """Dynamic sprite moving freely around the map."""
+
+    def __init__(self, pos, groups):
+        """Initialize object."""
+        super().__init__(groups)
+        self.image = pygame.Surface((TILESIZE, TILESIZE))
+        self.rect = self.image.get_rect(topleft=pos)
+
+
+@pytest.fixture
+def camera(pygame_display):
+    """Fixture returning a camera group drawing on a 640x320 surface."""
+    display_surface = pygame.Surface((640, 320))
+    return YsortedCameraGroup(None, display_surface, "src/images/map/entry_cave.png")
+
+
+def test_sprites_on_screen_are_culled_and_sorted(camera):
+    """Test that only the sprites on screen are returned, sorted by their centery."""
+    tiles = [
+        Tile((x, y), [camera], "wall_hole")
+        for x in range(0, 20 * TILESIZE, TILESIZE)
+        for y in range(0, 20 * TILESIZE, TILESIZE)
+    ]
+    sprite = Sprite((100, 100), [camera])
+    camera.update_depth()
+
+    screen_rect = pygame.Rect(0, 0, 640, 320)
+    sprites_on_screen = camera.get_sprites_on_screen(screen_rect)
+    expected = [
+        sprite for sprite in camera.sprites() if sprite.rect.colliderect(screen_rect)
+    ]
+    assert len(sprites_on_screen) < len(tiles)
+    assert set(sprites_on_screen) == set(expected)
+    assert sprites_on_screen == sorted(
+        sprites_on_screen, key=lambda sprite: sprite.rect.centery
+    )
+
+
+def test_moved_sprites_are_sorted_again(camera):
+    """Test that moving a dynamic sprite updates its position in the depth order."""
+    tile = Tile((0, TILESIZE), [camera], "wall_hole")
+    sprite = Sprite((0, 0), [camera])
+    camera.update_depth()
+    screen_rect = pygame.Rect(0, 0, 640, 320)
+    assert camera.get_sprites_on_screen(screen_rect) == [sprite, tile]
+
+    sprite.rect.y += 2 * TILESIZE
+    camera.update_depth()
+    assert camera.get_sprites_on_screen(screen_rect) == [tile, sprite]
+
+    sprite.rect.x += 640
+    camera.update_depth()
+    assert camera.get_sprites_on_screen(screen_rect) == [tile]
+
+
+def test_killed_sprites_are_removed(camera):
+    """Test that killed sprites leave the spatial grid and the depth order."""
+    tile = Tile((0, 0), [camera], "wall_hole")
+    sprite = Sprite((0, 0), [camera])
+    camera.update_depth()
+
+    tile.kill()
+    sprite.kill()
+    assert not camera.get_sprites_on_screen(pygame.Rect(0, 0, 640, 320))
+    assert not camera.ysorted_sprites
+    assert not camera.depth_keys
+
+
+def test_static_tiles_are_baked_in_chunks(camera):
+    """Test that decoration tiles are drawn in chunks sharing the same depth."""
+    tiles = [
+        Tile((x * TILESIZE, y * TILESIZE), [camera], "grass")
+        for x in range(2 * CHUNK_SIZE)
+        for y in range(2)
+    ]
+    sprite = Sprite((0, TILESIZE // 2), [camera])
+    camera.bake_dirty_chunks()
+    camera.update_depth()
+
+    screen_rect = pygame.Rect(0, 0, 2 * CHUNK_SIZE * TILESIZE, 2 * TILESIZE)
+    sprites_on_screen = camera.get_sprites_on_screen(screen_rect)
+    assert len(sprites_on_screen) == 5
+    assert all(isinstance(chunk, TileChunk) for chunk in sprites_on_screen[:2])
+    assert sprites_on_screen[2] is sprite
+    assert sum(len(chunk.tiles) for chunk in camera.tile_chunks.values()) == len(tiles)
+    assert camera.tile_chunks[(0, 0, TILESIZE // 2)].rect == pygame.Rect(
+        0, 0, CHUNK_SIZE * TILESIZE, TILESIZE
+    )
+
+
+def test_killed_tiles_rebake_their_chunk(camera):
+    """Test that killing a baked tile only bakes again its own chunk."""
+    tiles = [Tile((x * TILESIZE, 0), [camera], "grass") for x in range(2 * CHUNK_SIZE)]
+    camera.bake_dirty_chunks()
+    first_chunk = camera.tile_chunks[(0, 0, TILESIZE // 2)]
+    second_chunk = camera.tile_chunks[(1, 0, TILESIZE // 2)]
+    second_image = second_chunk.image
+
+    tiles[0].kill()
+    assert list(camera.dirty_chunks) == [first_chunk]
+    camera.bake_dirty_chunks()
+    assert first_chunk.rect.left == TILESIZE
+    assert second_chunk.image is second_image
+
+    for tile in tiles[1:CHUNK_SIZE]:
+        tile.kill()
+    camera.bake_dirty_chunks()
+    assert list(camera.tile_chunks.values()) == [second_chunk]
+    assert camera.ysorted_sprites == [second_chunk]
+
+
+def test_player_is_kept_between_maps(headless):
+    """Test that the player and its progress go to the valley and back to the cave."""
+    game = Game(headless=True, seed=0)
+    headless.append(game)
+    level = game.level
+    player = level.player
+
+    game.cmd_line.run_event(pygame.event.Event(VALLEY), level)
+    assert level.player is player and player in level.visible_sprites
+    assert player.obstacle_sprites is level.obstacle_sprites
+    player.exp += 777
+    player.health -= 40
+    player.weapon_index = 2
+    exp, health = player.exp, player.health
+
+    valley_sprites = level.visible_sprites
+    game.cmd_line.run_event(pygame.event.Event(ENTRY_CAVE), level)
+    assert level.player is player
+    assert player in level.visible_sprites and player not in valley_sprites
+    assert player.obstacle_sprites is level.obstacle_sprites
+    assert player.door_sprites is level.door_sprites
+    assert (player.exp, player.health, player.weapon_index) == (exp, health, 2)
+    assert player.rect.topleft == level.get_player_spawn()
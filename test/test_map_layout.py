@@ -0,0 +1,60 @@
+"""Module containing tests for the compiled map layouts."""
+
+from csv import reader
+import os
+
+from src.map_layout import MapLayout, get_cache_path, load_layout
+
+CSV_PATH = "src/images/map/map_Entities.csv"
+
+
+def read_csv(path):
+    """Return the rows of a csv file as lists of strings."""
+    with open(path) as csv_file:
+        return [row for row in reader(csv_file) if row]
+
+
+def test_layout_matches_csv():
+    """Test that a parsed layout holds the tile ids of the csv file."""
+    rows = read_csv(CSV_PATH)
+    layout = MapLayout.from_csv(CSV_PATH)
+    assert (layout.rows, layout.cols) == (len(rows), len(rows[0]))
+    assert all(
+        layout[i_row, i_col] == int(tile_id)
+        for i_row, row in enumerate(rows)
+        for i_col, tile_id in enumerate(row)
+    )
+    assert list(layout.get_tiles()) == [
+        (i_row, i_col, int(tile_id))
+        for i_row, row in enumerate(rows)
+        for i_col, tile_id in enumerate(row)
+        if tile_id != "-1"
+    ]
+
+
+def test_layout_cache_follows_csv_mtime(tmp_path):
+    """Test that the compiled layout is reused until the csv file is modified."""
+    csv_path = tmp_path / "layer.csv"
+    csv_path.write_text("-1,3\n7,-1\n")
+    cache_path = tmp_path / "cache"
+
+    layout = load_layout(str(csv_path), str(cache_path))
+    assert list(layout.get_tiles()) == [(0, 1, 3), (1, 0, 7)]
+    layout_path = get_cache_path(str(csv_path), str(cache_path))
+    assert os.path.exists(layout_path)
+
+    # The cached layout is read instead of the csv file while its mtime is unchanged
+    mtime = os.stat(csv_path).st_mtime_ns
+    csv_path.write_text("5,3\n7,-1\n")
+    os.utime(csv_path, ns=(mtime, mtime))
+    assert list(load_layout(str(csv_path), str(cache_path)).get_tiles()) == [
+        (0, 1, 3),
+        (1, 0, 7),
+    ]
+
+    os.utime(csv_path, ns=(mtime + 10**9, mtime + 10**9))
+    assert list(load_layout(str(csv_path), str(cache_path)).get_tiles()) == [
+        (0, 0, 5),
+        (0, 1, 3),
+        (1, 0, 7),
+    ]
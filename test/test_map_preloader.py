@@ -0,0 +1,41 @@
+"""Module containing tests for the MapPreloader class."""
+
+import pygame
+import pytest
+
+from src.assets import AssetManager
+from src.map_preloader import MapPreloader
+
+MAP_PATH = "src/images/map/entry_cave.png"
+
+
+@pytest.fixture
+def preloader(pygame_display):
+    """Fixture returning a map preloader with an initialized display."""
+    preloader = MapPreloader()
+    yield preloader
+    preloader.discard()
+
+
+def test_preloaded_floor_is_swapped_in(preloader):
+    """Test that the preloaded floor is handed to the asset manager once."""
+    preloader.preload(MAP_PATH)
+    thread = preloader.thread
+    preloader.preload(MAP_PATH)
+    assert preloader.thread is thread
+    assert preloader.take("src/images/map/map_ground.png") is None
+
+    floor_surf = preloader.take(MAP_PATH)
+    assert floor_surf.get_size() == pygame.image.load(MAP_PATH).get_size()
+    assert preloader.take(MAP_PATH) is None
+
+    asset_manager = AssetManager()
+    asset_manager.add_image(MAP_PATH, floor_surf, alpha=False)
+    assert asset_manager.has_image(MAP_PATH, alpha=False)
+    assert asset_manager.load_image(MAP_PATH, alpha=False) is floor_surf
+
+
+def test_failed_preload_falls_back(preloader):
+    """Test that a map that cannot be preloaded is left to the synchronous load."""
+    preloader.preload("src/images/map/missing.png")
+    assert preloader.take("src/images/map/missing.png") is None
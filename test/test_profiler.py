@@ -0,0 +1,83 @@
+"""Module containing tests for the FrameProfiler class."""
+
+import csv
+import json
+
+import pygame
+import pytest
+
+from src.profiler import NO_SECTION, FrameProfiler
+
+
+@pytest.fixture
+def profiler(pygame_session):
+    """Fixture returning an enabled frame profiler with pygame initialized."""
+    profiler = FrameProfiler()
+    profiler.enable()
+    return profiler
+
+
+def test_disabled_profiler_records_nothing():
+    """Test that sections are not timed while the profiler is disabled."""
+    profiler = FrameProfiler()
+    assert profiler.section("fog.draw") is NO_SECTION
+    with profiler.section("fog.draw"):
+        pass
+    profiler.end_frame()
+    assert not profiler.history and not profiler.trace
+
+
+def test_sections_are_timed_per_frame(profiler):
+    """Test that the sections run in a frame are added up and kept for each frame."""
+    for _ in range(3):
+        with profiler.section("fog.draw"):
+            pass
+        with profiler.section("fog.draw"):
+            pass
+        with profiler.section("cl.run"):
+            pass
+        profiler.end_frame()
+    assert set(profiler.history) == {"frame", "fog.draw", "cl.run"}
+    assert all(len(durations) == 3 for durations in profiler.history.values())
+    assert len(profiler.trace) == 3 * 4
+
+    profiler.history["cl.run"].clear()
+    profiler.history["cl.run"].extend(range(100))
+    assert profiler.get_percentiles("cl.run") == [50, 95, 99]
+
+
+def test_idle_sections_are_not_counted_in_frame(profiler):
+    """Test that the time spent waiting for the next frame is kept apart from the frame work."""
+    with profiler.section("clock.tick", idle=True):
+        pygame.time.wait(20)
+    profiler.end_frame()
+    assert profiler.history["clock.tick"][0] >= 20
+    assert profiler.history["frame"][0] < 20
+
+
+def test_overlay_and_dump(profiler, tmp_path):
+    """Test that the overlay is drawn and the timings dumped as CSV and Chrome trace."""
+    with profiler.section("camera.draw"):
+        pass
+    profiler.end_frame()
+
+    surface = pygame.Surface((640, 360))
+    profiler.draw(surface)
+    width, height = profiler.overlay.get_size()
+    assert any(
+        surface.get_at((x, y)) != (0, 0, 0, 255)
+        for x in range(640 - width, 640)
+        for y in range(height)
+    )
+    assert surface.get_at((0, height)) == (0, 0, 0, 255)
+
+    profiler.dump(tmp_path / "trace")
+    with open(tmp_path / "trace.csv") as csv_file:
+        rows = list(csv.reader(csv_file))
+    assert [row[1] for row in rows] == ["section", "camera.draw", "frame"]
+    with open(tmp_path / "trace.json") as json_file:
+        events = json.load(json_file)["traceEvents"]
+    assert [(event["name"], event["ph"]) for event in events] == [
+        ("camera.draw", "X"),
+        ("frame", "X"),
+    ]
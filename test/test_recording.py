@@ -0,0 +1,69 @@
+"""Module containing tests for the recording and replay of input logs."""
+
+import pygame
+
+from main import Game
+from src.game_clock import game_clock
+from src.keyboard import keyboard
+from src.recording import InputRecorder, InputReplay
+from src.simulation import InputScript
+
+
+def test_log_round_trip(tmp_path, headless):
+    """Test that the ticks, keys and events of each frame are read back from the log."""
+    log_path = tmp_path / "session.rec"
+    recorder = InputRecorder(log_path, 42)
+    recorder.start()
+    keyboard.start_script().keys = {pygame.K_w, pygame.K_LEFT, pygame.K_q}
+    pressed = keyboard.get_pressed()
+    assert pressed[pygame.K_w] and pressed[pygame.K_LEFT] and not pressed[pygame.K_s]
+    game_clock.set_ticks(17)
+    events = [
+        pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a, mod=1, unicode="A"),
+        pygame.event.Event(pygame.TEXTINPUT, text="é"),
+        pygame.event.Event(pygame.USEREVENT + 4),
+        pygame.event.Event(pygame.MOUSEMOTION, pos=(0, 0)),
+    ]
+    recorder.end_frame(events)
+    game_clock.set_ticks(33)
+    recorder.end_frame([])
+    recorder.close()
+
+    input_replay = InputReplay.from_file(log_path)
+    assert input_replay.seed == 42
+    assert len(input_replay) == 2
+    input_replay.start()
+    replayed_events = input_replay.get_events(0)
+    assert game_clock.get_ticks() == 17
+    assert (
+        keyboard.get_pressed()[pygame.K_LEFT] and not keyboard.get_pressed()[pygame.K_q]
+    )
+    assert [(event.type, event.dict) for event in replayed_events] == [
+        (event.type, event.dict) for event in events[:3]
+    ]
+    assert input_replay.get_events(1) == [] and game_clock.get_ticks() == 33
+
+
+def test_replay_reproduces_session(tmp_path, headless, key_actions, world_state):
+    """Test that replaying a recorded session reaches the same world state."""
+    log_path = tmp_path / "session.rec"
+    recorder = InputRecorder(log_path, 7)
+    recorder.start()
+    game = Game(headless=True, seed=7)
+    headless.append(game)
+    input_script = InputScript(key_actions)
+    input_script.start()
+    for frame in range(90):
+        recorder.start_frame()
+        events = input_script.get_events(frame) + pygame.event.get()
+        game.step(events)
+        recorder.end_frame(events)
+    recorder.close()
+    keyboard.stop_script()
+    recorded_state = world_state(game)
+
+    input_replay = InputReplay.from_file(log_path)
+    game = Game(headless=True, seed=input_replay.seed)
+    headless.append(game)
+    game.replay(input_replay)
+    assert world_state(game) == recorded_state
@@ -0,0 +1,64 @@
+"""Module containing tests for the RoomText class."""
+
+import pygame
+import pytest
+
+from src.command_line import CL
+from src.game_clock import game_clock
+from src.room_text import ENTRY_CAVE_TEXT, RoomText
+from src.settings import FPS, ROOM_TEXT_LINE_PAUSE, ROOM_TEXT_SPEED
+
+
+@pytest.fixture
+def room_text(pygame_session):
+    """Fixture returning the room text of a command line, on simulated time."""
+    game_clock.start_simulation()
+    yield RoomText(CL(pygame.display.set_mode((640, 480))))
+    game_clock.stop_simulation()
+
+
+def type_text(room_text, duration, frame_time):
+    """Run the room text at a frame rate from now to a duration (in milliseconds) later."""
+    start = game_clock.get_ticks()
+    for frame in range(round(duration / frame_time) + 1):
+        game_clock.set_ticks(start + frame * frame_time)
+        room_text.update_room_first_entry()
+
+
+def test_text_speed_does_not_depend_on_frame_rate(room_text):
+    """Test that the same letters are typed in the same time at different frame rates."""
+    type_text(room_text, 500, 100)
+    slow_history = list(room_text.cmd_line.history)
+    assert slow_history == [ENTRY_CAVE_TEXT[: 1 + ROOM_TEXT_SPEED // 2]]
+
+    room_text.cmd_line.history.clear()
+    room_text.room_first_entry["entry_cave"] = True
+    room_text.typing_time = None
+    room_text.last_tick = None
+    type_text(room_text, 500, 10)
+    assert list(room_text.cmd_line.history) == slow_history
+
+
+def test_paused_time_is_not_typed(room_text):
+    """Test that the time spent paused, without the text being updated, is not typed."""
+    type_text(room_text, 200, 10)
+    room_text.pause_animated_text()
+    game_clock.set_ticks(game_clock.get_ticks() + 5000)
+    type_text(room_text, 300, 10)
+    assert list(room_text.cmd_line.history) == [
+        ENTRY_CAVE_TEXT[: 1 + ROOM_TEXT_SPEED // 2]
+    ]
+
+
+def test_text_is_typed_whole(room_text):
+    """Test that the whole text is typed, line by line, before the player is active."""
+    lines = room_text.cmd_line.split_long_user_input(ENTRY_CAVE_TEXT)
+    letters = sum(len(line) + ROOM_TEXT_LINE_PAUSE for line in lines)
+    frame_time = 1000 / FPS
+    type_text(room_text, (letters - 2) * frame_time, frame_time)
+    assert not room_text.cmd_line.active_player
+
+    type_text(room_text, frame_time, frame_time)
+    assert list(room_text.cmd_line.history) == lines
+    assert room_text.cmd_line.active_player
+    assert not room_text.room_first_entry["entry_cave"]
@@ -0,0 +1,57 @@
+"""Module containing tests for the SceneCache class."""
+
+from types import SimpleNamespace
+
+import pygame
+
+from src.scene_cache import Scene, SceneCache
+
+
+class FakeScene:
+    """Scene of a given size."""
+
+    def __init__(self, size):
+        """Initialize object."""
+        self.size = size
+
+    def get_size(self):
+        """Return the size of the scene."""
+        return self.size
+
+
+def test_scenes_are_restored_once():
+    """Test that a cached scene is handed back and leaves the cache."""
+    scene_cache = SceneCache(100)
+    scene = FakeScene(10)
+    assert scene_cache.put("cave", scene) == []
+    assert scene_cache.pop("valley") is None
+    assert scene_cache.pop("cave") is scene
+    assert scene_cache.pop("cave") is None
+
+
+def test_least_recently_stored_scenes_are_evicted():
+    """Test that the cache evicts the oldest scenes to stay within its budget."""
+    scene_cache = SceneCache(100)
+    assert scene_cache.put("cave", FakeScene(40)) == []
+    assert scene_cache.put("valley", FakeScene(40)) == []
+    assert scene_cache.put("cave", FakeScene(40)) == []
+    assert scene_cache.put("forest", FakeScene(40)) == ["valley"]
+    assert list(scene_cache.scenes) == ["cave", "forest"]
+
+    # The last scene is kept even when it does not fit in the budget
+    assert scene_cache.put("ocean", FakeScene(200)) == ["cave", "forest"]
+    assert list(scene_cache.scenes) == ["ocean"]
+
+
+def test_scene_size_ignores_unbaked_chunks():
+    """Test that the size of a scene left before being drawn only counts baked images."""
+    camera = SimpleNamespace(
+        floor_surf=pygame.Surface((4, 4), depth=32),
+        tile_chunks={
+            0: SimpleNamespace(image=pygame.Surface((2, 2), depth=32)),
+            1: SimpleNamespace(image=None),
+        },
+    )
+    level = SimpleNamespace(**{name: None for name in Scene.ATTRIBUTES})
+    level.visible_sprites = camera
+    assert Scene(level).get_size() == 4 * (16 + 4)
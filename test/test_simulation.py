@@ -0,0 +1,43 @@
+"""Module containing tests for the headless simulation mode."""
+
+import pygame
+
+from main import Game
+from src.game_clock import game_clock
+from src.keyboard import keyboard
+from src.simulation import InputScript
+
+
+def test_input_script(headless, key_actions):
+    """Test that scripted key actions press keys and emit key events."""
+    pygame.init()
+    input_script = InputScript(key_actions)
+    input_script.start()
+    events = input_script.get_events(0)
+    assert [(event.type, event.key) for event in events] == [
+        (pygame.KEYDOWN, pygame.K_d)
+    ]
+    assert keyboard.get_pressed()[pygame.K_d]
+    assert input_script.get_events(1) == []
+    input_script.get_events(30)
+    assert not keyboard.get_pressed()[pygame.K_d]
+
+
+def test_simulated_clock(headless):
+    """Test that simulated time advances by a fixed timestep per frame."""
+    game_clock.start_simulation()
+    game_clock.advance(60)
+    assert game_clock.get_ticks() == 1000
+
+
+def test_simulations_are_deterministic(headless, key_actions, world_state):
+    """Test that two simulations with the same seed and script reach the same state."""
+    states = []
+    for _ in range(2):
+        game = Game(headless=True, seed=3)
+        headless.append(game)
+        game.simulate(90, InputScript(key_actions))
+        assert game_clock.get_ticks() == 1500
+        states.append(world_state(game))
+    assert states[0] == states[1]
+    assert states[0][0] != game.level.player_spawn
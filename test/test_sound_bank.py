@@ -0,0 +1,46 @@
+"""Module containing tests for the SoundBank class."""
+
+import pygame
+import pytest
+
+from src.sound_bank import SoundBank
+
+HIT_PATH = "src/audio/hit.wav"
+DEATH_PATH = "src/audio/death.wav"
+
+
+@pytest.fixture
+def sound_bank():
+    """Fixture returning a sound bank with an initialized mixer."""
+    pygame.mixer.init()
+    yield SoundBank({"music": 1, "enemy": 3})
+    pygame.mixer.quit()
+
+
+def test_sounds_are_loaded_once(sound_bank):
+    """Test that each sound file is loaded once and shared."""
+    hit_sound = sound_bank.get(HIT_PATH, "enemy", 0.6)
+    assert sound_bank.get(HIT_PATH, "enemy", 0.6) is hit_sound
+    assert sound_bank.get(HIT_PATH, "enemy", 0.2).sound is hit_sound.sound
+    assert len(sound_bank.sounds) == 1
+
+    with pytest.raises(AssertionError):
+        sound_bank.get(HIT_PATH, "unknown")
+
+
+def test_voices_are_limited_per_category(sound_bank):
+    """Test that a category never uses more channels than its number of voices."""
+    hit_sound = sound_bank.get(HIT_PATH, "enemy", 0.6)
+    death_sound = sound_bank.get(DEATH_PATH, "enemy", 0.2)
+    music = sound_bank.get(DEATH_PATH, "music", 0.1)
+
+    music_channel = music.play(loops=-1)
+    channels = [hit_sound.play(loops=-1) for _ in range(3)]
+    assert music_channel not in channels
+    assert len(set(channels)) == 3
+
+    # All enemy voices are busy, so the oldest one is reused
+    assert death_sound.play() is channels[0]
+    assert hit_sound.play() is channels[1]
+    assert music_channel.get_sound() is music.sound
+    assert channels[0].get_volume() == pytest.approx(0.2, abs=0.01)
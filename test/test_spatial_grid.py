@@ -0,0 +1,72 @@
+"""Module containing tests for the SpatialGrid and SpatialGroup classes."""
+
+import pygame
+
+from src.entity import Entity
+from src.settings import TILESIZE
+from src.spatial_grid import SpatialGrid, SpatialGroup
+from src.tile import Tile
+
+
+def get_tiles(positions, groups, sprite_type="wall"):
+    """Return tiles placed on a list of (column, row) positions."""
+    return [
+        Tile((col * TILESIZE, row * TILESIZE), groups, sprite_type)
+        for col, row in positions
+    ]
+
+
+def test_get_cells():
+    """Test the grid cells overlapped by a rectangle."""
+    rect = pygame.Rect(TILESIZE - 1, 0, TILESIZE, TILESIZE)
+    assert SpatialGrid.get_cells(rect) == [(0, 0), (1, 0)]
+
+    rect = pygame.Rect(TILESIZE, TILESIZE, TILESIZE, TILESIZE)
+    assert SpatialGrid.get_cells(rect) == [(1, 1)]
+
+    rect = pygame.Rect(-1, -1, 0, 0)
+    assert SpatialGrid.get_cells(rect) == [(-1, -1)]
+
+
+def test_get_sprites_in_rect():
+    """Test that only the sprites close to a rectangle are returned."""
+    group = SpatialGroup()
+    near, far = get_tiles([(1, 1), (10, 10)], [group])
+
+    # Wall hitboxes are taller than a tile so they overlap the cells above and below
+    assert group.get_sprites_in_rect(pygame.Rect(TILESIZE, 0, 4, 4)) == [near]
+    assert group.get_sprites_in_rect(pygame.Rect(0, 0, 2 * TILESIZE, 4)) == [near]
+    assert group.get_sprites_in_rect(
+        pygame.Rect(10 * TILESIZE, 10 * TILESIZE, 4, 4)
+    ) == [far]
+    assert (
+        group.get_sprites_in_rect(pygame.Rect(5 * TILESIZE, 5 * TILESIZE, 4, 4)) == []
+    )
+
+
+def test_killed_sprites_are_removed():
+    """Test that killing a sprite removes it from the index."""
+    group = SpatialGroup()
+    grass = get_tiles([(2, 2)], [group], "grass")[0]
+    assert group.get_sprites_in_rect(grass.hitbox) == [grass]
+
+    grass.kill()
+    assert group.get_sprites_in_rect(grass.hitbox) == []
+    assert not group.grid.cells
+    assert not group.grid.sprite_cells
+
+
+def test_collision_with_indexed_obstacles():
+    """Test that an entity is stopped by the indexed obstacles."""
+    obstacle_sprites = SpatialGroup()
+    wall = get_tiles([(3, 0)], [obstacle_sprites], "grass")[0]
+
+    entity = Entity([])
+    entity.rect = pygame.Rect(0, 0, TILESIZE, TILESIZE)
+    entity.hitbox = entity.rect.copy()
+    entity.obstacle_sprites = obstacle_sprites
+
+    entity.move_direction = pygame.math.Vector2(1, 0)
+    for _ in range(50):
+        entity.move(5)
+    assert entity.hitbox.right == wall.hitbox.left
@@ -136,3 +136,26 @@ def test_substitute_selection(param_subst):
 
     assert text == param_subst[1][1]
     assert idx == param_subst[1][2]
+
+
+def test_update_keeps_text_until_it_changes():
+    """Test that a long-lived text is only recomputed when its inputs change or it is edited."""
+    modes = dict.fromkeys(
+        TEXT_MODES_LIST + ["control", "select_substitute_caps"], False
+    )
+    modes["select_ongoing"] = True
+    selection = Text(DELETE_STRING, -4, -2, modes)
+    selection.update(DELETE_STRING, -4, -2, modes)
+    assert selection.get_selected_text() == "_J"
+
+    text, idx = selection.delete()
+    assert (text, idx) == ("Janeoe", -2)
+    assert not selection.has_selection
+
+    # The same inputs select the text again after the edit
+    selection.update(DELETE_STRING, -4, -2, modes)
+    assert selection.has_selection
+    assert selection.get_selected_text() == "_J"
+
+    selection.update(text, -3, 0, modes)
+    assert selection.get_selected_text() == "eoe"
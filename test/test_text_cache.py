@@ -0,0 +1,48 @@
+"""Module containing tests for the TextCache class."""
+
+import pygame
+import pytest
+
+from src.settings import TEXT_COLOR, UI_FONT
+from src.text_cache import TextCache
+
+
+@pytest.fixture
+def font():
+    """Fixture returning the UI font."""
+    pygame.font.init()
+    yield pygame.font.Font(UI_FONT, 18)
+    pygame.font.quit()
+
+
+def test_texts_are_rendered_once(font):
+    """Test that a text is rendered once per font, antialiasing and color."""
+    text_cache = TextCache()
+    image = text_cache.render(font, "1234", False, TEXT_COLOR)
+    assert text_cache.render(font, "1234", False, TEXT_COLOR) is image
+    assert text_cache.render(font, "1234", True, TEXT_COLOR) is not image
+    assert text_cache.render(font, "1234", False, "red") is not image
+    assert image.get_size() == font.size("1234")
+
+
+def test_least_recently_used_texts_are_evicted(font):
+    """Test that the texts not drawn recently are evicted once the cache is full."""
+    text_cache = TextCache(capacity=2)
+    image = text_cache.render(font, "a", False, TEXT_COLOR)
+    text_cache.render(font, "b", False, TEXT_COLOR)
+    text_cache.render(font, "a", False, TEXT_COLOR)
+    text_cache.render(font, "c", False, TEXT_COLOR)
+    assert text_cache.render(font, "a", False, TEXT_COLOR) is image
+    assert [key[1] for key in text_cache.images] == ["c", "a"]
+
+
+def test_widths_are_measured(font):
+    """Test that widths are those of the rendered texts."""
+    text_cache = TextCache()
+    for text in ["", "a", "look at wall", "//"]:
+        assert (
+            text_cache.get_width(font, text)
+            == font.render(text, False, "red").get_width()
+        )
+    assert len(text_cache.widths) == 4
+    assert not text_cache.images
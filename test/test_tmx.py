@@ -0,0 +1,89 @@
+"""Module containing tests for the tmx loader."""
+
+from array import array
+import base64
+import zlib
+
+import pytest
+
+from src.map_layout import MapLayout
+from src.tmx import load_tmx_layouts
+
+TMX_PATH = "src/images/map/map.tmx"
+
+# Infinite map with two 2x2 chunks, one of them with a horizontally flipped tile
+INFINITE_TMX = """<?xml version="1.0" encoding="UTF-8"?>
+<map version="1.2" orientation="orthogonal" infinite="1" tilewidth="64" tileheight="64">
+ <tileset firstgid="1" name="floor" tilecount="10"/>
+ <tileset firstgid="11" name="objects" tilecount="10"/>
+ <layer name="Ground" width="4" height="2">
+  <data encoding="base64" compression="{compression}">
+   <chunk x="-2" y="0" width="2" height="2">{left}</chunk>
+   <chunk x="0" y="0" width="2" height="2">{right}</chunk>
+  </data>
+ </layer>
+ <layer name="Unused" width="4" height="2">
+  <data encoding="csv"><chunk x="0" y="0" width="2" height="2">1,2,
+3,4</chunk></data>
+ </layer>
+</map>
+"""
+
+
+def encode_chunk(gids, compression):
+    """Return the base64 data of a chunk of global tile ids."""
+    raw = array("I", gids).tobytes()
+    if compression == "zlib":
+        raw = zlib.compress(raw)
+    return base64.b64encode(raw).decode()
+
+
+@pytest.mark.parametrize(
+    "layer_name,csv_name", [("Objects", "map_Trees"), ("Grass", "map_Grass")]
+)
+def test_tmx_layer_matches_csv_export(layer_name, csv_name):
+    """Test that a tmx layer holds the same local tile ids as its csv export."""
+    layout = load_tmx_layouts(TMX_PATH, [layer_name])[layer_name]
+    csv_layout = MapLayout.from_csv(f"src/images/map/{csv_name}.csv")
+    assert (layout.rows, layout.cols) == (csv_layout.rows, csv_layout.cols)
+    assert layout.data == csv_layout.data
+
+
+def test_tmx_region():
+    """Test that a layer can be loaded region by region."""
+    layout = load_tmx_layouts(TMX_PATH, ["Objects"])["Objects"]
+    region = load_tmx_layouts(TMX_PATH, ["Objects"], (30, 20, 10, 15))["Objects"]
+    assert (region.rows, region.cols, region.origin) == (15, 10, (20, 30))
+    assert all(
+        region[row, col] == layout[row, col]
+        for row in range(20, 35)
+        for col in range(30, 40)
+    )
+    assert set(region.get_tiles()) == {
+        tile for tile in layout.get_tiles() if 20 <= tile[0] < 35 and 30 <= tile[1] < 40
+    }
+
+
+@pytest.mark.parametrize("compression", ["zlib", ""])
+def test_infinite_tmx_chunks(tmp_path, compression):
+    """Test that the chunks of infinite maps are decoded and stitched together."""
+    tmx_path = tmp_path / "infinite.tmx"
+    tmx_path.write_text(
+        INFINITE_TMX.format(
+            compression=compression,
+            left=encode_chunk([0, 1, 2, 0], compression),
+            right=encode_chunk([11, 0, 0x80000000 | 12, 3], compression),
+        ).replace(' compression=""', "")
+    )
+
+    layouts = load_tmx_layouts(str(tmx_path), ["Ground"])
+    assert list(layouts) == ["Ground"]
+    ground = layouts["Ground"]
+    assert (ground.rows, ground.cols, ground.origin) == (2, 4, (0, -2))
+    assert list(ground.data) == [-1, 0, 0, -1, 1, -1, 1, 2]
+
+    right = load_tmx_layouts(str(tmx_path), ["Ground"], (0, 0, 2, 2))["Ground"]
+    assert list(right.get_tiles()) == [(0, 0, 0), (1, 0, 1), (1, 1, 2)]
+
+    with pytest.raises(AssertionError):
+        load_tmx_layouts(str(tmx_path), ["Ground", "Missing"])
@@ -0,0 +1,24 @@
+"""Module containing tests for the Trie class."""
+
+from src.trie import Trie
+
+
+def test_longest_phrase_is_matched():
+    """Test that the longest phrase at a position wins, whatever the insertion order."""
+    trie = Trie(["h", "help", "look at", "look"])
+    assert trie.match(["help", "cl"]) == ("help", 1)
+    assert trie.match(["h", "cl"]) == ("h", 1)
+    assert trie.match(["look", "at", "wall"]) == ("look at", 2)
+    assert trie.match(["look", "around"]) == ("look", 1)
+    assert trie.match(["hello"]) == (None, 0)
+    assert trie.match(["cl", "look", "at"], 1) == ("look at", 3)
+
+
+def test_words_are_completed():
+    """Test that the words following a prefix are completed from a partial word."""
+    trie = Trie(["help", "h", "look at", "look around", ""])
+    assert trie.complete([], "h") == ["h", "help"]
+    assert trie.complete(["look"], "a") == ["around", "at"]
+    assert trie.complete(["look"], "at") == ["at"]
+    assert trie.complete(["help"], "") == []
+    assert trie.complete(["hello"], "") == []